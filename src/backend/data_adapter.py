@@ -44,7 +44,7 @@ import torch
 from .statistics import compute_weight_statistics
 
 
-@dataclass
+@dataclass(slots=True)
 class TrainingMetrics:
     """Training metrics data structure."""
 
@@ -65,7 +65,7 @@ class TrainingMetrics:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkNode:
     """Network node data structure."""
 
@@ -81,7 +81,7 @@ class NetworkNode:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkConnection:
     """Network connection data structure."""
 
@@ -95,7 +95,7 @@ class NetworkConnection:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkTopology:
     """Complete network topology data structure."""
 
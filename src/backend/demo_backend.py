@@ -133,30 +133,40 @@ class DemoBackend:
 
         nodes = []
         connections = []
+        hidden_units = list(network.hidden_units)
 
         # Input nodes
         for i in range(network.input_size):
             nodes.append({"id": f"input_{i}", "type": "input", "layer": 0})
 
-        # Hidden nodes
-        for i, unit in enumerate(network.hidden_units):
+        # Hidden nodes. Only the input-side weights of each unit are shown, so their leading slices are
+        # zero-padded into one (units, inputs) tensor and converted to Python lists in a single call
+        # rather than reading every element through Tensor.item().
+        if hidden_units:
+            input_weights = [unit["weights"].detach()[: network.input_size] for unit in hidden_units]
+            hidden_weights = torch.nn.utils.rnn.pad_sequence(input_weights, batch_first=True).cpu().tolist()
+        else:
+            hidden_weights = []
+        for i, unit_weights in enumerate(hidden_weights):
             nodes.append({"id": f"hidden_{i}", "type": "hidden", "layer": 1})
             # Connections from inputs to hidden
             for j in range(network.input_size):
-                weight = unit["weights"][j].item() if j < len(unit["weights"]) else 0.0
+                weight = unit_weights[j] if j < len(unit_weights) else 0.0
                 connections.append({"from": f"input_{j}", "to": f"hidden_{i}", "weight": weight})
 
         # Output nodes
+        output_weights = network.output_weights.detach().cpu().tolist()
         for i in range(network.output_size):
             nodes.append({"id": f"output_{i}", "type": "output", "layer": 2})
+            row = output_weights[i]
             # Connections from inputs to output
             for j in range(network.input_size):
-                weight = network.output_weights[i, j].item() if j < network.output_weights.shape[1] else 0.0
+                weight = row[j] if j < len(row) else 0.0
                 connections.append({"from": f"input_{j}", "to": f"output_{i}", "weight": weight})
             # Connections from hidden to output
-            for h_idx in range(len(network.hidden_units)):
+            for h_idx in range(len(hidden_units)):
                 col = network.input_size + h_idx
-                weight = network.output_weights[i, col].item() if col < network.output_weights.shape[1] else 0.0
+                weight = row[col] if col < len(row) else 0.0
                 connections.append({"from": f"hidden_{h_idx}", "to": f"output_{i}", "weight": weight})
 
         return {
@@ -164,7 +174,7 @@ class DemoBackend:
             "connections": connections,
             "input_size": network.input_size,
             "output_size": network.output_size,
-            "hidden_units": len(network.hidden_units),
+            "hidden_units": len(hidden_units),
         }
 
     def get_network_stats(self) -> Dict[str, Any]:
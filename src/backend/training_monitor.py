@@ -37,11 +37,12 @@
 #####################################################################################################################################################################################################
 import json
 import logging
-import queue
 import threading
 import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
 
 from .data_adapter import DataAdapter, NetworkTopology, TrainingMetrics
 
@@ -251,6 +252,10 @@ class TrainingState:
         "pool_metrics",
     }
 
+    # Scalar fields stored as HDF5 attributes in snapshots (pool_metrics is a nested dict; timestamp is
+    # left out so a restore records when it happened rather than rewinding to the snapshot's time)
+    _SNAPSHOT_ATTRS = tuple(sorted(_STATE_FIELDS - {"pool_metrics", "timestamp"}))
+
     def __init__(self):
         """Initialize TrainingState with default values."""
         self.__lock = threading.Lock()
@@ -356,6 +361,8 @@ class TrainingMonitor:
     - Network topology updates
     """
 
+    EVENT_TYPES = frozenset({"epoch_start", "epoch_end", "cascade_add", "training_start", "training_end", "topology_change"})
+
     def __init__(self, data_adapter: DataAdapter):
         """
         Initialize training monitor.
@@ -366,9 +373,9 @@ class TrainingMonitor:
         self.logger = logging.getLogger(__name__)
         self.data_adapter = data_adapter
 
-        # Metrics storage
-        self.metrics_buffer: List[TrainingMetrics] = []
-        self.max_buffer_size = 10000
+        # Metrics storage (bounded; the oldest entry is dropped on append once full)
+        self._max_buffer_size = 10000
+        self.metrics_buffer: Deque[TrainingMetrics] = deque(maxlen=self._max_buffer_size)
 
         # State tracking
         self.is_training = False
@@ -377,23 +384,30 @@ class TrainingMonitor:
         self.current_phase = "output"
 
         # Callback registration
-        self.callbacks: Dict[str, List[Callable]] = {
-            "epoch_start": [],
-            "epoch_end": [],
-            "cascade_add": [],
-            "training_start": [],
-            "training_end": [],
-            "topology_change": [],
-        }
+        self.callbacks: Dict[str, List[Callable]] = {event_type: [] for event_type in self.EVENT_TYPES}
 
-        # Thread-safe queue for metrics
-        self.metrics_queue = queue.Queue()
+        # Bounded metrics channel for pollers; deque append/popleft are atomic, the event wakes idle pollers
+        self.metrics_queue: Deque[TrainingMetrics] = deque(maxlen=self._max_buffer_size)
+        self._metrics_available = threading.Event()
 
         # Lock for thread safety
         self.lock = threading.Lock()
 
         self.logger.info("TrainingMonitor initialized")
 
+    @property
+    def max_buffer_size(self) -> int:
+        """Maximum number of metrics retained in metrics_buffer."""
+        return self._max_buffer_size
+
+    @max_buffer_size.setter
+    def max_buffer_size(self, size: int):
+        """Resize metrics_buffer and metrics_queue, keeping the most recent entries."""
+        with self.lock:
+            self._max_buffer_size = size
+            self.metrics_buffer = deque(self.metrics_buffer, maxlen=size)
+            self.metrics_queue = deque(self.metrics_queue, maxlen=size)
+
     def register_callback(self, event_type: str, callback: Callable):
         """
         Register callback for training event.
@@ -402,7 +416,7 @@ class TrainingMonitor:
             event_type: Type of event ('epoch_start', 'epoch_end', etc.)
             callback: Callback function
         """
-        if event_type in self.callbacks:
+        if event_type in self.EVENT_TYPES:
             self.callbacks[event_type].append(callback)
             self.logger.debug(f"Registered callback for {event_type}")
         else:
@@ -457,8 +471,10 @@ class TrainingMonitor:
             self.current_epoch = epoch
             self.current_phase = phase
 
-        self.logger.debug(f"Epoch {epoch} started (phase: {phase})")
-        self._trigger_callbacks("epoch_start", epoch=epoch, phase=phase)
+        # Per-epoch hot path: defer log formatting and skip the kwargs dict when nothing is registered
+        self.logger.debug("Epoch %s started (phase: %s)", epoch, phase)
+        if self.callbacks.get("epoch_start"):
+            self._trigger_callbacks("epoch_start", epoch=epoch, phase=phase)
 
     def on_epoch_end(
         self,
@@ -495,14 +511,42 @@ class TrainingMonitor:
         # Add to buffer
         with self.lock:
             self.metrics_buffer.append(metrics)
-            if len(self.metrics_buffer) > self.max_buffer_size:
-                self.metrics_buffer.pop(0)
 
         # Add to queue for async processing
-        self.metrics_queue.put(metrics)
+        self.metrics_queue.append(metrics)
+        self._metrics_available.set()
+
+        self.logger.debug("Epoch %s ended: loss=%.4f, accuracy=%.4f", epoch, loss, accuracy)
+        if self.callbacks.get("epoch_end"):
+            self._trigger_callbacks("epoch_end", metrics=metrics, epoch=epoch, loss=loss, accuracy=accuracy)
+
+    def on_epoch_end_batch(self, records: Iterable[Dict[str, Any]]):
+        """
+        Handle a run of epoch end events at once, e.g. when replaying logged epochs.
 
-        self.logger.debug(f"Epoch {epoch} ended: loss={loss:.4f}, accuracy={accuracy:.4f}")
-        self._trigger_callbacks("epoch_end", metrics=metrics, epoch=epoch, loss=loss, accuracy=accuracy)
+        Metrics are built outside the lock and appended to the buffer and queue in bulk;
+        epoch_end callbacks still fire once per record, in order.
+
+        Args:
+            records: Dicts of on_epoch_end keyword arguments (epoch, loss, accuracy,
+                learning_rate and optional validation_loss / validation_accuracy)
+        """
+        hidden_units = self.current_hidden_units
+        phase = self.current_phase
+        batch = [self.data_adapter.extract_training_metrics(hidden_units=hidden_units, cascade_phase=phase, **record) for record in records]
+        if not batch:
+            return
+
+        with self.lock:
+            self.metrics_buffer.extend(batch)
+
+        self.metrics_queue.extend(batch)
+        self._metrics_available.set()
+
+        self.logger.debug("Epochs %s-%s ended (%d records)", batch[0].epoch, batch[-1].epoch, len(batch))
+        if self.callbacks.get("epoch_end"):
+            for metrics in batch:
+                self._trigger_callbacks("epoch_end", metrics=metrics, epoch=metrics.epoch, loss=metrics.loss, accuracy=metrics.accuracy)
 
     def on_cascade_add(self, hidden_unit_index: int, correlation: float, weights: Optional[Dict[str, Any]] = None):
         """
@@ -546,8 +590,13 @@ class TrainingMonitor:
         Returns:
             List of TrainingMetrics objects
         """
+        if count <= 0:
+            return []
         with self.lock:
-            return self.metrics_buffer[-count:]
+            # Walk back from the tail so only `count` entries are visited, not the whole deque
+            recent = list(islice(reversed(self.metrics_buffer), count))
+        recent.reverse()
+        return recent
 
     def get_all_metrics(self) -> List[TrainingMetrics]:
         """
@@ -557,7 +606,7 @@ class TrainingMonitor:
             List of all TrainingMetrics objects
         """
         with self.lock:
-            return self.metrics_buffer.copy()
+            return list(self.metrics_buffer)
 
     def get_current_state(self) -> Dict[str, Any]:
         """
@@ -583,17 +632,29 @@ class TrainingMonitor:
 
     def poll_metrics_queue(self, timeout: float = 0.1) -> Optional[TrainingMetrics]:
         """
-        Poll metrics queue for new metrics (non-blocking).
+        Poll metrics queue for new metrics, waiting up to ``timeout`` when it is empty.
+
+        The queue holds at most ``max_buffer_size`` entries; if nothing polls it,
+        the oldest metrics are dropped rather than accumulating.
 
         Args:
-            timeout: Timeout in seconds
+            timeout: Timeout in seconds; ``0`` polls without touching the wake-up event
 
         Returns:
             TrainingMetrics object or None if queue empty
         """
         try:
-            return self.metrics_queue.get(timeout=timeout)
-        except queue.Empty:
+            return self.metrics_queue.popleft()
+        except IndexError:
+            if timeout <= 0:
+                return None
+        # Clear before re-checking so an append racing this poll still wakes the wait below
+        self._metrics_available.clear()
+        if not self.metrics_queue:
+            self._metrics_available.wait(timeout)
+        try:
+            return self.metrics_queue.popleft()
+        except IndexError:
             return None
 
     def apply_params(self, learning_rate: Optional[float] = None, max_hidden_units: Optional[int] = None) -> Dict[str, Any]:
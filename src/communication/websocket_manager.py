@@ -27,7 +27,7 @@
 #
 # Features:
 # - Connection management (connect, disconnect, track metadata)
-# - Broadcasting messages to all connected clients
+# - Broadcasting messages to all connected clients (one writer task per connection)
 # - Synchronous broadcasting for non-async code
 # - Connection health monitoring
 # - Automatic cleanup of broken connections
@@ -134,6 +134,7 @@ import contextlib
 # import json
 import logging
 import time
+from collections import deque
 from datetime import datetime
 
 # from typing import Set, Dict, Any, Optional
@@ -142,6 +143,8 @@ from typing import Any, Dict, Optional, Set
 # from fastapi import WebSocket, WebSocketDisconnect
 from fastapi import WebSocket
 
+from fast_json import json_dumps
+
 
 class WebSocketManager:
     """
@@ -166,15 +169,33 @@ class WebSocketManager:
         websocket_manager.broadcast_sync({'type': 'metrics', 'loss': 0.5})
     """
 
+    # Broadcast fan-out: each connection has one writer task draining a bounded outbound queue.
+    # A client whose queue fills up, or that does not accept a message within SEND_TIMEOUT
+    # seconds, is treated as disconnected.
+    SEND_QUEUE_SIZE = 256
+    SEND_TIMEOUT = 5.0
+
+    # Thread-side broadcasts (broadcast_from_thread/broadcast_sync) are appended to one bounded deque and
+    # sent in order by a single drain task on the event loop, rather than a run_coroutine_threadsafe Future
+    # per message. If the drain falls behind, the oldest pending messages are dropped and the count logged.
+    BROADCAST_QUEUE_MAXLEN = 4096
+
     def __init__(self):
         """Initialize WebSocket manager with config-driven settings."""
         from settings import get_settings
 
         self.active_connections: Set[WebSocket] = set()
         self.connection_metadata: Dict[WebSocket, dict] = {}
+        self.outbound_queues: Dict[WebSocket, asyncio.Queue] = {}
+        self.writer_tasks: Dict[WebSocket, asyncio.Task] = {}
         self.logger = self._setup_logger()
         self.message_count = 0
         self.event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.broadcast_queue: deque = deque(maxlen=self.BROADCAST_QUEUE_MAXLEN)
+        self.broadcasts_dropped = 0
+        self._dropped_since_drain = 0
+        self._broadcast_wake: Optional[asyncio.Event] = None
+        self._broadcast_drain_task: Optional[asyncio.Task] = None
 
         _settings = get_settings()
         self.max_connections = _settings.websocket.max_connections
@@ -194,6 +215,67 @@ class WebSocketManager:
         self.event_loop = loop
         self.logger.debug("Event loop set for WebSocketManager")
 
+    def start_broadcast_drain(self):
+        """
+        Start the task that sends queued thread-side broadcasts.
+
+        Must be called on the event loop passed to set_event_loop().
+        """
+        self.broadcast_queue.clear()
+        self._broadcast_wake = asyncio.Event()
+        self._broadcast_drain_task = asyncio.create_task(self._drain_broadcasts(self._broadcast_wake))
+
+    async def stop_broadcast_drain(self):
+        """Cancel the broadcast drain task; messages still queued are discarded."""
+        task, self._broadcast_drain_task = self._broadcast_drain_task, None
+        self._broadcast_wake = None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self.broadcast_queue.clear()
+
+    def enqueue_broadcast(self, message: dict) -> bool:
+        """
+        Queue a message for the drain task from any thread.
+
+        deque.append is atomic under the GIL, so producers need no lock; the drain
+        task is only woken (via call_soon_threadsafe) when it is idle.
+
+        Args:
+            message: Message dictionary to broadcast
+
+        Returns:
+            bool: False if the drain task is not running and the message was not queued
+        """
+        wake = self._broadcast_wake
+        if wake is None:
+            return False
+        queue = self.broadcast_queue
+        if len(queue) == queue.maxlen:
+            self._dropped_since_drain += 1
+        queue.append(message)
+        if not wake.is_set():
+            self.event_loop.call_soon_threadsafe(wake.set)
+        return True
+
+    async def _drain_broadcasts(self, wake: asyncio.Event):
+        """Broadcast queued messages in order; sleeps on wake while the queue is empty."""
+        queue = self.broadcast_queue
+        while True:
+            await wake.wait()
+            wake.clear()
+            while queue:
+                message = queue.popleft()
+                try:
+                    await self.broadcast(message)
+                except Exception as e:
+                    self.logger.error(f"Queued broadcast failed: {type(e).__name__}: {e}")
+            if self._dropped_since_drain:
+                dropped, self._dropped_since_drain = self._dropped_since_drain, 0
+                self.broadcasts_dropped += dropped
+                self.logger.warning(f"Broadcast queue full ({queue.maxlen}); dropped {dropped} oldest message(s)")
+
     def _setup_logger(self) -> logging.Logger:
         """
         Setup logger for WebSocket manager.
@@ -253,6 +335,59 @@ class WebSocketManager:
             websocket,
         )
 
+        if websocket in self.active_connections:
+            self._start_writer(websocket)
+
+    def _start_writer(self, websocket: WebSocket) -> asyncio.Queue:
+        """
+        Create the outbound queue and writer task for a connection, if not already running.
+
+        Args:
+            websocket: WebSocket connection to serve
+
+        Returns:
+            The connection's outbound queue
+        """
+        queue = self.outbound_queues.get(websocket)
+        if queue is None:
+            queue = self.outbound_queues[websocket] = asyncio.Queue(maxsize=self.SEND_QUEUE_SIZE)
+            self.writer_tasks[websocket] = asyncio.create_task(self._writer(websocket, queue))
+        return queue
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """
+        Send queued broadcast payloads to one connection until it disconnects.
+
+        Args:
+            websocket: WebSocket connection to write to
+            queue: The connection's outbound queue of serialized JSON text frames
+        """
+        while True:
+            payload = await queue.get()
+            try:
+                await asyncio.wait_for(websocket.send_text(payload), timeout=self.SEND_TIMEOUT)
+            except Exception as e:
+                self.logger.warning(f"Failed to broadcast to client: {e!r}")
+                self.disconnect(websocket)
+                return
+            finally:
+                queue.task_done()
+
+            if websocket in self.connection_metadata:
+                self.connection_metadata[websocket]["messages_sent"] += 1
+                self.connection_metadata[websocket]["last_message_at"] = datetime.now().isoformat()
+
+    async def flush(self):
+        """
+        Wait until every message queued so far has been handed to its connection.
+
+        Example:
+            await websocket_manager.broadcast({'type': 'ping'})
+            await websocket_manager.flush()
+        """
+        for queue in list(self.outbound_queues.values()):
+            await queue.join()
+
     def disconnect(self, websocket: WebSocket):
         """
         Remove WebSocket connection.
@@ -269,9 +404,27 @@ class WebSocketManager:
 
             self.active_connections.discard(websocket)
             self.connection_metadata.pop(websocket, None)
+            self._stop_writer(websocket)
 
             self.logger.info(f"Client disconnected: {client_id} " f"(Remaining: {len(self.active_connections)})")
 
+    def _stop_writer(self, websocket: WebSocket):
+        """
+        Cancel a connection's writer task and drop any messages still queued for it.
+
+        Args:
+            websocket: WebSocket connection whose writer should stop
+        """
+        task = self.writer_tasks.pop(websocket, None)
+        queue = self.outbound_queues.pop(websocket, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        if queue is not None:
+            # Release anyone waiting in flush() on messages that will never be sent
+            while not queue.empty():
+                queue.get_nowait()
+                queue.task_done()
+
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """
         Send message to specific WebSocket connection.
@@ -327,31 +480,31 @@ class WebSocketManager:
         if "timestamp" not in message:
             message["timestamp"] = datetime.now().isoformat()
 
+        # Serialize once; every connection is sent the same text frame
+        try:
+            payload = json_dumps(message).decode("utf-8")
+        except (TypeError, ValueError) as e:
+            self.logger.error(f"Failed to serialize broadcast message (type: {message.get('type', 'unknown')}): {e}")
+            return
+
         # Track message
         self.message_count += 1
 
-        # Send to all connections (excluding specified ones)
+        # Queue for all connections (excluding specified ones); each writer task sends independently
         disconnected = set()
         connections = self.active_connections - (exclude or set())
-
         for connection in connections:
             try:
-                await connection.send_json(message)
-
-                # Update metadata
-                if connection in self.connection_metadata:
-                    self.connection_metadata[connection]["messages_sent"] += 1
-                    self.connection_metadata[connection]["last_message_at"] = datetime.now().isoformat()
-
-            except Exception as e:
-                self.logger.warning(f"Failed to broadcast to client: {e}")
+                self._start_writer(connection).put_nowait(payload)
+            except asyncio.QueueFull:
+                self.logger.warning(f"Dropping slow client: {self.SEND_QUEUE_SIZE} messages pending")
                 disconnected.add(connection)
 
         # Remove disconnected clients
         for connection in disconnected:
             self.disconnect(connection)
 
-        self.logger.debug(f"Broadcast message #{self.message_count} to {len(connections)} clients " f"(type: {message.get('type', 'unknown')})")
+        self.logger.debug(f"Queued broadcast message #{self.message_count} for {len(connections)} clients " f"(type: {message.get('type', 'unknown')})")
 
     def broadcast_sync(self, message: dict):
         """
@@ -359,7 +512,8 @@ class WebSocketManager:
 
         This method allows broadcasting from regular Python code
         (e.g., training callbacks) without async/await syntax.
-        Uses only the stored event loop set during application startup.
+        Uses only the stored event loop set during application startup; the
+        message is queued for the broadcast drain task.
 
         Args:
             message: Message dictionary to broadcast
@@ -374,10 +528,10 @@ class WebSocketManager:
         """
         try:
             # Use only the stored event loop (set during app startup)
-            if self.event_loop and self.event_loop.is_running():
-                asyncio.run_coroutine_threadsafe(self.broadcast(message), self.event_loop)
-            else:
+            if not (self.event_loop and self.event_loop.is_running()):
                 self.logger.debug("Event loop not set or not running; dropping sync broadcast")
+            elif not self.enqueue_broadcast(message):
+                self.logger.debug("Broadcast drain not running; dropping sync broadcast")
         except Exception as e:
             self.logger.error(f"Sync broadcast failed: {type(e).__name__}: {e}")
 
@@ -386,8 +540,8 @@ class WebSocketManager:
         Thread-safe broadcast for use from background threads.
 
         This method allows broadcasting from non-async background threads
-        (e.g., demo mode training loop) by scheduling the coroutine on the
-        main event loop using run_coroutine_threadsafe.
+        (e.g., demo mode training loop) by queueing the message for the
+        broadcast drain task on the main event loop.
 
         Args:
             message: Message dictionary to broadcast
@@ -405,12 +559,11 @@ class WebSocketManager:
 
         try:
             # Use the stored event loop
-            if self.event_loop and not self.event_loop.is_closed():
-                # Schedule the coroutine on the main event loop from this thread
-                asyncio.run_coroutine_threadsafe(self.broadcast(message), self.event_loop)
-            else:
+            if not (self.event_loop and not self.event_loop.is_closed()):
                 # No event loop available
                 self.logger.debug("No running event loop available for broadcast_from_thread")
+            elif not self.enqueue_broadcast(message):
+                self.logger.debug("Broadcast drain not running; dropping broadcast_from_thread message")
 
         except Exception as e:
             self.logger.warning(f"Failed to broadcast from thread: {type(e).__name__}: {e}")
@@ -510,7 +663,8 @@ class WebSocketManager:
             {
                 'active_connections': int,
                 'total_messages_broadcast': int,
-                'uptime_seconds': float
+                'broadcasts_dropped': int,
+                'connections_info': list
             }
 
         Example:
@@ -520,6 +674,7 @@ class WebSocketManager:
         return {
             "active_connections": len(self.active_connections),
             "total_messages_broadcast": self.message_count,
+            "broadcasts_dropped": self.broadcasts_dropped,
             "connections_info": self.get_connection_info(),
         }
 
@@ -536,6 +691,8 @@ class WebSocketManager:
 
         # Send shutdown notice
         await self.broadcast({"type": "server_shutdown", "message": "Server is shutting down"})
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self.flush(), timeout=self.SEND_TIMEOUT)
 
         # Close all connections (suppress errors for already-closed connections)
         for websocket in list(self.active_connections):
@@ -62,11 +62,18 @@ import numpy as np
 import torch
 
 from backend.training_state_machine import Command, TrainingPhase, TrainingStateMachine  # TrainingStatus,
-from canopy_constants import TrainingConstants
+from canopy_constants import JuniperDataConstants, TrainingConstants
 from settings import get_settings
 
 # import copy
 
+# Static portion of the JuniperData spiral request; only the sample count varies per call
+_SPIRAL_DATASET_PARAMS: Dict[str, Any] = {
+    "n_spirals": 2,
+    "noise": JuniperDataConstants.DEFAULT_DATASET_NOISE,
+    "seed": JuniperDataConstants.DEFAULT_DATASET_SEED,
+}
+
 
 class MockCascorNetwork:
     """
@@ -373,17 +380,12 @@ class DemoMode:
 
         client = JuniperDataClient(base_url=juniper_data_url)
 
-        params = {
-            "n_points_per_spiral": n_samples // 2,
-            "n_spirals": 2,
-            "noise": 0.1,
-            "seed": 42,
-        }
+        params = {"n_points_per_spiral": n_samples // 2, **_SPIRAL_DATASET_PARAMS}
         if algorithm is not None:
             params["algorithm"] = algorithm
 
         response = client.create_dataset(
-            generator="spiral",
+            generator=JuniperDataConstants.DEFAULT_GENERATOR,
             params=params,
             persist=True,
         )
@@ -0,0 +1,58 @@
+"""JSON serialization helpers and response class for the FastAPI app.
+
+Serializes with orjson when it is installed and falls back to the standard
+library otherwise, so the app keeps working in minimal environments.
+"""
+
+import json
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if ORJSON_AVAILABLE else 0
+
+
+def json_dumps(content: Any) -> bytes:
+    """Serialize content to compact UTF-8 JSON bytes.
+
+    Args:
+        content: JSON-compatible object (numpy arrays and non-str keys are accepted with orjson).
+
+    Returns:
+        Encoded JSON document.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse a JSON document (orjson when available).
+
+    Args:
+        data: Encoded JSON document.
+
+    Returns:
+        Decoded Python object.
+
+    Raises:
+        ValueError: If ``data`` is not valid JSON.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with json_dumps (orjson when available)."""
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
@@ -7,6 +7,7 @@ services, and a dependency probe utility for readiness checks.
 import time
 import urllib.request
 from datetime import datetime
+from functools import lru_cache
 from typing import Literal
 
 from pydantic import BaseModel, Field
@@ -32,6 +33,46 @@ class ReadinessResponse(BaseModel):
     details: dict[str, object] = {}
 
 
+_HTTP_SCHEMES = ("http://", "https://")
+_NON_CANONICAL_SUFFIXES = ("/", "/v1")
+
+
+def normalize_service_url(url: str) -> str:
+    """Normalize a Juniper service base URL to ``scheme://host[:port]`` form.
+
+    Adds a missing ``http://`` scheme and strips trailing ``/`` and ``/v1`` so
+    callers can append versioned paths. The common already-canonical form
+    (e.g. ``http://localhost:8100``) is returned unchanged without parsing.
+
+    Args:
+        url: Service base URL as configured.
+
+    Returns:
+        Normalized base URL.
+    """
+    if url.startswith(_HTTP_SCHEMES) and not url.endswith(_NON_CANONICAL_SUFFIXES):
+        return url
+    if "://" not in url:
+        url = f"http://{url}"
+    return url.rstrip("/").removesuffix("/v1").rstrip("/")
+
+
+@lru_cache(maxsize=32)
+def build_health_url(base_url: str) -> str:
+    """Return the liveness probe URL for a Juniper service base URL.
+
+    Cached per configured base URL, so repeat readiness probes reuse the
+    normalized string.
+
+    Args:
+        base_url: Service base URL as configured.
+
+    Returns:
+        ``{normalized base}/v1/health/live``.
+    """
+    return f"{normalize_service_url(base_url)}/v1/health/live"
+
+
 def probe_dependency(name: str, url: str, timeout: float = 5.0) -> DependencyStatus:
     """Probe a dependency health endpoint. Returns status with latency.
 
@@ -37,13 +37,22 @@
 #
 #####################################################################################################################################################################################################
 import asyncio
+import atexit
+import contextlib
+import functools
+import hashlib
 import json
 import os
 
 # import sys
+import threading
 import time
+from collections import deque
 from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from stat import S_ISDIR, S_ISREG
+from urllib.parse import quote, unquote
 
 # import dash
 import uvicorn
@@ -52,9 +61,10 @@ import uvicorn
 from a2wsgi import WSGIMiddleware
 
 # from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import RedirectResponse, Response
+from pydantic import BaseModel
 
 # from dash import html, dcc
 # Add src directory to Python path
@@ -62,10 +72,13 @@ from fastapi.responses import JSONResponse, RedirectResponse
 # sys.path.insert(0, str(src_dir))
 # from backend.training_monitor import TrainingMonitor  trunk-ignore(ruff/E402)
 # from backend.data_adapter import DataAdapter  trunk-ignore(ruff/E402)
+from backend.cassandra_client import get_cassandra_client
+from backend.redis_client import get_redis_client
 from backend.training_monitor import TrainingState  # trunk-ignore(ruff/E402)
-from communication.websocket_manager import websocket_manager
+from communication.websocket_manager import create_control_ack_message, websocket_manager
+from fast_json import FastJSONResponse, json_dumps, json_loads
 from frontend.dashboard_manager import DashboardManager
-from health import DependencyStatus, ReadinessResponse, probe_dependency
+from health import DependencyStatus, ReadinessResponse, build_health_url, probe_dependency
 from logger.logger import (
     get_system_logger,
     get_training_logger,
@@ -106,6 +119,17 @@ loop_holder = {"loop": None}
 juniper_data_available = False
 training_state = TrainingState()  # Global TrainingState instance
 
+# /api/train/status is polled by dashboards; repeat polls within STATUS_CACHE_TTL seconds are served the last
+# encoded payload (and its ETag) built for the same backend. Control paths call _invalidate_status_cache()
+# so changes show at once.
+STATUS_CACHE_TTL = 0.2
+_status_cache = {"ts": 0.0, "backend": None, "body": b"", "etag": ""}
+
+
+def _invalidate_status_cache():
+    """Force the next /api/train/status request to query the backend."""
+    _status_cache["ts"] = 0.0
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -126,6 +150,10 @@ async def lifespan(app: FastAPI):
     # Set event loop on websocket_manager for thread-safe broadcasting
     websocket_manager.set_event_loop(loop_holder["loop"])
 
+    # Start the single task that drains thread-side broadcasts (bound to this loop)
+    websocket_manager.start_broadcast_drain()
+    history_flush_task = asyncio.create_task(_flush_snapshot_history_periodically())
+
     # Initialize backend via factory
     global backend, training_state
 
@@ -140,7 +168,7 @@ async def lifespan(app: FastAPI):
 
     # CAN-HIGH-001: Probe upstream services at startup using standardized probe.
     global juniper_data_available
-    data_probe = probe_dependency("JuniperData", f"{juniper_data_url.rstrip('/')}/v1/health/live")
+    data_probe = probe_dependency("JuniperData", build_health_url(juniper_data_url))
     if data_probe.status == "healthy":
         juniper_data_available = True
         system_logger.info(f"JuniperData reachable at {juniper_data_url} ({data_probe.latency_ms:.1f}ms)")
@@ -150,7 +178,7 @@ async def lifespan(app: FastAPI):
     # Probe JuniperCascor at startup (service mode only) — fallback to demo on failure.
     cascor_url = settings.cascor_service_url
     if cascor_url and backend.backend_type == "service":
-        cascor_probe = probe_dependency("JuniperCascor", f"{cascor_url.rstrip('/')}/v1/health/live")
+        cascor_probe = probe_dependency("JuniperCascor", build_health_url(cascor_url))
         if cascor_probe.status == "healthy":
             system_logger.info(f"JuniperCascor reachable at {cascor_url} ({cascor_probe.latency_ms:.1f}ms)")
         else:
@@ -181,6 +209,13 @@ async def lifespan(app: FastAPI):
     # Shutdown
     system_logger.info("Shutting down Juniper Canopy application")
 
+    await websocket_manager.stop_broadcast_drain()
+
+    history_flush_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await history_flush_task
+    _close_snapshot_history()
+
     await backend.shutdown()
 
     # Shutdown WebSocket connections
@@ -195,6 +230,7 @@ app = FastAPI(
     version="0.3.0",
     description="Real-time monitoring for CasCor networks",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # Add CORS middleware
@@ -236,25 +272,6 @@ app.mount("/dashboard", WSGIMiddleware(dashboard_manager.app.server))
 dash_app = dashboard_manager.app
 
 
-def schedule_broadcast(coroutine):
-    """
-    Schedule coroutine on FastAPI's event loop from any thread.
-    This allows synchronous training code to trigger async broadcasts
-    without blocking or requiring async/await syntax.
-
-    Args:
-        coroutine: Async coroutine to schedule
-    """
-    if loop_holder["loop"] and not loop_holder["loop"].is_closed():
-        try:
-            asyncio.run_coroutine_threadsafe(coroutine, loop_holder["loop"])
-        except Exception as e:
-            system_logger.error(f"Failed to schedule broadcast: {e}")
-    else:
-        coroutine.close()
-        system_logger.warning("Event loop not available for broadcasting")
-
-
 @app.get("/")
 async def root():
     """
@@ -368,6 +385,7 @@ async def websocket_control_endpoint(websocket: WebSocket):
                     response = {"ok": True, "command": command, "state": result}
                 else:
                     response = {"ok": False, "error": f"Unknown command: {command}"}
+                _invalidate_status_cache()
 
                 await websocket_manager.send_personal_message(response, websocket)
             except Exception as e:
@@ -380,33 +398,35 @@ async def websocket_control_endpoint(websocket: WebSocket):
         websocket_manager.disconnect(websocket)
 
 
+# Static fields of the health payload, serialized once: b'{"status":"healthy","version":"0.3.0",'
+_HEALTH_STATIC_PREFIX = json_dumps({"status": "healthy", "version": "0.3.0"})[:-1] + b","
+
+
+def _health_response() -> Response:
+    """Build the health payload by appending the per-request fields to the pre-serialized prefix."""
+    dynamic = json_dumps(
+        {
+            "timestamp": time.time(),
+            "active_connections": websocket_manager.get_connection_count(),
+            "training_active": backend.is_training_active(),
+            "demo_mode": backend.backend_type == "demo",
+            "juniper_data_available": juniper_data_available,
+        }
+    )
+    return Response(content=_HEALTH_STATIC_PREFIX + dynamic[1:], media_type="application/json")
+
+
 @app.get("/health", deprecated=True)
 @app.get("/api/health", deprecated=True)
 async def health_check_deprecated():
     """Health check endpoint (deprecated — use /v1/health instead)."""
-    return {
-        "status": "healthy",
-        "timestamp": time.time(),
-        "version": "0.3.0",
-        "active_connections": websocket_manager.get_connection_count(),
-        "training_active": backend.is_training_active(),
-        "demo_mode": backend.backend_type == "demo",
-        "juniper_data_available": juniper_data_available,
-    }
+    return _health_response()
 
 
 @app.get("/v1/health")
 async def health_check():
     """Combined health check endpoint."""
-    return {
-        "status": "healthy",
-        "timestamp": time.time(),
-        "version": "0.3.0",
-        "active_connections": websocket_manager.get_connection_count(),
-        "training_active": backend.is_training_active(),
-        "demo_mode": backend.backend_type == "demo",
-        "juniper_data_available": juniper_data_available,
-    }
+    return _health_response()
 
 
 @app.get("/v1/health/live")
@@ -424,12 +444,12 @@ async def readiness_probe() -> ReadinessResponse:
     """
     # Probe JuniperData
     data_url = settings.juniper_data_url
-    data_dep = probe_dependency("JuniperData Service", f"{data_url.rstrip('/')}/v1/health/live")
+    data_dep = probe_dependency("JuniperData Service", build_health_url(data_url))
 
     # Probe JuniperCascor
     ready_cascor_url = settings.cascor_service_url
     if ready_cascor_url:
-        cascor_dep = probe_dependency("JuniperCascor Service", f"{ready_cascor_url.rstrip('/')}/v1/health/live")
+        cascor_dep = probe_dependency("JuniperCascor Service", build_health_url(ready_cascor_url))
     else:
         cascor_dep = DependencyStatus(
             name="JuniperCascor Service",
@@ -499,7 +519,8 @@ async def get_metrics_history():
     Returns:
         Dictionary with history list
     """
-    return {"history": backend.get_metrics_history(100)}
+    # Returned as a response so the (up to 100-entry) history skips FastAPI's jsonable_encoder walk
+    return FastJSONResponse({"history": backend.get_metrics_history(100)})
 
 
 @app.get("/api/network/stats")
@@ -542,7 +563,7 @@ async def get_network_stats():
             threshold_function=network_data.get("threshold_function", "sigmoid"),
             optimizer_name=network_data.get("optimizer", "sgd"),
         )
-    return JSONResponse({"error": "No network data available"}, status_code=503)
+    return FastJSONResponse({"error": "No network data available"}, status_code=503)
 
 
 @app.get("/api/topology")
@@ -554,7 +575,7 @@ async def get_topology():
     """
     topology = backend.get_network_topology()
     if topology is None:
-        return JSONResponse({"error": "No topology available"}, status_code=503)
+        return FastJSONResponse({"error": "No topology available"}, status_code=503)
     return topology
 
 
@@ -567,7 +588,7 @@ async def get_dataset():
     """
     dataset = backend.get_dataset()
     if dataset is None:
-        return JSONResponse({"error": "No dataset available"}, status_code=503)
+        return FastJSONResponse({"error": "No dataset available"}, status_code=503)
     return dataset
 
 
@@ -580,7 +601,7 @@ async def get_decision_boundary():
     """
     boundary = backend.get_decision_boundary(100)
     if boundary is None:
-        return JSONResponse({"error": "No decision boundary data available"}, status_code=503)
+        return FastJSONResponse({"error": "No decision boundary data available"}, status_code=503)
     return boundary
 
 
@@ -600,71 +621,120 @@ async def get_statistics():
 
 # Snapshot configuration
 SNAPSHOT_EXTENSIONS = (".h5", ".hdf5")
+# Extension matching only lowercases the last few characters of each directory entry name
+_SNAPSHOT_SUFFIX_MAXLEN = max(map(len, SNAPSHOT_EXTENSIONS))
+_SNAPSHOT_SUFFIXES = frozenset(SNAPSHOT_EXTENSIONS)
 _snapshots_dir = os.getenv("CASCOR_SNAPSHOT_DIR", "./snapshots")
 
 
+def _iso_z(ts: datetime) -> str:
+    """Format a UTC datetime as the API's second-resolution timestamp (``...+00:00Z``)."""
+    return ts.isoformat(timespec="seconds") + "Z"
+
+
+# Static fields of the demo-mode mock snapshots; only the timestamps depend on the current time
+_MOCK_SNAPSHOT_TEMPLATE = tuple(
+    {
+        "id": f"demo_snapshot_{i + 1}",
+        "name": f"Demo Snapshot {i + 1}",
+        "size_bytes": (i + 1) * 1024 * 1024 + i * 512 * 1024,
+        "description": f"Demo training snapshot #{i + 1} (simulated)",
+    }
+    for i in range(3)
+)
+_MOCK_SNAPSHOT_AGES = tuple(timedelta(hours=i * 24 + i * 2, minutes=i * 15) for i in range(3))
+
+
 def _generate_mock_snapshots():
     """Generate mock snapshot metadata for demo mode or missing backend."""
-    from datetime import UTC, datetime, timedelta
-
     now = datetime.now(UTC)
-    snapshots = []
-    for i in range(3):
-        ts = now - timedelta(hours=i * 24 + i * 2, minutes=i * 15)
-        ts = ts.replace(microsecond=0)
-        snapshots.append(
-            {
-                "id": f"demo_snapshot_{i + 1}",
-                "name": f"Demo Snapshot {i + 1}",
-                "timestamp": f"{ts.isoformat()}Z",
-                "size_bytes": (i + 1) * 1024 * 1024 + i * 512 * 1024,
-                "description": f"Demo training snapshot #{i + 1} (simulated)",
-            }
-        )
-    return snapshots
+    return [{**template, "timestamp": _iso_z(now - age)} for template, age in zip(_MOCK_SNAPSHOT_TEMPLATE, _MOCK_SNAPSHOT_AGES)]
+
+
+# Last _list_snapshot_files() result, keyed by the (name, mtime_ns, size) of every snapshot entry, so
+# files rewritten in place (which leave the directory mtime alone) are picked up as well as additions.
+# "etag" is a weak validator over the cached listing, recomputed only when the listing is rebuilt.
+_snapshot_list_cache: dict = {"key": None, "snapshots": [], "etag": None}
 
 
 def _list_snapshot_files():
     """
     Return list of snapshot metadata dicts from snapshots directory.
 
+    Uses a single os.scandir() pass (one stat per snapshot entry) and returns the
+    cached listing while no entry's name, mtime or size has changed.
+
     Each item:
         - id: file stem (no extension)
         - name: file name
         - timestamp: ISO8601 from mtime (UTC)
         - size_bytes: file size
     """
-    from datetime import UTC, datetime
-    from pathlib import Path
-
     path = Path(_snapshots_dir)
-    if not path.exists() or not path.is_dir():
+    try:
+        with os.scandir(path) as it:
+            entries = [(entry, entry.stat()) for entry in it if entry.name[-_SNAPSHOT_SUFFIX_MAXLEN:].lower().endswith(SNAPSHOT_EXTENSIONS) and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
         return []
+    entries.sort(key=lambda pair: pair[1].st_mtime_ns, reverse=True)
 
-    snapshots = []
-    for f in sorted(path.iterdir(), key=lambda p: p.stat().st_mtime, reverse=True):
-        if not f.is_file() or f.suffix.lower() not in SNAPSHOT_EXTENSIONS:
-            continue
+    cache_key = (str(path), tuple((entry.name, stat.st_mtime_ns, stat.st_size) for entry, stat in entries))
+    if _snapshot_list_cache["key"] == cache_key:
+        return list(_snapshot_list_cache["snapshots"])
 
-        stat = f.stat()
-        ts = datetime.fromtimestamp(stat.st_mtime, tz=UTC).replace(microsecond=0)
+    snapshots = []
+    for entry, stat in entries:
         snapshots.append(
             {
-                "id": f.stem,
-                "name": f.name,
-                "timestamp": f"{ts.isoformat()}Z",
+                "id": os.path.splitext(entry.name)[0],
+                "name": entry.name,
+                "timestamp": _iso_z(datetime.fromtimestamp(stat.st_mtime, tz=UTC)),
                 "size_bytes": stat.st_size,
-                "path": str(f.absolute()),
+                "path": os.path.abspath(entry.path),
             }
         )
-    return snapshots
+
+    _snapshot_list_cache["key"] = cache_key
+    _snapshot_list_cache["snapshots"] = snapshots
+    _snapshot_list_cache["etag"] = f'W/"{hashlib.blake2b(json_dumps(snapshots), digest_size=8).hexdigest()}"'
+    return list(snapshots)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header value against ``etag`` (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in if_none_match.split(","))
+
+
+def _json_etag(content) -> tuple[bytes, str]:
+    """Encode ``content`` as JSON and derive a weak ETag from the encoded bytes."""
+    body = json_dumps(content)
+    return body, f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _conditional_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """
+    Return a pre-encoded JSON body, or 304 Not Modified if the client already holds ``etag``.
+
+    Polled status endpoints use this; ``Cache-Control: no-cache`` makes clients revalidate every time.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
 
 
 @app.get("/api/v1/snapshots")
-async def get_snapshots():
+async def get_snapshots(request: Request):
     """
     List available HDF5 snapshots.
 
+    Real snapshot listings carry a weak ETag; a matching If-None-Match gets 304 Not Modified.
+
     Returns:
         JSON object with:
             - snapshots: list of snapshot metadata objects
@@ -693,7 +763,60 @@ async def get_snapshots():
     if not snapshots:
         return {"snapshots": [], "message": "No snapshots available"}
 
-    return {"snapshots": snapshots}
+    etag = _snapshot_list_cache["etag"]
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return FastJSONResponse({"snapshots": snapshots}, headers={"ETag": etag})
+
+
+SNAPSHOT_HISTORY_TAIL_BLOCK_SIZE = 1 << 16
+
+
+def _tail_jsonl(path, n: int = None, block_size: int = SNAPSHOT_HISTORY_TAIL_BLOCK_SIZE) -> list:
+    """
+    Parse the last ``n`` valid entries of a JSONL file, newest first.
+
+    The file is read backward in ``block_size`` chunks, so the bytes read scale with ``n``
+    rather than with the file length. Blank and malformed lines are skipped.
+
+    Args:
+        path: Path to the JSONL file
+        n: Maximum number of entries to return (None for all)
+        block_size: Bytes read per backward step
+
+    Returns:
+        List of decoded entries in reverse file order
+    """
+    entries = []
+
+    def collect(lines) -> bool:
+        for raw in lines:
+            if line := raw.strip():
+                try:
+                    entries.append(json_loads(line))
+                except ValueError:
+                    system_logger.warning(f"Invalid JSON in history file: {line[:50].decode(errors='replace')}...")
+                if n is not None and len(entries) >= n:
+                    return True
+        return False
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        offset = os.lseek(fd, 0, os.SEEK_END)
+        carry = b""
+        while offset > 0:
+            size = min(block_size, offset)
+            offset -= size
+            lines = (os.pread(fd, size, offset) + carry).split(b"\n")
+            # The first piece may be the tail of a line that starts in an earlier block
+            carry = lines.pop(0)
+            if collect(reversed(lines)):
+                return entries
+        collect([carry])
+    finally:
+        os.close(fd)
+    return entries
 
 
 @app.get("/api/v1/snapshots/history")
@@ -709,32 +832,18 @@ async def get_snapshot_history(limit: int = 50):
     Returns:
         JSON object with history entries array
     """
-    from pathlib import Path
-
     history_file = Path(_snapshots_dir) / "snapshot_history.jsonl"
+    _flush_snapshot_history()
 
     entries = []
 
     if history_file.exists():
         try:
-            with open(history_file, "r") as f:
-                for line in f:
-                    if line := line.strip():
-                        try:
-                            entry = json.loads(line)
-                            entries.append(entry)
-                        except json.JSONDecodeError:
-                            system_logger.warning(f"Invalid JSON in history file: {line[:50]}...")
+            # Newest first; only the tail needed for `limit` is read and parsed
+            entries = _tail_jsonl(history_file, limit if limit and limit > 0 else None)
         except Exception as e:
             system_logger.warning(f"Failed to read snapshot history: {e}")
 
-    # Return in reverse chronological order (newest first)
-    entries.reverse()
-
-    # Apply limit
-    if limit and limit > 0:
-        entries = entries[:limit]
-
     return {
         "history": entries,
         "total": len(entries),
@@ -742,6 +851,65 @@ async def get_snapshot_history(limit: int = 50):
     }
 
 
+def _stat_dir(path) -> os.stat_result | None:
+    """Stat ``path`` once, returning the result only if it is an existing directory."""
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return st if S_ISDIR(st.st_mode) else None
+
+
+def _find_snapshot_file(path: Path, snapshot_id: str) -> tuple[Path, os.stat_result] | None:
+    """
+    Locate the snapshot file whose stem is ``snapshot_id``.
+
+    The canonical names ``{snapshot_id}{ext}`` are probed directly; the directory is only
+    scanned when neither exists, to pick up extensions in a different case (e.g. ``.H5``).
+
+    Args:
+        path: Snapshot directory
+        snapshot_id: The snapshot ID (file stem)
+
+    Returns:
+        (path, stat result) of the snapshot file, or None if not found
+    """
+    for ext in SNAPSHOT_EXTENSIONS:
+        candidate = path / f"{snapshot_id}{ext}"
+        try:
+            st = os.stat(candidate)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        if S_ISREG(st.st_mode):
+            return candidate, st
+
+    # Prefix test first, then only the short remainder is lowercased
+    id_len = len(snapshot_id)
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name.startswith(snapshot_id) and entry.name[id_len:].lower() in _SNAPSHOT_SUFFIXES and entry.is_file():
+                return Path(entry.path), entry.stat()
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _read_h5_attrs(path: str, ino: int, mtime_ns: int, size: int) -> tuple:
+    """
+    Read HDF5 root attributes as a tuple of (name, str(value)) pairs.
+
+    Cached on the file's (inode, mtime_ns, size) so unchanged snapshots are not
+    reopened; the stat fields are only part of the cache key.
+
+    Raises:
+        ImportError: If h5py is not installed
+    """
+    import h5py
+
+    # Metadata-only read: no raw-data chunk cache, no file locking
+    with h5py.File(path, "r", rdcc_nbytes=0, locking=False) as f:
+        return tuple((k, str(v)) for k, v in f.attrs.items())
+
+
 @app.get("/api/v1/snapshots/{snapshot_id}")
 async def get_snapshot_detail(snapshot_id: str):
     """
@@ -753,11 +921,6 @@ async def get_snapshot_detail(snapshot_id: str):
     Returns:
         JSON object with snapshot metadata and optional HDF5 attributes
     """
-    from datetime import UTC, datetime
-    from pathlib import Path
-
-    from fastapi import HTTPException
-
     # Demo mode: return synthetic details
     if backend.backend_type == "demo":
         # Check session-created demo snapshots first
@@ -788,36 +951,29 @@ async def get_snapshot_detail(snapshot_id: str):
 
     # Real mode: find file in snapshots directory
     path = Path(_snapshots_dir)
-    if not path.exists():
+    if _stat_dir(path) is None:
         raise HTTPException(status_code=404, detail="Snapshot directory not found")
 
-    # Search by file stem
-    snapshot_file = next(
-        (f for f in path.iterdir() if f.is_file() and f.suffix.lower() in SNAPSHOT_EXTENSIONS and f.stem == snapshot_id),
-        None,
-    )
+    found = _find_snapshot_file(path, snapshot_id)
 
-    if not snapshot_file:
+    if not found:
         raise HTTPException(status_code=404, detail="Snapshot not found")
 
-    stat = snapshot_file.stat()
-    ts = datetime.fromtimestamp(stat.st_mtime, tz=UTC).replace(microsecond=0)
+    snapshot_file, stat = found
 
     detail = {
         "id": snapshot_file.stem,
         "name": snapshot_file.name,
-        "timestamp": f"{ts.isoformat()}Z",
+        "timestamp": _iso_z(datetime.fromtimestamp(stat.st_mtime, tz=UTC)),
         "size_bytes": stat.st_size,
         "path": str(snapshot_file.absolute()),
         "attributes": None,
     }
 
-    # Optional: if h5py is available, read HDF5 root attributes
+    # Optional: if h5py is available, read HDF5 root attributes (off the event loop; h5py blocks)
     try:
-        import h5py
-
-        with h5py.File(snapshot_file, "r") as f:
-            detail["attributes"] = {k: str(v) for k, v in f.attrs.items()}
+        attrs = await asyncio.to_thread(_read_h5_attrs, str(snapshot_file), stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        detail["attributes"] = dict(attrs)
     except ImportError:
         system_logger.debug("h5py not available, skipping HDF5 attribute extraction")
     except Exception as e:
@@ -826,8 +982,92 @@ async def get_snapshot_detail(snapshot_id: str):
     return detail
 
 
-# Session-persistent storage for demo mode snapshots (P3-1)
-_demo_snapshots: list = []
+# Session-persistent storage for demo mode snapshots (P3-1), newest first; oldest evicted past the cap
+DEMO_SNAPSHOTS_MAXLEN = 1024
+_demo_snapshots: deque = deque(maxlen=DEMO_SNAPSHOTS_MAXLEN)
+
+
+# Buffered appender for snapshot_history.jsonl. Entries accumulate in memory and reach the file
+# in whole SNAPSHOT_HISTORY_PAGE_SIZE chunks; the remainder is written by the periodic flush task,
+# a history read, or shutdown/exit.
+SNAPSHOT_HISTORY_PAGE_SIZE = 4096
+SNAPSHOT_HISTORY_FLUSH_INTERVAL = 1.0
+_history_writer: dict = {"path": None, "fd": None, "buf": bytearray()}
+_history_lock = threading.Lock()
+
+
+def _write_all(fd: int, data) -> None:
+    """os.write until all of ``data`` is written."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _history_fd(history_file: Path) -> int:
+    """Return the append fd for ``history_file``, reopening it if the snapshot dir changed.
+
+    Caller must hold ``_history_lock``.
+    """
+    if _history_writer["path"] != history_file or _history_writer["fd"] is None:
+        _close_history_fd()
+        history_file.parent.mkdir(parents=True, exist_ok=True)
+        _history_writer["fd"] = os.open(history_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_CLOEXEC", 0), 0o644)
+        _history_writer["path"] = history_file
+    return _history_writer["fd"]
+
+
+def _write_history_pages(final: bool = False) -> None:
+    """Write buffered bytes: whole pages only, or everything when ``final``. Caller must hold ``_history_lock``."""
+    buf = _history_writer["buf"]
+    fd = _history_writer["fd"]
+    if fd is None or not buf:
+        return
+    n = len(buf) if final else len(buf) - len(buf) % SNAPSHOT_HISTORY_PAGE_SIZE
+    if n:
+        try:
+            _write_all(fd, buf[:n])
+        finally:
+            del buf[:n]
+
+
+def _close_history_fd():
+    """Flush and close the history fd. Caller must hold ``_history_lock``."""
+    fd = _history_writer["fd"]
+    try:
+        _write_history_pages(final=True)
+    except OSError as e:
+        system_logger.warning(f"Failed to flush snapshot history: {e}")
+    finally:
+        _history_writer["fd"] = None
+        _history_writer["path"] = None
+        _history_writer["buf"].clear()
+        if fd is not None:
+            os.close(fd)
+
+
+def _flush_snapshot_history():
+    """Write any buffered snapshot history entries through to the file."""
+    with _history_lock:
+        try:
+            _write_history_pages(final=True)
+        except OSError as e:
+            system_logger.warning(f"Failed to flush snapshot history: {e}")
+
+
+def _close_snapshot_history():
+    """Flush and release the snapshot history fd (application shutdown and interpreter exit)."""
+    with _history_lock:
+        _close_history_fd()
+
+
+atexit.register(_close_snapshot_history)
+
+
+async def _flush_snapshot_history_periodically():
+    """Flush buffered snapshot history every SNAPSHOT_HISTORY_FLUSH_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(SNAPSHOT_HISTORY_FLUSH_INTERVAL)
+        _flush_snapshot_history()
 
 
 def _log_snapshot_activity(action: str, snapshot_id: str, details: dict = None, message: str = None):
@@ -840,10 +1080,6 @@ def _log_snapshot_activity(action: str, snapshot_id: str, details: dict = None,
         details: Additional details about the action
         message: Human-readable message
     """
-    import json
-    from datetime import UTC, datetime
-    from pathlib import Path
-
     history_file = Path(_snapshots_dir) / "snapshot_history.jsonl"
 
     entry = {
@@ -855,11 +1091,11 @@ def _log_snapshot_activity(action: str, snapshot_id: str, details: dict = None,
     }
 
     try:
-        # Ensure directory exists
-        Path(_snapshots_dir).mkdir(parents=True, exist_ok=True)
-
-        with open(history_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        line = json_dumps(entry) + b"\n"
+        with _history_lock:
+            _history_fd(history_file)
+            _history_writer["buf"] += line
+            _write_history_pages()
 
         system_logger.debug(f"Logged snapshot activity: {action} for {snapshot_id}")
     except Exception as e:
@@ -881,11 +1117,6 @@ async def create_snapshot(
     Returns:
         JSON object with the created snapshot metadata
     """
-    from datetime import UTC, datetime
-    from pathlib import Path
-
-    from fastapi import HTTPException
-
     now = datetime.now(UTC)
     timestamp_str = now.strftime("%Y%m%d_%H%M%S")
 
@@ -900,14 +1131,14 @@ async def create_snapshot(
         snapshot = {
             "id": snapshot_id,
             "name": snapshot_name,
-            "timestamp": f"{now.replace(microsecond=0).isoformat()}Z",
+            "timestamp": _iso_z(now),
             "size_bytes": size_bytes,
             "description": description or "Demo snapshot (no real HDF5 file)",
             "path": f"{_snapshots_dir}/{snapshot_name}",
         }
 
-        # Add to session-persistent demo snapshots list
-        _demo_snapshots.insert(0, snapshot)
+        # Add to session-persistent demo snapshots (newest first)
+        _demo_snapshots.appendleft(snapshot)
 
         # Log the activity
         _log_snapshot_activity(
@@ -945,9 +1176,8 @@ async def create_snapshot(
                     # Try to store current training state if available
                     if training_state:
                         state_group = f.create_group("training_state")
-                        for key, value in training_state.__dict__.items():
-                            if not key.startswith("_") and isinstance(value, (int, float, str, bool)):
-                                state_group.attrs[key] = value
+                        state = training_state.get_state()
+                        state_group.attrs.update({key: state[key] for key in TrainingState._SNAPSHOT_ATTRS if state.get(key) is not None})
 
             except ImportError as e:
                 raise HTTPException(
@@ -957,12 +1187,11 @@ async def create_snapshot(
 
         # Get file stats after creation
         stat = snapshot_path.stat()
-        ts = datetime.fromtimestamp(stat.st_mtime, tz=UTC).replace(microsecond=0)
 
         snapshot = {
             "id": snapshot_id,
             "name": snapshot_name,
-            "timestamp": f"{ts.isoformat()}Z",
+            "timestamp": _iso_z(datetime.fromtimestamp(stat.st_mtime, tz=UTC)),
             "size_bytes": stat.st_size,
             "description": description,
             "path": str(snapshot_path.absolute()),
@@ -1009,11 +1238,6 @@ async def restore_snapshot(snapshot_id: str):
         HTTPException 409: Training is currently running (must be paused/stopped)
         HTTPException 500: Restore failed
     """
-    from datetime import UTC, datetime
-    from pathlib import Path
-
-    from fastapi import HTTPException
-
     global training_state
 
     # Check if training is running - only allow restore when paused/stopped
@@ -1043,10 +1267,10 @@ async def restore_snapshot(snapshot_id: str):
 
     # Check real file system if in service mode
     if not snapshot_data and backend.backend_type == "service":
-        snapshot_path = Path(_snapshots_dir) / f"{snapshot_id}.h5"
-        if not snapshot_path.exists():
-            snapshot_path = Path(_snapshots_dir) / f"{snapshot_id}.hdf5"
-        if snapshot_path.exists():
+        snapshots_path = Path(_snapshots_dir)
+        found = _find_snapshot_file(snapshots_path, snapshot_id) if _stat_dir(snapshots_path) is not None else None
+        if found is not None:
+            snapshot_path = found[0]
             snapshot_data = {
                 "id": snapshot_id,
                 "name": snapshot_path.name,
@@ -1067,6 +1291,7 @@ async def restore_snapshot(snapshot_id: str):
         if backend.backend_type == "demo":
             # Reset demo mode state
             backend.reset_training()
+            _invalidate_status_cache()
 
             # Update training state with simulated restored values
             if training_state:
@@ -1122,11 +1347,13 @@ async def restore_snapshot(snapshot_id: str):
             # Fallback: read HDF5 file and restore state
             try:
                 import h5py
+                import numpy as np
 
                 with h5py.File(snapshot_path, "r") as f:
                     if "training_state" in f:
                         state_group = f["training_state"]
-                        restored_attrs = {key: state_group.attrs[key] for key in state_group.attrs.keys()}
+                        # h5py returns numpy scalars; unwrap them so the restored state stays JSON-serializable
+                        restored_attrs = {key: value.item() if isinstance(value, np.generic) else value for key, value in state_group.attrs.items() if key in TrainingState._SNAPSHOT_ATTRS}
                         if training_state and restored_attrs:
                             training_state.update_state(**restored_attrs)
 
@@ -1189,43 +1416,147 @@ async def restore_snapshot(snapshot_id: str):
 _layouts_dir = os.path.join(os.path.dirname(__file__), "..", "conf", "layouts")
 
 
-def _get_layouts_file() -> "Path":
-    """Get the path to the layouts JSON file."""
-    from pathlib import Path
+LAYOUT_FILE_SUFFIX = ".json"
 
-    layouts_path = Path(_layouts_dir)
-    layouts_path.mkdir(parents=True, exist_ok=True)
-    return layouts_path / "metrics_layouts.json"
+# Per-file layout summaries for list_metrics_layouts(), keyed by file name and
+# revalidated against the file's (mtime_ns, size) so unchanged bodies are not re-read.
+_layout_summary_cache: dict = {}
 
+# Store directory resolved (and created) for the current _layouts_dir, so requests skip the mkdir/stat
+_layouts_store_cache: dict = {"dir": None, "store": None}
 
-def _load_layouts() -> dict:
-    """Load all saved layouts from disk."""
-    import json
 
-    layouts_file = _get_layouts_file()
-    if layouts_file.exists():
-        try:
-            with open(layouts_file) as f:
-                return json.load(f)
-        except Exception as e:
-            system_logger.warning(f"Failed to load layouts file: {e}")
-    return {}
+def _get_layouts_store() -> "Path":
+    """
+    Get the directory holding one JSON file per layout.
+
+    The directory is created and resolved once per ``_layouts_dir`` value. On first use,
+    layouts from the legacy single-file store (metrics_layouts.json) are split into
+    per-layout files. The legacy file itself is left untouched.
+    """
+    if _layouts_store_cache["dir"] == _layouts_dir:
+        return _layouts_store_cache["store"]
+
+    store = Path(_layouts_dir) / "layouts"
+    if not store.is_dir():
+        store.mkdir(parents=True, exist_ok=True)
+        legacy_file = Path(_layouts_dir) / "metrics_layouts.json"
+        if legacy_file.exists():
+            try:
+                legacy = json_loads(legacy_file.read_bytes())
+                for name, data in legacy.items():
+                    _write_layout_file(store, name, data)
+                system_logger.info(f"Migrated {len(legacy)} layouts from {legacy_file}")
+            except Exception as e:
+                system_logger.warning(f"Failed to migrate legacy layouts file: {e}")
+    _layouts_store_cache["dir"] = _layouts_dir
+    _layouts_store_cache["store"] = store
+    return store
+
+
+def _forget_layouts_store() -> None:
+    """Drop the resolved store so the next access re-creates it (e.g. after it was removed)."""
+    _layouts_store_cache["dir"] = None
+    _layouts_store_cache["store"] = None
+
+
+def _layout_path(store: "Path", name: str) -> "Path":
+    """Map a layout name to its file, percent-encoding path separators and other unsafe characters."""
+    return store / f"{quote(name, safe='')}{LAYOUT_FILE_SUFFIX}"
+
+
+def _write_layout_file(store: "Path", name: str, data: dict) -> None:
+    """
+    Atomically write one layout (temp file + os.replace).
+
+    No fsync: layouts are UI presets, and the rename alone guarantees readers see either
+    the old or the new file, never a torn one. A failed write leaves no temp file behind.
+    """
+    path = _layout_path(store, name)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        tmp_path.write_bytes(json_dumps(data))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
-def _save_layouts(layouts: dict) -> None:
-    """Save all layouts to disk."""
-    import json
+def _load_layout(name: str) -> dict | None:
+    """Load a single layout by name, or None if it does not exist."""
+    path = _layout_path(_get_layouts_store(), name)
+    try:
+        return json_loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        system_logger.warning(f"Failed to load layout file {path}: {e}")
+        return None
+
 
-    layouts_file = _get_layouts_file()
+def _save_layout(name: str, data: dict) -> None:
+    """Save one layout to disk."""
     try:
-        with open(layouts_file, "w") as f:
-            json.dump(layouts, f, indent=2)
-            f.write("\n")
+        try:
+            _write_layout_file(_get_layouts_store(), name, data)
+        except FileNotFoundError:
+            # Store directory was removed behind our back; recreate it and retry once
+            _forget_layouts_store()
+            _write_layout_file(_get_layouts_store(), name, data)
     except Exception as e:
-        system_logger.error(f"Failed to save layouts file: {e}")
+        system_logger.error(f"Failed to save layout file: {e}")
         raise
 
 
+def _delete_layout(name: str) -> bool:
+    """Delete one layout from disk. Returns False if it did not exist."""
+    path = _layout_path(_get_layouts_store(), name)
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        system_logger.error(f"Failed to delete layout file: {e}")
+        raise
+    return True
+
+
+def _list_layout_summaries() -> list:
+    """List name/created/description for every stored layout."""
+    summaries = []
+    seen = set()
+    try:
+        it = os.scandir(_get_layouts_store())
+    except FileNotFoundError:
+        _forget_layouts_store()
+        it = os.scandir(_get_layouts_store())
+    with it:
+        for entry in it:
+            if not entry.name.endswith(LAYOUT_FILE_SUFFIX) or not entry.is_file():
+                continue
+            seen.add(entry.name)
+            st = entry.stat()
+            cached = _layout_summary_cache.get(entry.name)
+            if cached is None or cached[0] != (st.st_mtime_ns, st.st_size):
+                try:
+                    with open(entry.path, "rb") as f:
+                        data = json_loads(f.read())
+                except Exception as e:
+                    system_logger.warning(f"Failed to load layout file {entry.path}: {e}")
+                    continue
+                summary = {
+                    "name": unquote(entry.name[: -len(LAYOUT_FILE_SUFFIX)]),
+                    "created": data.get("created"),
+                    "description": data.get("description", ""),
+                }
+                cached = ((st.st_mtime_ns, st.st_size), summary)
+                _layout_summary_cache[entry.name] = cached
+            summaries.append(dict(cached[1]))
+    for stale in _layout_summary_cache.keys() - seen:
+        del _layout_summary_cache[stale]
+    return summaries
+
+
 @app.get("/api/v1/metrics/layouts")
 async def list_metrics_layouts():
     """
@@ -1234,16 +1565,7 @@ async def list_metrics_layouts():
     Returns:
         JSON object with list of layout names and metadata
     """
-    layouts = _load_layouts()
-
-    layout_list = [
-        {
-            "name": name,
-            "created": data.get("created"),
-            "description": data.get("description", ""),
-        }
-        for name, data in layouts.items()
-    ]
+    layout_list = _list_layout_summaries()
 
     return {
         "layouts": sorted(layout_list, key=lambda x: x.get("created", ""), reverse=True),
@@ -1262,14 +1584,12 @@ async def get_metrics_layout(name: str):
     Returns:
         JSON object with layout configuration
     """
-    from fastapi import HTTPException
-
-    layouts = _load_layouts()
+    layout = _load_layout(name)
 
-    if name not in layouts:
+    if layout is None:
         raise HTTPException(status_code=404, detail=f"Layout '{name}' not found")
 
-    return layouts[name]
+    return layout
 
 
 @app.post("/api/v1/metrics/layouts", status_code=201)
@@ -1295,17 +1615,11 @@ async def save_metrics_layout(
     Returns:
         JSON object confirming save with layout metadata
     """
-    from datetime import UTC, datetime
-
-    from fastapi import HTTPException
-
     if not name or not name.strip():
         raise HTTPException(status_code=400, detail="Layout name is required")
 
     name = name.strip()
 
-    layouts = _load_layouts()
-
     now = datetime.now(UTC)
 
     layout_data = {
@@ -1318,10 +1632,8 @@ async def save_metrics_layout(
         "hyperparameters": hyperparameters or {},
     }
 
-    layouts[name] = layout_data
-
     try:
-        _save_layouts(layouts)
+        _save_layout(name, layout_data)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save layout: {e}") from e
 
@@ -1345,20 +1657,14 @@ async def delete_metrics_layout(name: str):
     Returns:
         JSON object confirming deletion
     """
-    from fastapi import HTTPException
-
-    layouts = _load_layouts()
-
-    if name not in layouts:
-        raise HTTPException(status_code=404, detail=f"Layout '{name}' not found")
-
-    del layouts[name]
-
     try:
-        _save_layouts(layouts)
+        deleted = _delete_layout(name)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete layout: {e}") from e
 
+    if not deleted:
+        raise HTTPException(status_code=404, detail=f"Layout '{name}' not found")
+
     system_logger.info(f"Deleted metrics layout: {name}")
 
     return {
@@ -1386,8 +1692,6 @@ async def get_redis_status():
     Returns:
         JSON object with status, mode, message, and details
     """
-    from backend.redis_client import get_redis_client
-
     client = get_redis_client()
     return client.get_status()
 
@@ -1403,8 +1707,6 @@ async def get_redis_metrics():
     Returns:
         JSON object with status, mode, message, and metrics
     """
-    from backend.redis_client import get_redis_client
-
     client = get_redis_client()
     return client.get_metrics()
 
@@ -1415,11 +1717,12 @@ async def get_redis_metrics():
 
 
 @app.get("/api/v1/cassandra/status")
-async def get_cassandra_status():
+async def get_cassandra_status(request: Request):
     """
     Get Cassandra cluster health and availability status (P3-7).
 
-    Always returns HTTP 200 with a 'status' field:
+    Carries a weak ETag; a matching If-None-Match gets 304 Not Modified.
+    Otherwise returns HTTP 200 with a 'status' field:
     - DISABLED: Feature disabled via config or missing driver
     - UNAVAILABLE: Enabled but cannot connect
     - UP: Cluster connection is healthy
@@ -1428,10 +1731,8 @@ async def get_cassandra_status():
     Returns:
         JSON object with status, mode, message, and details (hosts, keyspace, etc.)
     """
-    from backend.cassandra_client import get_cassandra_client
-
     client = get_cassandra_client()
-    return client.get_status()
+    return _conditional_json_response(request, *_json_etag(client.get_status()))
 
 
 @app.get("/api/v1/cassandra/metrics")
@@ -1445,8 +1746,6 @@ async def get_cassandra_metrics():
     Returns:
         JSON object with status, mode, message, and metrics
     """
-    from backend.cassandra_client import get_cassandra_client
-
     client = get_cassandra_client()
     return client.get_metrics()
 
@@ -1460,12 +1759,11 @@ async def ws_endpoint(websocket: WebSocket):
     await websocket_manager.connect(websocket)
     try:
         while True:
-            try:
-                await websocket.receive_text()
-            except Exception:
-                # Ignore non-text frames (pings, pongs, binary)
-                await asyncio.sleep(10)
-    except WebSocketDisconnect:
+            # receive() yields every frame type without raising; inbound text and binary frames are ignored
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+    finally:
         websocket_manager.disconnect(websocket)
 
 
@@ -1478,11 +1776,10 @@ async def api_train_start(reset: bool = False):
     Returns:
         Training status
     """
-    from communication.websocket_manager import create_control_ack_message
-
     result = backend.start_training(reset=reset)
+    _invalidate_status_cache()
     message = "Training started successfully"
-    schedule_broadcast(websocket_manager.broadcast(create_control_ack_message("start", True, message)))
+    await websocket_manager.broadcast(create_control_ack_message("start", True, message))
     return {"status": "started", **result}
 
 
@@ -1493,10 +1790,9 @@ async def api_train_pause():
     Returns:
         Training status
     """
-    from communication.websocket_manager import create_control_ack_message
-
     backend.pause_training()
-    schedule_broadcast(websocket_manager.broadcast(create_control_ack_message("pause", True, "Training paused")))
+    _invalidate_status_cache()
+    await websocket_manager.broadcast(create_control_ack_message("pause", True, "Training paused"))
     return {"status": "paused"}
 
 
@@ -1507,10 +1803,9 @@ async def api_train_resume():
     Returns:
         Training status
     """
-    from communication.websocket_manager import create_control_ack_message
-
     backend.resume_training()
-    schedule_broadcast(websocket_manager.broadcast(create_control_ack_message("resume", True, "Training resumed")))
+    _invalidate_status_cache()
+    await websocket_manager.broadcast(create_control_ack_message("resume", True, "Training resumed"))
     return {"status": "running"}
 
 
@@ -1521,10 +1816,9 @@ async def api_train_stop():
     Returns:
         Training status
     """
-    from communication.websocket_manager import create_control_ack_message
-
     backend.stop_training()
-    schedule_broadcast(websocket_manager.broadcast(create_control_ack_message("stop", True, "Training stopped")))
+    _invalidate_status_cache()
+    await websocket_manager.broadcast(create_control_ack_message("stop", True, "Training stopped"))
     return {"status": "stopped"}
 
 
@@ -1535,51 +1829,55 @@ async def api_train_reset():
     Returns:
         Training status with reset state
     """
-    from communication.websocket_manager import create_control_ack_message
-
     result = backend.reset_training()
-    schedule_broadcast(websocket_manager.broadcast(create_control_ack_message("reset", True, "Training reset")))
+    _invalidate_status_cache()
+    await websocket_manager.broadcast(create_control_ack_message("reset", True, "Training reset"))
     return {"status": "reset", **result}
 
 
 @app.get("/api/train/status")
-async def api_train_status():
+async def api_train_status(request: Request):
     """
     Get current training status (P1-NEW-003).
+
+    Carries a weak ETag; a matching If-None-Match gets 304 Not Modified.
     Returns:
         Training status dictionary with network info and training state.
     """
-    return {"backend": backend.backend_type, **backend.get_status()}
+    now = time.monotonic()
+    if _status_cache["backend"] is not backend or now - _status_cache["ts"] >= STATUS_CACHE_TTL:
+        body, etag = _json_etag({"backend": backend.backend_type, **backend.get_status()})
+        _status_cache.update(ts=now, backend=backend, body=body, etag=etag)
+    return _conditional_json_response(request, _status_cache["body"], _status_cache["etag"])
+
+
+class SetParamsRequest(BaseModel):
+    """Request body for /api/set_params; omitted fields are left unchanged."""
+
+    learning_rate: float | None = None
+    max_hidden_units: int | None = None
+    max_epochs: int | None = None
 
 
 @app.post("/api/set_params")
-async def api_set_params(params: dict):
+async def api_set_params(params: SetParamsRequest):
     """
     Set training parameters (learning rate, max hidden units).
     Args:
-        params: Dictionary containing parameters to update
+        params: Parameters to update (validated by FastAPI; invalid values are rejected with 422)
     Returns:
         Updated training state
     """
     try:
-        learning_rate = params.get("learning_rate")
-        max_hidden_units = params.get("max_hidden_units")
-        max_epochs = params.get("max_epochs")
-
         # Update TrainingState with all provided parameters
-        updates = {}
-        if learning_rate is not None:
-            updates["learning_rate"] = float(learning_rate)
-        if max_hidden_units is not None:
-            updates["max_hidden_units"] = int(max_hidden_units)
-        if max_epochs is not None:
-            updates["max_epochs"] = int(max_epochs)
+        updates = params.model_dump(exclude_none=True)
 
         if not updates:
-            return JSONResponse({"error": "No parameters provided"}, status_code=400)
+            return FastJSONResponse({"error": "No parameters provided"}, status_code=400)
 
         training_state.update_state(**updates)
         backend.apply_params(**updates)
+        _invalidate_status_cache()
         system_logger.info(f"Parameters updated: {updates}")
 
         # Broadcast state change
@@ -1588,7 +1886,7 @@ async def api_set_params(params: dict):
         return {"status": "success", "state": training_state.get_state()}
     except Exception as e:
         system_logger.error(f"Failed to set parameters: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return FastJSONResponse({"error": str(e)}, status_code=500)
 
 
 # =========================================================================
@@ -1620,15 +1918,15 @@ async def api_remote_connect(host: str, port: int, authkey: str):
         Connection status.
     """
     if backend.backend_type != "service" or not hasattr(backend, "_adapter"):
-        return JSONResponse({"error": "Not available in demo mode"}, status_code=503)
+        return FastJSONResponse({"error": "Not available in demo mode"}, status_code=503)
 
     try:
         success = backend._adapter.connect_remote_workers((host, port), authkey)
         if success:
             return {"status": "connected", "address": f"{host}:{port}"}
-        return JSONResponse({"error": "Connection failed"}, status_code=500)
+        return FastJSONResponse({"error": "Connection failed"}, status_code=500)
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return FastJSONResponse({"error": str(e)}, status_code=500)
 
 
 @app.post("/api/remote/start_workers")
@@ -1641,12 +1939,12 @@ async def api_remote_start_workers(num_workers: int = 1):
         Worker start status.
     """
     if backend.backend_type != "service" or not hasattr(backend, "_adapter"):
-        return JSONResponse({"error": "Not available in demo mode"}, status_code=503)
+        return FastJSONResponse({"error": "Not available in demo mode"}, status_code=503)
 
     success = backend._adapter.start_remote_workers(num_workers)
     if success:
         return {"status": "started", "num_workers": num_workers}
-    return JSONResponse({"error": "Failed to start workers"}, status_code=500)
+    return FastJSONResponse({"error": "Failed to start workers"}, status_code=500)
 
 
 @app.post("/api/remote/stop_workers")
@@ -1659,12 +1957,12 @@ async def api_remote_stop_workers(timeout: int = 10):
         Worker stop status.
     """
     if backend.backend_type != "service" or not hasattr(backend, "_adapter"):
-        return JSONResponse({"error": "Not available in demo mode"}, status_code=503)
+        return FastJSONResponse({"error": "Not available in demo mode"}, status_code=503)
 
     success = backend._adapter.stop_remote_workers(timeout)
     if success:
         return {"status": "stopped"}
-    return JSONResponse({"error": "Failed to stop workers"}, status_code=500)
+    return FastJSONResponse({"error": "Failed to stop workers"}, status_code=500)
 
 
 @app.post("/api/remote/disconnect")
@@ -1675,12 +1973,12 @@ async def api_remote_disconnect():
         Disconnection status.
     """
     if backend.backend_type != "service" or not hasattr(backend, "_adapter"):
-        return JSONResponse({"error": "Not available in demo mode"}, status_code=503)
+        return FastJSONResponse({"error": "Not available in demo mode"}, status_code=503)
 
     success = backend._adapter.disconnect_remote_workers()
     if success:
         return {"status": "disconnected"}
-    return JSONResponse({"error": "Failed to disconnect"}, status_code=500)
+    return FastJSONResponse({"error": "Failed to disconnect"}, status_code=500)
 
 
 # Dash app is automatically mounted at /dashboard/ via DashboardManager
@@ -1698,8 +1996,10 @@ def main():
     system_logger.info(f"WebSocket endpoint: ws://{host}:{port}/ws")
     system_logger.info(f"API documentation: http://{host}:{port}/docs")
 
-    # Run server
-    uvicorn.run(app, host=host, port=port, log_level="info" if debug else "warning")
+    # Run server. uvicorn[standard] installs uvloop and httptools, which loop/http="auto" select whenever they
+    # import (asyncio/h11 otherwise, e.g. on Windows). A single worker process is deliberate: WebSocket clients,
+    # the broadcast queue and training state all live in this process. Per-request access logging only in debug.
+    uvicorn.run(app, host=host, port=port, loop="auto", http="auto", log_level="info" if debug else "warning", access_log=debug)
 
 
 if __name__ == "__main__":
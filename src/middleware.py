@@ -1,15 +1,17 @@
 """FastAPI middleware for security and request processing.
 
 Applies API key authentication and rate limiting to non-exempt paths.
-WebSocket upgrade requests are not intercepted by BaseHTTPMiddleware,
-so /ws/* paths are inherently exempt.
+Only "http" scopes are checked; WebSocket and lifespan scopes are passed
+straight through, so /ws/* paths are inherently exempt.
 """
 
-from fastapi import HTTPException, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import JSONResponse
-from starlette.types import ASGIApp
+import re
 
+from fastapi import HTTPException, Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from fast_json import FastJSONResponse
 from security import APIKeyAuth, RateLimiter
 
 EXEMPT_PATH_PREFIXES = ("/dashboard",)
@@ -27,12 +29,17 @@ EXEMPT_PATHS = {
     "/metrics",
 }
 
+# Exact paths and whole-segment prefixes (/dashboard, /dashboard/...) folded into one pattern
+_EXEMPT_RE = re.compile("|".join([*(re.escape(path) for path in sorted(EXEMPT_PATHS)), *(re.escape(prefix) + "(?:/.*)?" for prefix in EXEMPT_PATH_PREFIXES)]), re.DOTALL)
+
 
-class SecurityMiddleware(BaseHTTPMiddleware):
+class SecurityMiddleware:
     """Middleware for API key authentication and rate limiting.
 
     Applies authentication and rate limiting to all requests except
-    explicitly exempt paths (health checks, docs, dashboard).
+    explicitly exempt paths (health checks, docs, dashboard). Implemented as
+    a pure ASGI middleware so requests are not bridged through the
+    BaseHTTPMiddleware task group and response streams.
     """
 
     def __init__(
@@ -48,57 +55,70 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             api_key_auth: API key authentication handler.
             rate_limiter: Rate limiter instance.
         """
-        super().__init__(app)
+        self.app = app
         self._api_key_auth = api_key_auth
         self._rate_limiter = rate_limiter
-
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
+        # Both flags are fixed at construction; cache them so the per-request path skips the property lookups
+        self._auth_enabled = api_key_auth.enabled
+        self._rate_limit_enabled = rate_limiter.enabled
+        self._enabled = self._auth_enabled or self._rate_limit_enabled
+        # The limit never changes, so its header is encoded once
+        self._limit_header = (b"x-ratelimit-limit", str(rate_limiter.limit).encode("latin-1"))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request through security checks.
 
         Args:
-            request: The incoming request.
-            call_next: The next middleware/handler in the chain.
-
-        Returns:
-            The response from the application.
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
         """
-        path = request.url.path
-
-        if self._is_exempt(path):
-            return await call_next(request)
+        if not self._enabled or scope["type"] != "http" or self._is_exempt(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
+        request = Request(scope)
         api_key = None
         try:
-            if self._api_key_auth.enabled:
+            if self._auth_enabled:
                 api_key = await self._api_key_auth(request)
 
-            if self._rate_limiter.enabled:
+            if self._rate_limit_enabled:
                 await self._rate_limiter(request, api_key)
         except HTTPException as exc:
-            return JSONResponse(
+            response = FastJSONResponse(
                 status_code=exc.status_code,
                 content={"detail": exc.detail},
                 headers=exc.headers,
             )
+            await response(scope, receive, send)
+            return
+
+        if not self._rate_limit_enabled:
+            await self.app(scope, receive, send)
+            return
 
-        response = await call_next(request)
+        # An enabled RateLimiter always records remaining/reset on request.state before returning
+        rate_limit_headers = (
+            self._limit_header,
+            (b"x-ratelimit-remaining", b"%d" % request.state.rate_limit_remaining),
+            (b"x-ratelimit-reset", b"%d" % request.state.rate_limit_reset),
+        )
 
-        if self._rate_limiter.enabled and hasattr(request.state, "rate_limit_remaining"):
-            response.headers["X-RateLimit-Limit"] = str(self._rate_limiter.limit)
-            response.headers["X-RateLimit-Remaining"] = str(request.state.rate_limit_remaining)
-            response.headers["X-RateLimit-Reset"] = str(request.state.rate_limit_reset)
+        async def send_with_rate_limit_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Append pre-encoded raw headers; the app never sets X-RateLimit-* itself
+                MutableHeaders(scope=message).raw.extend(rate_limit_headers)
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_rate_limit_headers)
 
     def _is_exempt(self, path: str) -> bool:
         """Check if a path is exempt from security checks.
 
         Exempt paths include exact matches (health, docs) and prefix
-        matches (/dashboard/* for Dash app and its static assets).
+        matches (/dashboard/* for Dash app and its static assets), checked
+        with a single precompiled regex.
 
         Args:
             path: The request path.
@@ -106,6 +126,4 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         Returns:
             True if the path is exempt, False otherwise.
         """
-        if path in EXEMPT_PATHS:
-            return True
-        return any(path.startswith(prefix) for prefix in EXEMPT_PATH_PREFIXES)
+        return _EXEMPT_RE.fullmatch(path) is not None
@@ -9,7 +9,7 @@ Configuration is read from environment variables:
 
 import os
 import time
-from collections import defaultdict
+from collections import OrderedDict
 from threading import Lock
 
 from fastapi import HTTPException, Request, status
@@ -91,8 +91,15 @@ class RateLimiter:
 
     Tracks request counts per key within fixed time windows. Thread-safe
     implementation suitable for single-process deployments.
+
+    Counters are kept in order of their window start, so expired windows
+    sit at the front of the table and are pruned as new ones open.
+    At most ``MAX_KEYS`` keys are tracked; beyond that the oldest window is
+    evicted, which bounds memory when many distinct clients hit the API.
     """
 
+    MAX_KEYS = 100_000
+
     def __init__(
         self,
         requests_per_minute: int = 60,
@@ -109,7 +116,8 @@ class RateLimiter:
         self._limit = requests_per_minute
         self._window = window_seconds
         self._enabled = enabled
-        self._counters: dict[str, tuple[int, float]] = defaultdict(lambda: (0, 0.0))
+        self._limit_str = str(requests_per_minute)
+        self._counters: OrderedDict[str, tuple[int, float]] = OrderedDict()
         self._lock = Lock()
 
     @property
@@ -159,10 +167,12 @@ class RateLimiter:
         now = time.time()
 
         with self._lock:
-            count, window_start = self._counters[key]
+            count, window_start = self._counters.get(key, (0, 0.0))
 
             if now - window_start >= self._window:
+                self._prune(now)
                 self._counters[key] = (1, now)
+                self._counters.move_to_end(key)
                 return (True, self._limit - 1, self._window)
 
             if count >= self._limit:
@@ -172,6 +182,23 @@ class RateLimiter:
             self._counters[key] = (count + 1, window_start)
             return (True, self._limit - count - 1, int(self._window - (now - window_start)))
 
+    def _prune(self, now: float) -> None:
+        """Drop expired windows from the front of the counter table, then cap its size.
+
+        Must be called with ``self._lock`` held.
+
+        Args:
+            now: Current time, as used for window starts.
+        """
+        counters = self._counters
+        while counters:
+            key = next(iter(counters))
+            if now - counters[key][1] < self._window:
+                break
+            del counters[key]
+        while len(counters) >= self.MAX_KEYS:
+            counters.popitem(last=False)
+
     async def __call__(self, request: Request, api_key: str | None = None) -> None:
         """FastAPI dependency for rate limit checking.
 
@@ -196,7 +223,7 @@ class RateLimiter:
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail=f"Rate limit exceeded. Try again in {reset_in} seconds.",
                 headers={
-                    "X-RateLimit-Limit": str(self._limit),
+                    "X-RateLimit-Limit": self._limit_str,
                     "X-RateLimit-Remaining": "0",
                     "X-RateLimit-Reset": str(reset_in),
                     "Retry-After": str(reset_in),
@@ -347,11 +347,11 @@ def sample_dataset() -> Dict[str, Any]:
     """
     import numpy as np
 
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n_samples = 100
 
     # Generate XOR-like dataset
-    X = np.random.randn(n_samples, 2)
+    X = rng.standard_normal((n_samples, 2))
     y = ((X[:, 0] > 0) ^ (X[:, 1] > 0)).astype(int)
 
     return {
@@ -422,23 +422,31 @@ logging:
     return config_file
 
 
-# Preserve metrics_layouts.json across test runs (tests create/delete layouts via the real file)
+# Preserve saved layouts across test runs (tests create/delete layouts via the real store)
 @pytest.fixture(scope="session", autouse=True)
-def preserve_metrics_layouts():
-    """Backup and restore conf/layouts/metrics_layouts.json so tests don't pollute the working tree."""
+def preserve_metrics_layouts(tmp_path_factory):
+    """Backup and restore conf/layouts (legacy metrics_layouts.json and the per-layout store) so tests don't pollute the working tree."""
     import shutil
 
-    layouts_file = Path(__file__).resolve().parents[2] / "conf" / "layouts" / "metrics_layouts.json"
+    layouts_dir = Path(__file__).resolve().parents[2] / "conf" / "layouts"
+    layouts_file = layouts_dir / "metrics_layouts.json"
     backup_file = layouts_file.with_suffix(".json.test-backup")
+    store_dir = layouts_dir / "layouts"
+    store_backup = tmp_path_factory.mktemp("layouts_backup") / "layouts"
 
     if layouts_file.exists():
         shutil.copy2(layouts_file, backup_file)
+    if store_dir.exists():
+        shutil.copytree(store_dir, store_backup)
 
     yield
 
     if backup_file.exists():
         shutil.copy2(backup_file, layouts_file)
         backup_file.unlink()
+    shutil.rmtree(store_dir, ignore_errors=True)
+    if store_backup.exists():
+        shutil.copytree(store_backup, store_dir)
 
 
 # Test data directory management
@@ -4,8 +4,8 @@ Unit Tests for TrainingMonitor
 Tests callback registration, event triggers, metrics buffering, and thread safety.
 """
 
-import queue
 import threading
+from collections import deque
 from datetime import datetime
 from unittest.mock import MagicMock
 
@@ -14,6 +14,8 @@ import pytest
 from backend.data_adapter import NetworkTopology, TrainingMetrics
 from backend.training_monitor import TrainingMonitor
 
+_LOCK_TYPE = type(threading.Lock())
+
 
 class FakeDataAdapter:
     """Fake DataAdapter for testing."""
@@ -53,13 +55,14 @@ class TestTrainingMonitor:
         monitor = TrainingMonitor(adapter)
 
         assert monitor.data_adapter == adapter
-        assert monitor.metrics_buffer == []
+        assert list(monitor.metrics_buffer) == []
+        assert monitor.metrics_buffer.maxlen == monitor.max_buffer_size
         assert monitor.is_training is False
         assert monitor.current_epoch == 0
         assert monitor.current_hidden_units == 0
         assert monitor.current_phase == "output"
-        assert isinstance(monitor.metrics_queue, queue.Queue)
-        assert isinstance(monitor.lock, type(threading.Lock()))
+        assert isinstance(monitor.metrics_queue, deque)
+        assert isinstance(monitor.lock, _LOCK_TYPE)
 
     def test_register_callback_valid_event(self):
         """Test register_callback for valid event types."""
@@ -97,6 +100,14 @@ class TestTrainingMonitor:
 
         monitor.logger.warning.assert_called_with("Unknown event type: unknown_event")
 
+    def test_callbacks_cover_event_types(self):
+        """Every known event type starts with its own empty callback list."""
+        monitor = TrainingMonitor(FakeDataAdapter())
+
+        assert set(monitor.callbacks) == TrainingMonitor.EVENT_TYPES
+        assert all(callbacks == [] for callbacks in monitor.callbacks.values())
+        assert len({id(callbacks) for callbacks in monitor.callbacks.values()}) == len(TrainingMonitor.EVENT_TYPES)
+
     def test_on_training_start(self):
         """Test on_training_start sets state and triggers callbacks."""
         adapter = FakeDataAdapter()
@@ -179,6 +190,19 @@ class TestTrainingMonitor:
         assert monitor.metrics_buffer[0].accuracy == 0.8
         callback.assert_called_once()
 
+    def test_epoch_events_skip_trigger_without_callbacks(self, monkeypatch):
+        """Epoch events do not build callback kwargs when no callback is registered."""
+        adapter = FakeDataAdapter()
+        monitor = TrainingMonitor(adapter)
+        trigger = MagicMock()
+        monkeypatch.setattr(monitor, "_trigger_callbacks", trigger)
+
+        monitor.on_epoch_start(epoch=1)
+        monitor.on_epoch_end(epoch=1, loss=0.5, accuracy=0.8, learning_rate=0.01)
+
+        trigger.assert_not_called()
+        assert len(monitor.metrics_buffer) == 1
+
     def test_on_epoch_end_adds_to_queue(self):
         """Test on_epoch_end adds metrics to queue."""
         adapter = FakeDataAdapter()
@@ -187,7 +211,7 @@ class TestTrainingMonitor:
         monitor.on_epoch_end(epoch=1, loss=0.5, accuracy=0.8, learning_rate=0.01)
 
         # Should be able to get from queue
-        metrics = monitor.metrics_queue.get(timeout=1.0)
+        metrics = monitor.poll_metrics_queue(timeout=1.0)
         assert metrics.epoch == 1
         assert metrics.loss == 0.5
 
@@ -206,6 +230,18 @@ class TestTrainingMonitor:
         # Should keep most recent metrics
         assert monitor.metrics_buffer[-1].epoch == 9
 
+    def test_shrinking_max_buffer_size_keeps_recent_metrics(self):
+        """Lowering max_buffer_size trims the existing buffer from the oldest end."""
+        adapter = FakeDataAdapter()
+        monitor = TrainingMonitor(adapter)
+
+        for i in range(10):
+            monitor.on_epoch_end(epoch=i, loss=0.5, accuracy=0.8, learning_rate=0.01)
+        monitor.max_buffer_size = 3
+
+        assert [m.epoch for m in monitor.metrics_buffer] == [7, 8, 9]
+        assert monitor.metrics_buffer.maxlen == 3
+
     def test_on_cascade_add(self):
         """Test on_cascade_add increments hidden units and triggers callbacks."""
         adapter = FakeDataAdapter()
@@ -280,6 +316,16 @@ class TestTrainingMonitor:
 
         assert len(recent) == 3
 
+    def test_get_recent_metrics_from_full_buffer(self):
+        """Recent metrics come from the tail of a full buffer, oldest first."""
+        monitor = TrainingMonitor(FakeDataAdapter())
+        monitor.max_buffer_size = 50
+        monitor.on_epoch_end_batch({"epoch": i, "loss": 0.5, "accuracy": 0.8, "learning_rate": 0.01} for i in range(120))
+
+        assert [m.epoch for m in monitor.get_recent_metrics(count=3)] == [117, 118, 119]
+        assert len(monitor.get_recent_metrics(count=500)) == 50
+        assert monitor.get_recent_metrics(count=0) == []
+
     def test_get_all_metrics(self):
         """Test get_all_metrics returns copy of all metrics."""
         adapter = FakeDataAdapter()
@@ -349,6 +395,43 @@ class TestTrainingMonitor:
 
         assert metrics is None
 
+    def test_poll_metrics_queue_zero_timeout_does_not_wait(self, monkeypatch):
+        """A non-blocking poll on an empty queue returns None without touching the wake-up event."""
+        monitor = TrainingMonitor(FakeDataAdapter())
+        event = MagicMock()
+        monkeypatch.setattr(monitor, "_metrics_available", event)
+
+        assert monitor.poll_metrics_queue(timeout=0) is None
+        event.clear.assert_not_called()
+        event.wait.assert_not_called()
+
+    def test_metrics_queue_is_bounded(self):
+        """Unpolled metrics are dropped oldest-first once the queue reaches max_buffer_size."""
+        adapter = FakeDataAdapter()
+        monitor = TrainingMonitor(adapter)
+        monitor.max_buffer_size = 3
+
+        for i in range(5):
+            monitor.on_epoch_end(epoch=i, loss=0.5, accuracy=0.8, learning_rate=0.01)
+
+        assert [monitor.poll_metrics_queue(timeout=0).epoch for _ in range(3)] == [2, 3, 4]
+        assert monitor.poll_metrics_queue(timeout=0) is None
+
+    def test_poll_metrics_queue_wakes_on_new_metric(self):
+        """A poller waiting on an empty queue returns as soon as a metric is produced."""
+        adapter = FakeDataAdapter()
+        monitor = TrainingMonitor(adapter)
+
+        timer = threading.Timer(0.05, monitor.on_epoch_end, kwargs={"epoch": 7, "loss": 0.5, "accuracy": 0.8, "learning_rate": 0.01})
+        timer.start()
+        try:
+            metrics = monitor.poll_metrics_queue(timeout=5.0)
+        finally:
+            timer.join()
+
+        assert metrics is not None
+        assert metrics.epoch == 7
+
     def test_thread_safety_concurrent_epoch_end(self):
         """Test on_epoch_end is thread-safe with concurrent access."""
         adapter = FakeDataAdapter()
@@ -396,8 +479,38 @@ class TestTrainingMonitor:
         monitor.max_buffer_size = 100
 
         # Add many more metrics than buffer size
-        for i in range(1000):
-            monitor.on_epoch_end(epoch=i, loss=0.5, accuracy=0.8, learning_rate=0.01)
+        monitor.on_epoch_end_batch({"epoch": i, "loss": 0.5, "accuracy": 0.8, "learning_rate": 0.01} for i in range(1000))
 
         # Buffer should never exceed max size
         assert len(monitor.metrics_buffer) <= 100
+        assert monitor.metrics_buffer[-1].epoch == 999
+
+    def test_on_epoch_end_batch_matches_single_events(self):
+        """A batch produces the same buffer, queue and callbacks as one on_epoch_end per record."""
+        records = [{"epoch": i, "loss": 0.5 - i * 0.1, "accuracy": 0.7, "learning_rate": 0.01, "validation_loss": 0.6} for i in range(3)]
+        single = TrainingMonitor(FakeDataAdapter())
+        batched = TrainingMonitor(FakeDataAdapter())
+        single_callback = MagicMock()
+        batched_callback = MagicMock()
+        single.register_callback("epoch_end", single_callback)
+        batched.register_callback("epoch_end", batched_callback)
+
+        for record in records:
+            single.on_epoch_end(**record)
+        batched.on_epoch_end_batch(records)
+
+        def fields(metrics):
+            return (metrics.epoch, metrics.loss, metrics.validation_loss, metrics.hidden_units, metrics.cascade_phase)
+
+        assert [fields(m) for m in batched.metrics_buffer] == [fields(m) for m in single.metrics_buffer]
+        assert [batched.poll_metrics_queue(timeout=0).epoch for _ in records] == [0, 1, 2]
+        assert [c.kwargs["epoch"] for c in batched_callback.call_args_list] == [c.kwargs["epoch"] for c in single_callback.call_args_list]
+
+    def test_on_epoch_end_batch_empty_is_noop(self):
+        """An empty batch leaves the monitor untouched."""
+        monitor = TrainingMonitor(FakeDataAdapter())
+
+        monitor.on_epoch_end_batch([])
+
+        assert len(monitor.metrics_buffer) == 0
+        assert monitor.poll_metrics_queue(timeout=0) is None
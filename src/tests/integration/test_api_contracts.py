@@ -13,8 +13,10 @@
 #####################################################################
 
 """API contract tests - ensure API responses match UI expectations."""
+import asyncio
 import os
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
@@ -29,6 +31,18 @@ def client():
         yield client
 
 
+@pytest.fixture(scope="module")
+def topology_response(client):
+    """Single /api/topology response shared by the topology contract tests."""
+    return client.get("/api/topology")
+
+
+@pytest.fixture(scope="module")
+def dataset_response(client):
+    """Single /api/dataset response shared by the dataset contract tests."""
+    return client.get("/api/dataset")
+
+
 class TestAPIContracts:
     """Test API response contracts match UI expectations."""
 
@@ -60,20 +74,18 @@ class TestAPIContracts:
         data = response.json()
         assert len(data["history"]) <= 5, "Must respect limit parameter"
 
-    def test_topology_returns_dict_with_connections(self, client):
+    def test_topology_returns_dict_with_connections(self, topology_response):
         """Contract: /api/topology returns dict with 'connections' not 'edges'"""
-        response = client.get("/api/topology")
-        assert response.status_code == 200
-        data = response.json()
+        assert topology_response.status_code == 200
+        data = topology_response.json()
         assert "connections" in data, "Must use 'connections' not 'edges'"
         assert "nodes" in data
         assert isinstance(data["connections"], list)
         assert isinstance(data["nodes"], list)
 
-    def test_topology_nodes_have_required_fields(self, client):
+    def test_topology_nodes_have_required_fields(self, topology_response):
         """Contract: Each node has id, type, layer"""
-        response = client.get("/api/topology")
-        data = response.json()
+        data = topology_response.json()
 
         if data["nodes"]:
             node = data["nodes"][0]
@@ -81,10 +93,9 @@ class TestAPIContracts:
             assert "type" in node
             assert "layer" in node
 
-    def test_topology_connections_have_required_fields(self, client):
+    def test_topology_connections_have_required_fields(self, topology_response):
         """Contract: Each connection has from, to, weight"""
-        response = client.get("/api/topology")
-        data = response.json()
+        data = topology_response.json()
 
         if data["connections"]:
             conn = data["connections"][0]
@@ -92,20 +103,18 @@ class TestAPIContracts:
             assert "to" in conn
             assert "weight" in conn
 
-    def test_dataset_returns_inputs_and_targets(self, client):
+    def test_dataset_returns_inputs_and_targets(self, dataset_response):
         """Contract: /api/dataset returns 'inputs'/'targets' not 'X'/'y'"""
-        response = client.get("/api/dataset")
-        assert response.status_code == 200
-        data = response.json()
+        assert dataset_response.status_code == 200
+        data = dataset_response.json()
         assert "inputs" in data, "Must use 'inputs' not 'X'"
         assert "targets" in data, "Must use 'targets' not 'y'"
         assert isinstance(data["inputs"], list)
         assert isinstance(data["targets"], list)
 
-    def test_dataset_inputs_targets_same_length(self, client):
+    def test_dataset_inputs_targets_same_length(self, dataset_response):
         """Contract: inputs and targets arrays must be same length"""
-        response = client.get("/api/dataset")
-        data = response.json()
+        data = dataset_response.json()
         assert len(data["inputs"]) == len(data["targets"])
 
     def test_current_metrics_returns_dict(self, client):
@@ -129,12 +138,15 @@ class TestAPIContracts:
         # API returns x, y, z, resolution, x_min, x_max, y_min, y_max
         assert "x" in data or "error" in data  # May not be available initially
 
-    def test_all_endpoints_return_json(self, client):
+    async def test_all_endpoints_return_json(self, client):
         """Contract: All endpoints return valid JSON"""
         endpoints = ["/api/metrics", "/api/metrics/history", "/api/topology", "/api/dataset", "/api/decision_boundary"]
 
-        for endpoint in endpoints:
-            response = client.get(endpoint)
+        # `client` keeps the app's lifespan running; probe the endpoints concurrently over ASGI
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as async_client:
+            responses = await asyncio.gather(*(async_client.get(endpoint) for endpoint in endpoints))
+
+        for response in responses:
             assert response.status_code == 200
             assert response.headers["content-type"] == "application/json"
             # Verify it's valid JSON by parsing
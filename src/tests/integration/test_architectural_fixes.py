@@ -10,19 +10,25 @@ Tests for critical fixes implemented to resolve MVP blockers:
 
 import asyncio
 import threading
-import time
-
-# from unittest.mock import Mock, MagicMock, patch
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
-import torch
+
+
+def _schedule_broadcast(loop, coro):
+    """Schedule a broadcast coroutine on loop from any thread; returns False if the loop is unavailable."""
+    if loop is None or loop.is_closed():
+        return False
+    # No Future is consumed, so skip the one run_coroutine_threadsafe would allocate
+    loop.call_soon_threadsafe(loop.create_task, coro)
+    return True
 
 
 class TestThreadSafeAsyncBroadcasting:
     """Test thread-safe async callback scheduling."""
 
-    def test_schedule_broadcast_from_thread(self):
+    @pytest.mark.asyncio
+    async def test_schedule_broadcast_from_thread(self):
         """Test that broadcasts can be scheduled from non-async threads."""
         messages = []
 
@@ -30,67 +36,48 @@ class TestThreadSafeAsyncBroadcasting:
             """Mock broadcast function."""
             messages.append(msg)
 
-        async def test_runner():
-            """Main test runner in async context."""
-            loop = asyncio.get_running_loop()
-            loop_holder = {"loop": loop}
-
-            def schedule_broadcast(coro):
-                """Helper to schedule broadcasts."""
-                if loop_holder["loop"] and not loop_holder["loop"].is_closed():  # sourcery skip: no-conditionals-in-tests
-                    asyncio.run_coroutine_threadsafe(coro, loop_holder["loop"])
-
-            def callback_from_thread():
-                """Simulate callback from training thread."""
-                schedule_broadcast(mock_broadcast({"type": "test", "data": 42}))
+        loop = asyncio.get_running_loop()
 
-            # Run callback in separate thread
-            thread = threading.Thread(target=callback_from_thread)
-            thread.start()
-            thread.join()
+        def callback_from_thread():
+            """Simulate callback from training thread."""
+            _schedule_broadcast(loop, mock_broadcast({"type": "test", "data": 42}))
 
-            # Give time for scheduled coroutine to execute
-            await asyncio.sleep(0.1)
+        # Run callback in separate thread
+        thread = threading.Thread(target=callback_from_thread)
+        thread.start()
+        thread.join()
 
-            # Verify message was broadcasted
-            assert len(messages) == 1  # trunk-ignore(bandit/B101)
-            assert messages[0]["type"] == "test"  # trunk-ignore(bandit/B101)
-            assert messages[0]["data"] == 42  # trunk-ignore(bandit/B101)
+        # Give time for scheduled coroutine to execute
+        await asyncio.sleep(0.1)
 
-        # Run the async test
-        asyncio.run(test_runner())
+        # Verify message was broadcasted
+        assert len(messages) == 1  # trunk-ignore(bandit/B101)
+        assert messages[0]["type"] == "test"  # trunk-ignore(bandit/B101)
+        assert messages[0]["data"] == 42  # trunk-ignore(bandit/B101)
 
     def test_schedule_broadcast_with_closed_loop(self):
         """Test graceful handling when event loop is closed."""
         messages = []
-        warnings = []
-
-        def mock_warning(msg):
-            warnings.append(msg)
-
-        loop_holder = {"loop": None}
-
-        def schedule_broadcast(coro):
-            """Helper that should warn when loop unavailable."""
-            if loop_holder["loop"] and not loop_holder["loop"].is_closed():  # sourcery skip: no-conditionals-in-tests
-                asyncio.run_coroutine_threadsafe(coro, loop_holder["loop"])
-            else:
-                mock_warning("Event loop not available")
 
         async def mock_broadcast(msg):
             messages.append(msg)
 
-        # Try to schedule without loop
-        coro = mock_broadcast({"type": "test"})
-        schedule_broadcast(coro)
-        # Close the unawaited coroutine to prevent warning
-        coro.close()
+        closed_loop = asyncio.new_event_loop()
+        closed_loop.close()
 
-        # Should have warning, no messages
-        assert len(warnings) == 1  # trunk-ignore(bandit/B101)
+        # Try to schedule without a loop, then on a closed one
+        for loop in (None, closed_loop):  # sourcery skip: no-loop-in-tests
+            coro = mock_broadcast({"type": "test"})
+            scheduled = _schedule_broadcast(loop, coro)
+            # Close the unawaited coroutine to prevent warning
+            coro.close()
+            assert scheduled is False  # trunk-ignore(bandit/B101)
+
+        # Nothing should have been broadcast
         assert not messages  # trunk-ignore(bandit/B101)
 
-    def test_concurrent_broadcasts_from_multiple_threads(self):
+    @pytest.mark.asyncio
+    async def test_concurrent_broadcasts_from_multiple_threads(self):
         """Test that multiple threads can schedule broadcasts concurrently."""
         messages = []
         lock = threading.Lock()
@@ -100,41 +87,33 @@ class TestThreadSafeAsyncBroadcasting:
             with lock:
                 messages.append(msg)
 
-        async def test_runner():
-            """Main test runner."""
-            loop = asyncio.get_running_loop()
-            loop_holder = {"loop": loop}
-
-            def schedule_broadcast(coro):
-                if loop_holder["loop"] and not loop_holder["loop"].is_closed():  # sourcery skip: no-conditionals-in-tests
-                    asyncio.run_coroutine_threadsafe(coro, loop_holder["loop"])
-
-            def worker(worker_id):
-                """Worker thread."""
-                for i in range(5):  # sourcery skip: no-loop-in-tests
-                    schedule_broadcast(mock_broadcast({"worker": worker_id, "iteration": i}))
-                    time.sleep(0.01)
+        loop = asyncio.get_running_loop()
 
-            # Start multiple worker threads
-            threads = [threading.Thread(target=worker, args=(i,)) for i in range(5)]
+        def worker(worker_id):
+            """Worker thread."""
+            for i in range(5):  # sourcery skip: no-loop-in-tests
+                _schedule_broadcast(loop, mock_broadcast({"worker": worker_id, "iteration": i}))
 
-            for thread in threads:  # sourcery skip: no-loop-in-tests
-                thread.start()
+        # Start multiple worker threads
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(5)]
 
-            for thread in threads:  # sourcery skip: no-loop-in-tests
-                thread.join()
+        for thread in threads:  # sourcery skip: no-loop-in-tests
+            thread.start()
 
-            # Wait for all scheduled broadcasts
-            await asyncio.sleep(0.5)
+        for thread in threads:  # sourcery skip: no-loop-in-tests
+            thread.join()
 
-            # Should have received 5 workers * 5 messages each = 25 messages
-            assert len(messages) == 25  # trunk-ignore(bandit/B101)
+        # Wait for all scheduled broadcasts, yielding to the loop until they land (bounded at 1s)
+        deadline = loop.time() + 1.0
+        while len(messages) < 25 and loop.time() < deadline:  # sourcery skip: no-loop-in-tests
+            await asyncio.sleep(0)
 
-            # Verify all workers contributed
-            worker_ids = {msg["worker"] for msg in messages}
-            assert worker_ids == {0, 1, 2, 3, 4}  # trunk-ignore(bandit/B101)
+        # Should have received 5 workers * 5 messages each = 25 messages
+        assert len(messages) == 25  # trunk-ignore(bandit/B101)
 
-        asyncio.run(test_runner())
+        # Verify all workers contributed
+        worker_ids = {msg["worker"] for msg in messages}
+        assert worker_ids == {0, 1, 2, 3, 4}  # trunk-ignore(bandit/B101)
 
 
 class TestDashMounting:
@@ -165,85 +144,76 @@ class TestAPIURLDynamicResolution:
 
     def test_callbacks_use_request_host_url(self):
         """Test that callbacks use dynamic request-based URLs instead of hardcoded URLs."""
+        import ast
         import inspect
+        import textwrap
 
         from src.frontend.dashboard_manager import DashboardManager
 
-        config = {}
-        manager = DashboardManager(config)
+        def code_nodes(method):
+            """Parse a method's source so checks see code only, not its docstring or comments."""
+            return list(ast.walk(ast.parse(textwrap.dedent(inspect.getsource(method)))))
 
-        # Get source code of _api_url helper
-        api_url_source = inspect.getsource(manager._api_url)
+        def accesses(nodes, owner, attr):
+            return any(isinstance(n, ast.Attribute) and n.attr == attr and isinstance(n.value, ast.Name) and n.value.id == owner for n in nodes)
+
+        # Parse the _api_url helper (read off the class; no DashboardManager/Dash app needs building)
+        api_url_nodes = code_nodes(DashboardManager._api_url)
 
         # Verify dynamic URL building using request.scheme and request.host (in _api_url helper)
-        assert "request.scheme" in api_url_source  # trunk-ignore(bandit/B101)
-        assert "request.host" in api_url_source  # trunk-ignore(bandit/B101)
+        assert accesses(api_url_nodes, "request", "scheme")  # trunk-ignore(bandit/B101)
+        assert accesses(api_url_nodes, "request", "host")  # trunk-ignore(bandit/B101)
 
         # Verify handler methods use the _api_url helper (check a sample handler)
         # _update_unified_status_bar_handler uses _api_url for API calls
-        handler_source = inspect.getsource(manager._update_unified_status_bar_handler)
-        assert "_api_url" in handler_source  # trunk-ignore(bandit/B101)
+        handler_nodes = code_nodes(DashboardManager._update_unified_status_bar_handler)
+        assert accesses(handler_nodes, "self", "_api_url")  # trunk-ignore(bandit/B101)
 
-        # Verify no hardcoded URLs in handler methods
-        assert "http://127.0.0.1:8050" not in handler_source  # trunk-ignore(bandit/B101)
+        # Verify no hardcoded URLs in handler string literals
+        literals = [n.value for n in handler_nodes if isinstance(n, ast.Constant) and isinstance(n.value, str)]
+        assert not any("http://127.0.0.1:8050" in literal for literal in literals)  # trunk-ignore(bandit/B101)
 
 
 class TestConfigurationManagement:
     """Test configuration management robustness."""
 
-    def test_config_manager_handles_missing_file(self):
+    def test_config_manager_handles_missing_file(self, monkeypatch):
         """Test that ConfigManager handles missing config file gracefully."""
         import os
 
         from src.config_manager import ConfigManager
 
-        # Save and clear any CASCOR environment variables
-        cascor_env_backup = {k: v for k, v in os.environ.items() if k.startswith("CASCOR_")}
-        for key in cascor_env_backup:  # sourcery skip: no-loop-in-tests
-            del os.environ[key]
-
-        try:
-            with patch("pathlib.Path.exists", return_value=False):
-                config = ConfigManager("/nonexistent/config.yaml")
-
-                # Should return default values
-                assert config.get("application.name", "default") == "default"  # trunk-ignore(bandit/B101)
-                # Config should have defaults applied when no file exists
-                assert config.config is not None  # trunk-ignore(bandit/B101)
-                assert config.get("application.server.port") == 8050  # trunk-ignore(bandit/B101)
-        finally:
-            # Restore environment variables
-            for key, value in cascor_env_backup.items():  # sourcery skip: no-loop-in-tests
-                os.environ[key] = value
-
-    def test_environment_variable_overrides(self):
+        # Clear any CASCOR environment variables (monkeypatch restores them after the test)
+        for key in [k for k in os.environ if k.startswith("CASCOR_")]:  # sourcery skip: no-loop-in-tests
+            monkeypatch.delenv(key)
+
+        with patch("pathlib.Path.exists", return_value=False):
+            config = ConfigManager("/nonexistent/config.yaml")
+
+            # Should return default values
+            assert config.get("application.name", "default") == "default"  # trunk-ignore(bandit/B101)
+            # Config should have defaults applied when no file exists
+            assert config.config is not None  # trunk-ignore(bandit/B101)
+            assert config.get("application.server.port") == 8050  # trunk-ignore(bandit/B101)
+
+    def test_environment_variable_overrides(self, monkeypatch):
         """Test that environment variables override config values."""
         import os
 
         from src.config_manager import ConfigManager
 
-        # Save and clear any CASCOR environment variables
-        cascor_env_backup = {k: v for k, v in os.environ.items() if k.startswith("CASCOR_")}
-        for key in cascor_env_backup:  # sourcery skip: no-loop-in-tests
-            del os.environ[key]
-
-        try:
-            with patch("pathlib.Path.exists", return_value=False):
-                # Set environment variable
-                os.environ["CASCOR_SERVER_PORT"] = "9000"
+        # Clear any CASCOR environment variables (monkeypatch restores them after the test)
+        for key in [k for k in os.environ if k.startswith("CASCOR_")]:  # sourcery skip: no-loop-in-tests
+            monkeypatch.delenv(key)
 
-                config = ConfigManager("/nonexistent/config.yaml")
+        with patch("pathlib.Path.exists", return_value=False):
+            # Set environment variable
+            monkeypatch.setenv("CASCOR_SERVER_PORT", "9000")
 
-                # Should apply environment override
-                assert config.get("server.port", 8050) == 9000  # trunk-ignore(bandit/B101)
+            config = ConfigManager("/nonexistent/config.yaml")
 
-        finally:
-            # Clean up - restore all original env vars
-            for key in [k for k in os.environ if k.startswith("CASCOR_")]:  # sourcery skip: no-loop-in-tests
-                if key not in cascor_env_backup:
-                    del os.environ[key]
-            for key, value in cascor_env_backup.items():  # sourcery skip: no-loop-in-tests
-                os.environ[key] = value
+            # Should apply environment override
+            assert config.get("server.port", 8050) == 9000  # trunk-ignore(bandit/B101)
 
 
 if __name__ == "__main__":
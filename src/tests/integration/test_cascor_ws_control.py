@@ -55,10 +55,8 @@ import main as main_module
 from main import app
 
 
-@pytest.fixture
-def mock_service_backend():
-    """Create a mock BackendProtocol with service-mode defaults."""
-    mock = MagicMock()
+def _apply_service_defaults(mock):
+    """Set the service-mode return values on a BackendProtocol mock."""
     mock.backend_type = "service"
     mock.start_training.return_value = {"ok": True, "is_training": True}
     mock.stop_training.return_value = {"ok": True}
@@ -67,20 +65,40 @@ def mock_service_backend():
     mock.reset_training.return_value = {"ok": False, "error": "Reset not yet supported in service mode"}
     mock.get_status.return_value = {"is_training": False, "network_connected": True}
     mock.is_training_active.return_value = False
+
+
+@pytest.fixture(scope="module")
+def mock_service_backend():
+    """Create a mock BackendProtocol with service-mode defaults, shared across the module."""
+    mock = MagicMock()
+    _apply_service_defaults(mock)
     return mock
 
 
+@pytest.fixture(autouse=True)
+def _reset_service_backend(mock_service_backend):
+    """Clear recorded calls and side effects so each test sees a fresh service backend."""
+    mock_service_backend.reset_mock(return_value=True, side_effect=True)
+    _apply_service_defaults(mock_service_backend)
+
+
+@pytest.fixture(scope="module")
+def app_client():
+    """TestClient whose lifespan is entered once for the whole module."""
+    with TestClient(app) as client:
+        yield client
+
+
 @pytest.fixture
-def cascor_client(mock_service_backend):
+def cascor_client(app_client, mock_service_backend):
     """
     TestClient with backend patched to simulate service mode.
     """
-    with TestClient(app) as client:
-        # Set mock AFTER lifespan runs (lifespan creates the real backend)
-        original_backend = main_module.backend
-        main_module.backend = mock_service_backend
-        yield client
-        main_module.backend = original_backend
+    # Set mock AFTER lifespan runs (lifespan creates the real backend)
+    original_backend = main_module.backend
+    main_module.backend = mock_service_backend
+    yield app_client
+    main_module.backend = original_backend
 
 
 def _send_ws_command(client, command, **extra):
@@ -92,17 +110,31 @@ def _send_ws_command(client, command, **extra):
         return ws.receive_json()
 
 
+# (command, BackendProtocol method, extra payload) for the happy-path dispatch test
+_DISPATCH_CASES = [
+    ("start", "start_training", {"reset": True}),
+    ("stop", "stop_training", {}),
+    ("pause", "pause_training", {}),
+    ("resume", "resume_training", {}),
+    ("reset", "reset_training", {}),
+]
+
+
 class TestCascorWsControl:
     """Integration tests for service-mode WebSocket control commands via BackendProtocol."""
 
     @pytest.mark.integration
-    def test_service_start_command_calls_protocol(self, cascor_client, mock_service_backend):
-        """'start' command calls backend.start_training() and returns ok."""
-        response = _send_ws_command(cascor_client, "start")
-
-        assert response["ok"] is True
-        assert response["command"] == "start"
-        mock_service_backend.start_training.assert_called_once_with(reset=True)
+    def test_service_command_dispatches(self, cascor_client, mock_service_backend):
+        """Each happy-path command reaches its BackendProtocol method over one /ws/control session."""
+        with cascor_client.websocket_connect("/ws/control") as ws:
+            ws.receive_json()
+            for command, backend_attr, extra in _DISPATCH_CASES:  # sourcery skip: no-loop-in-tests
+                ws.send_text(json.dumps({"command": command, **extra}))
+                response = ws.receive_json()
+
+                assert response["ok"] is True, command
+                assert response["command"] == command
+                getattr(mock_service_backend, backend_attr).assert_called_once_with(**extra)
 
     @pytest.mark.integration
     def test_service_start_with_reset_false(self, cascor_client, mock_service_backend):
@@ -112,42 +144,6 @@ class TestCascorWsControl:
         assert response["ok"] is True
         mock_service_backend.start_training.assert_called_once_with(reset=False)
 
-    @pytest.mark.integration
-    def test_service_stop_command_calls_protocol(self, cascor_client, mock_service_backend):
-        """'stop' command calls backend.stop_training()."""
-        response = _send_ws_command(cascor_client, "stop")
-
-        assert response["ok"] is True
-        assert response["command"] == "stop"
-        mock_service_backend.stop_training.assert_called_once()
-
-    @pytest.mark.integration
-    def test_service_pause_command_calls_protocol(self, cascor_client, mock_service_backend):
-        """'pause' command calls backend.pause_training()."""
-        response = _send_ws_command(cascor_client, "pause")
-
-        assert response["ok"] is True
-        assert response["command"] == "pause"
-        mock_service_backend.pause_training.assert_called_once()
-
-    @pytest.mark.integration
-    def test_service_resume_command_calls_protocol(self, cascor_client, mock_service_backend):
-        """'resume' command calls backend.resume_training()."""
-        response = _send_ws_command(cascor_client, "resume")
-
-        assert response["ok"] is True
-        assert response["command"] == "resume"
-        mock_service_backend.resume_training.assert_called_once()
-
-    @pytest.mark.integration
-    def test_service_reset_command_calls_protocol(self, cascor_client, mock_service_backend):
-        """'reset' command calls backend.reset_training()."""
-        response = _send_ws_command(cascor_client, "reset")
-
-        assert response["ok"] is True
-        assert response["command"] == "reset"
-        mock_service_backend.reset_training.assert_called_once()
-
     @pytest.mark.integration
     def test_service_unknown_command_returns_error(self, cascor_client, mock_service_backend):
         """Unknown command returns an error response."""
@@ -160,8 +156,10 @@ class TestCascorWsControl:
     def test_service_command_exception_returns_error(self, cascor_client, mock_service_backend):
         """Exception in command handler returns error to client."""
         mock_service_backend.start_training.side_effect = RuntimeError("Test error")
-
-        response = _send_ws_command(cascor_client, "start")
+        try:
+            response = _send_ws_command(cascor_client, "start")
+        finally:
+            mock_service_backend.start_training.side_effect = None
 
         assert response["ok"] is False
         assert "Test error" in response.get("error", "")
@@ -56,6 +56,17 @@ class TestCassandraStatusEndpoint:
         data = response.json()
         assert isinstance(data, dict)
 
+    @pytest.mark.integration
+    def test_status_endpoint_honors_if_none_match(self, client):
+        """A repeat poll with the returned ETag gets 304 while the cached status is unchanged."""
+        response = client.get("/api/v1/cassandra/status")
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "no-cache"
+
+        revalidated = client.get("/api/v1/cassandra/status", headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+
     @pytest.mark.integration
     def test_status_response_has_status_field(self, client):
         """Status response should contain 'status' field."""
@@ -3,7 +3,6 @@
 Comprehensive integration tests for main.py to improve coverage.
 
 Targets uncovered areas:
-- schedule_broadcast helper function
 - WebSocket endpoints edge cases
 - API endpoints with edge cases
 - Error handling paths
@@ -14,7 +13,7 @@ Targets uncovered areas:
 import os
 import sys
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -26,7 +25,7 @@ if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
 import main as main_module  # noqa: E402
-from main import app, schedule_broadcast  # noqa: E402
+from main import app  # noqa: E402
 
 
 @pytest.fixture
@@ -36,45 +35,6 @@ def client():
         yield test_client
 
 
-# =============================================================================
-# schedule_broadcast() Tests
-# =============================================================================
-
-
-class TestScheduleBroadcast:
-    """Test schedule_broadcast helper function."""
-
-    @pytest.mark.unit
-    def test_schedule_broadcast_with_no_loop(self):
-        """schedule_broadcast should handle missing event loop gracefully."""
-        import main
-
-        original_loop = main.loop_holder["loop"]
-
-        try:
-            main.loop_holder["loop"] = None
-            schedule_broadcast(AsyncMock())
-        finally:
-            main.loop_holder["loop"] = original_loop
-
-    @pytest.mark.unit
-    def test_schedule_broadcast_with_closed_loop(self):
-        """schedule_broadcast should handle closed event loop."""
-        import asyncio
-
-        import main
-
-        original_loop = main.loop_holder["loop"]
-
-        try:
-            closed_loop = asyncio.new_event_loop()
-            closed_loop.close()
-            main.loop_holder["loop"] = closed_loop
-            schedule_broadcast(AsyncMock())
-        finally:
-            main.loop_holder["loop"] = original_loop
-
-
 # =============================================================================
 # API State Endpoint Tests
 # =============================================================================
@@ -204,9 +164,9 @@ class TestSetParamsEndpoint:
 
     @pytest.mark.integration
     def test_set_params_invalid_value_type(self, client):
-        """POST /api/set_params with invalid value should return 500."""
+        """POST /api/set_params with invalid value should be rejected by body validation."""
         response = client.post("/api/set_params", json={"learning_rate": "not_a_number"})
-        assert response.status_code == 500
+        assert response.status_code == 422
 
 
 # =============================================================================
@@ -165,6 +165,17 @@ class TestWebSocketEndpoints:
             msg = websocket.receive_json()
             assert msg["type"] == "connection_established"
 
+    def test_ws_general_ignores_binary_and_disconnects_promptly(self, client):
+        """Binary frames are ignored and closing /ws releases the connection at once."""
+        initial_count = client.get("/api/statistics").json()["active_connections"]
+
+        with client.websocket_connect("/ws") as websocket:
+            websocket.receive_json()
+            websocket.send_bytes(b"\x00\x01")
+            websocket.send_text("hello")
+
+        assert client.get("/api/statistics").json()["active_connections"] == initial_count
+
     def test_ws_general_counts_in_statistics(self, client):
         """Test /ws connections count in statistics."""
         response = client.get("/api/statistics")
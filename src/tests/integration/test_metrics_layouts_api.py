@@ -233,24 +233,97 @@ class TestLayoutPersistence:
     """Tests for layout persistence across requests."""
 
     def test_layouts_persist_in_file(self, client, temp_layouts_dir):
-        """Should persist layouts to JSON file."""
+        """Should persist each layout to its own JSON file."""
         with patch("main._layouts_dir", str(temp_layouts_dir)):
             client.post("/api/v1/metrics/layouts", params={"name": "persist_test"})
 
-        layouts_file = temp_layouts_dir / "metrics_layouts.json"
-        assert layouts_file.exists()
+        layout_file = temp_layouts_dir / "layouts" / "persist_test.json"
+        assert layout_file.exists()
 
-        with open(layouts_file) as f:
+        with open(layout_file) as f:
             data = json.load(f)
-        assert "persist_test" in data
+        assert data["name"] == "persist_test"
 
     def test_deleted_layouts_removed_from_file(self, client, temp_layouts_dir):
-        """Should remove deleted layouts from JSON file."""
+        """Should remove the file of a deleted layout."""
         with patch("main._layouts_dir", str(temp_layouts_dir)):
             client.post("/api/v1/metrics/layouts", params={"name": "delete_test"})
             client.delete("/api/v1/metrics/layouts/delete_test")
 
-        layouts_file = temp_layouts_dir / "metrics_layouts.json"
-        with open(layouts_file) as f:
-            data = json.load(f)
-        assert "delete_test" not in data
+        assert not (temp_layouts_dir / "layouts" / "delete_test.json").exists()
+
+    def test_save_leaves_other_layouts_untouched(self, client, temp_layouts_dir):
+        """Saving one layout should not rewrite the files of other layouts."""
+        with patch("main._layouts_dir", str(temp_layouts_dir)):
+            client.post("/api/v1/metrics/layouts", params={"name": "stable"})
+            stable_file = temp_layouts_dir / "layouts" / "stable.json"
+            before = stable_file.stat().st_mtime_ns
+            os.utime(stable_file, ns=(before - 10**9, before - 10**9))
+            client.post("/api/v1/metrics/layouts", params={"name": "other"})
+
+        assert stable_file.stat().st_mtime_ns == before - 10**9
+
+    def test_layout_name_cannot_escape_store(self, client, temp_layouts_dir):
+        """Path separators in names are encoded, keeping files inside the store."""
+        with patch("main._layouts_dir", str(temp_layouts_dir)):
+            response = client.post("/api/v1/metrics/layouts", params={"name": "../escape"})
+            listing = client.get("/api/v1/metrics/layouts").json()
+
+        assert response.status_code == 201
+        assert not (temp_layouts_dir / "escape.json").exists()
+        assert [layout["name"] for layout in listing["layouts"]] == ["../escape"]
+
+    def test_legacy_layouts_file_migrated(self, client, temp_layouts_dir):
+        """Layouts in the legacy single-file store are split into per-layout files."""
+        (temp_layouts_dir / "metrics_layouts.json").write_text(json.dumps({"legacy": {"name": "legacy", "created": "2026-01-09T10:00:00Z"}}))
+
+        with patch("main._layouts_dir", str(temp_layouts_dir)):
+            response = client.get("/api/v1/metrics/layouts/legacy")
+
+        assert response.status_code == 200
+        assert (temp_layouts_dir / "layouts" / "legacy.json").exists()
+
+    def test_list_reflects_external_edits(self, client, temp_layouts_dir):
+        """Cached list summaries are refreshed when a layout file changes."""
+        with patch("main._layouts_dir", str(temp_layouts_dir)):
+            client.post("/api/v1/metrics/layouts", params={"name": "edited", "description": "before"})
+            assert client.get("/api/v1/metrics/layouts").json()["layouts"][0]["description"] == "before"
+            client.post("/api/v1/metrics/layouts", params={"name": "edited", "description": "after, longer"})
+            listing = client.get("/api/v1/metrics/layouts").json()
+
+        assert listing["layouts"][0]["description"] == "after, longer"
+
+    def test_store_resolved_once_per_layouts_dir(self, client, temp_layouts_dir):
+        """After the first request the store directory is not re-checked or re-created."""
+        import main
+
+        with patch("main._layouts_dir", str(temp_layouts_dir)):
+            client.post("/api/v1/metrics/layouts", params={"name": "first"})
+            with patch.object(main.Path, "mkdir", side_effect=AssertionError("mkdir per request")), patch.object(main.Path, "is_dir", side_effect=AssertionError("stat per request")):
+                assert client.post("/api/v1/metrics/layouts", params={"name": "second"}).status_code == 201
+                assert client.get("/api/v1/metrics/layouts").json()["total"] == 2
+
+    def test_store_recreated_after_removal(self, client, temp_layouts_dir):
+        """Removing the store directory at runtime does not break list or save."""
+        import shutil
+
+        with patch("main._layouts_dir", str(temp_layouts_dir)):
+            client.post("/api/v1/metrics/layouts", params={"name": "gone"})
+            shutil.rmtree(temp_layouts_dir / "layouts")
+            assert client.get("/api/v1/metrics/layouts").json()["total"] == 0
+            shutil.rmtree(temp_layouts_dir / "layouts")
+            assert client.post("/api/v1/metrics/layouts", params={"name": "back"}).status_code == 201
+
+        assert (temp_layouts_dir / "layouts" / "back.json").exists()
+
+    def test_failed_save_keeps_previous_layout_and_no_temp_file(self, client, temp_layouts_dir):
+        """A failure before the rename leaves the old layout intact and cleans up the temp file."""
+        with patch("main._layouts_dir", str(temp_layouts_dir)):
+            client.post("/api/v1/metrics/layouts", params={"name": "atomic", "description": "old"})
+            with patch("main.os.replace", side_effect=OSError("disk full")):
+                response = client.post("/api/v1/metrics/layouts", params={"name": "atomic", "description": "new"})
+            current = client.get("/api/v1/metrics/layouts/atomic").json()
+
+        assert response.status_code == 500
+        assert current["description"] == "old"
+        assert sorted(p.name for p in (temp_layouts_dir / "layouts").iterdir()) == ["atomic.json"]
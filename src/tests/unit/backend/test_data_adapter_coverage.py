@@ -89,6 +89,16 @@ class TestTrainingMetricsExtraction:
         assert "timestamp" in result
         assert isinstance(result["timestamp"], str)  # ISO format
 
+    @pytest.mark.parametrize("cls_name", ["TrainingMetrics", "NetworkNode", "NetworkConnection", "NetworkTopology"])
+    def test_data_structures_have_no_instance_dict(self, cls_name):
+        """Adapter data structures use __slots__, so instances carry no per-instance dict."""
+        import backend.data_adapter as data_adapter
+
+        cls = getattr(data_adapter, cls_name)
+
+        assert "__slots__" in vars(cls)
+        assert "__dict__" not in vars(cls)
+
 
 class TestNetworkTopologyConversion:
     """Test network topology conversion."""
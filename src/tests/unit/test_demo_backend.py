@@ -187,6 +187,40 @@ class TestNetworkAndData:
             assert "to" in conn
             assert "weight" in conn
 
+    def test_get_network_topology_weights_match_tensors(self, demo_backend):
+        """Connection weights are plain floats equal to the underlying tensor values."""
+        network = demo_backend._demo.get_network()
+        saved_output_weights = network.output_weights
+        network.add_hidden_unit()
+        try:
+            topo = demo_backend.get_network_topology()
+            weights = {(c["from"], c["to"]): c["weight"] for c in topo["connections"]}
+            hidden = len(network.hidden_units) - 1
+
+            assert weights[("input_1", f"hidden_{hidden}")] == network.hidden_units[hidden]["weights"][1].item()
+            assert weights[("input_0", "output_0")] == network.output_weights[0, 0].item()
+            col = network.input_size + hidden
+            assert weights[(f"hidden_{hidden}", "output_0")] == network.output_weights[0, col].item()
+            assert all(type(w) is float for w in weights.values())
+        finally:
+            network.hidden_units.pop()
+            network.output_weights = saved_output_weights
+
+    def test_get_network_topology_pads_short_hidden_weights(self, demo_backend):
+        """A hidden unit with fewer weights than inputs reports 0.0 for the missing connections."""
+        import torch
+
+        network = demo_backend._demo.get_network()
+        network.hidden_units.append({"id": 99, "weights": torch.tensor([0.5]), "bias": torch.zeros(1)})
+        try:
+            topo = demo_backend.get_network_topology()
+            hidden = len(network.hidden_units) - 1
+            weights = {(c["from"], c["to"]): c["weight"] for c in topo["connections"] if c["to"] == f"hidden_{hidden}"}
+            assert weights[("input_0", f"hidden_{hidden}")] == 0.5
+            assert all(weights[(f"input_{j}", f"hidden_{hidden}")] == 0.0 for j in range(1, network.input_size))
+        finally:
+            network.hidden_units.pop()
+
     def test_get_network_stats_returns_dict(self, demo_backend):
         """get_network_stats() should return a dict."""
         result = demo_backend.get_network_stats()
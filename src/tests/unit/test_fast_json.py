@@ -0,0 +1,71 @@
+"""Tests for the JSON serialization helpers and FastJSONResponse."""
+
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+import fast_json
+from fast_json import FastJSONResponse, json_dumps, json_loads
+
+
+@pytest.mark.unit
+class TestJsonDumps:
+    """Test json_dumps with and without orjson."""
+
+    def test_returns_compact_bytes(self):
+        result = json_dumps({"a": 1, "b": [1, 2]})
+        assert isinstance(result, bytes)
+        assert json.loads(result) == {"a": 1, "b": [1, 2]}
+        assert b" " not in result
+
+    @pytest.mark.skipif(not fast_json.ORJSON_AVAILABLE, reason="orjson not installed")
+    def test_orjson_serializes_numpy_and_int_keys(self):
+        result = json_dumps({1: np.array([1.5, 2.5])})
+        assert json.loads(result) == {"1": [1.5, 2.5]}
+
+    def test_stdlib_fallback_matches_orjson_output(self):
+        content = {"status": "healthy", "values": [1, 2.5, None], "name": "jünïper"}
+        with patch.object(fast_json, "ORJSON_AVAILABLE", False):
+            fallback = json_dumps(content)
+        assert json.loads(fallback) == content
+        assert json.loads(json_dumps(content)) == content
+
+    def test_stdlib_fallback_rejects_nan(self):
+        with patch.object(fast_json, "ORJSON_AVAILABLE", False), pytest.raises(ValueError):
+            json_dumps({"x": float("nan")})
+
+
+@pytest.mark.unit
+class TestJsonLoads:
+    """Test json_loads with and without orjson."""
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_parses_bytes(self, orjson_available):
+        if orjson_available and not fast_json.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        with patch.object(fast_json, "ORJSON_AVAILABLE", orjson_available):
+            assert json_loads(b'{"a":[1,2.5,null]}') == {"a": [1, 2.5, None]}
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_invalid_json_raises_value_error(self, orjson_available):
+        if orjson_available and not fast_json.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        with patch.object(fast_json, "ORJSON_AVAILABLE", orjson_available), pytest.raises(ValueError):
+            json_loads(b"not json")
+
+
+@pytest.mark.unit
+class TestFastJSONResponse:
+    """Test FastJSONResponse rendering."""
+
+    def test_renders_json_body(self):
+        response = FastJSONResponse({"ok": True})
+        assert json.loads(response.body) == {"ok": True}
+        assert response.media_type == "application/json"
+        assert response.status_code == 200
+
+    def test_status_code_passthrough(self):
+        response = FastJSONResponse({"error": "x"}, status_code=503)
+        assert response.status_code == 503
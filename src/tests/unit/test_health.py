@@ -4,7 +4,7 @@ from unittest.mock import patch
 
 import pytest
 
-from health import DependencyStatus, ReadinessResponse, probe_dependency
+from health import DependencyStatus, ReadinessResponse, build_health_url, normalize_service_url, probe_dependency
 
 
 @pytest.mark.unit
@@ -78,6 +78,43 @@ class TestProbeDependency:
             assert result.latency_ms is not None
 
 
+@pytest.mark.unit
+class TestNormalizeServiceUrl:
+    """Test the normalize_service_url helper."""
+
+    def test_canonical_url_returned_unchanged(self):
+        url = "http://localhost:8100"
+        assert normalize_service_url(url) is url
+
+    def test_https_canonical_url_returned_unchanged(self):
+        assert normalize_service_url("https://data.example.com:443") == "https://data.example.com:443"
+
+    @pytest.mark.parametrize(
+        "url",
+        ["http://localhost:8100/", "http://localhost:8100/v1", "http://localhost:8100/v1/", "localhost:8100", "localhost:8100/v1/"],
+    )
+    def test_non_canonical_forms_normalized(self, url):
+        assert normalize_service_url(url) == "http://localhost:8100"
+
+    def test_path_prefix_preserved(self):
+        assert normalize_service_url("http://gateway/juniper-data/") == "http://gateway/juniper-data"
+
+
+@pytest.mark.unit
+class TestBuildHealthUrl:
+    """Test the build_health_url helper."""
+
+    @pytest.mark.parametrize("base", ["http://localhost:8100", "http://localhost:8100/", "http://localhost:8100/v1/"])
+    def test_builds_liveness_url(self, base):
+        assert build_health_url(base) == "http://localhost:8100/v1/health/live"
+
+    def test_result_is_cached(self):
+        build_health_url.cache_clear()
+        first = build_health_url("http://cached-host:8200/")
+        assert build_health_url("http://cached-host:8200/") is first
+        assert build_health_url.cache_info().hits == 1
+
+
 @pytest.mark.unit
 class TestCanopyHealthEndpoints:
     """Test canopy health endpoints via TestClient."""
@@ -146,3 +183,20 @@ class TestDeprecatedEndpoints:
         assert response.status_code == 200
         body = response.json()
         assert body["status"] == "healthy"
+
+
+@pytest.mark.unit
+class TestHealthPayloadPreserialization:
+    """Test the pre-serialized /v1/health payload."""
+
+    def test_health_payload_is_valid_json_with_all_fields(self, client):
+        response = client.get("/v1/health")
+        assert response.headers["content-type"] == "application/json"
+        body = response.json()
+        assert set(body) == {"status", "version", "timestamp", "active_connections", "training_active", "demo_mode", "juniper_data_available"}
+        assert body["version"] == "0.3.0"
+
+    def test_deprecated_and_v1_payloads_share_fields(self, client):
+        v1 = client.get("/v1/health").json()
+        legacy = client.get("/api/health").json()
+        assert set(v1) == set(legacy)
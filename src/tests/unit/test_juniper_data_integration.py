@@ -430,6 +430,28 @@ class TestDemoModeDatasetSchema:
         assert isinstance(result["targets_tensor"], torch.Tensor)
         assert result["targets_tensor"].shape == (200, 1)
 
+    @pytest.mark.unit
+    def test_create_dataset_payload_uses_spiral_template(self):
+        """create_dataset receives the static spiral template merged with the per-call sample count."""
+        from demo_mode import _SPIRAL_DATASET_PARAMS, DemoMode
+
+        demo = DemoMode.__new__(DemoMode)
+        demo.logger = MagicMock()
+
+        mock_client_class = MagicMock()
+        mock_client_instance = MagicMock()
+        mock_client_instance.create_dataset.return_value = {"dataset_id": "test-004"}
+        mock_client_instance.download_artifact_npz.return_value = {"X_full": np.zeros((10, 2), dtype=np.float32), "y_full": np.eye(2, dtype=np.float32)[np.zeros(10, dtype=int)]}
+        mock_client_class.return_value = mock_client_instance
+
+        with patch("juniper_data_client.JuniperDataClient", mock_client_class):
+            demo._generate_spiral_dataset_from_juniper_data(10, "http://localhost:8100", algorithm="fermat")
+
+        kwargs = mock_client_instance.create_dataset.call_args.kwargs
+        assert kwargs["generator"] == "spiral"
+        assert kwargs["params"] == {"n_points_per_spiral": 5, "n_spirals": 2, "noise": 0.1, "seed": 42, "algorithm": "fermat"}
+        assert "algorithm" not in _SPIRAL_DATASET_PARAMS
+
     @pytest.mark.unit
     def test_missing_dataset_id_raises_value_error(self):
         """Missing dataset_id in JuniperData response raises ValueError."""
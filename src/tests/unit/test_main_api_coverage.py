@@ -15,7 +15,6 @@
 #####################################################################
 """
 Unit tests for main.py API endpoints with focus on:
-- schedule_broadcast function edge cases
 - Backend protocol mode branches (demo vs service)
 - Protocol method return value handling (None → 503)
 - Training control endpoints via protocol
@@ -24,9 +23,10 @@ These tests directly call the endpoint async functions to avoid lifespan
 initialization issues with demo mode.  All tests save/restore `main.backend`
 instead of the removed `main.demo_mode_instance` / `main.demo_mode_active`.
 """
+import json
 import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -35,92 +35,6 @@ src_dir = Path(__file__).parents[2]
 sys.path.insert(0, str(src_dir))
 
 
-# =============================================================================
-# Test schedule_broadcast function
-# =============================================================================
-class TestScheduleBroadcast:
-    """Test schedule_broadcast helper function edge cases."""
-
-    def test_schedule_broadcast_loop_is_none_logs_warning(self):
-        """When loop_holder['loop'] is None, should log warning."""
-        import main
-
-        original_loop = main.loop_holder["loop"]
-        try:
-            main.loop_holder["loop"] = None
-
-            async def mock_coro():
-                pass
-
-            with patch.object(main.system_logger, "warning") as mock_warning:
-                main.schedule_broadcast(mock_coro())
-                mock_warning.assert_called_once_with("Event loop not available for broadcasting")
-        finally:
-            main.loop_holder["loop"] = original_loop
-
-    def test_schedule_broadcast_loop_is_closed_logs_warning(self):
-        """When loop_holder['loop'] is closed, should log warning."""
-        import main
-
-        original_loop = main.loop_holder["loop"]
-        try:
-            mock_loop = MagicMock()
-            mock_loop.is_closed.return_value = True
-            main.loop_holder["loop"] = mock_loop
-
-            async def mock_coro():
-                pass
-
-            with patch.object(main.system_logger, "warning") as mock_warning:
-                main.schedule_broadcast(mock_coro())
-                mock_warning.assert_called_once_with("Event loop not available for broadcasting")
-        finally:
-            main.loop_holder["loop"] = original_loop
-
-    def test_schedule_broadcast_loop_open_calls_run_coroutine_threadsafe(self):
-        """When loop is open, should call run_coroutine_threadsafe."""
-        import main
-
-        original_loop = main.loop_holder["loop"]
-        try:
-            mock_loop = MagicMock()
-            mock_loop.is_closed.return_value = False
-            main.loop_holder["loop"] = mock_loop
-
-            async def mock_coro():
-                pass
-
-            coro = mock_coro()
-            with patch("main.asyncio.run_coroutine_threadsafe") as mock_run:
-                main.schedule_broadcast(coro)
-                mock_run.assert_called_once_with(coro, mock_loop)
-        finally:
-            main.loop_holder["loop"] = original_loop
-
-    def test_schedule_broadcast_exception_logs_error(self):
-        """When run_coroutine_threadsafe raises, should log error."""
-        import main
-
-        original_loop = main.loop_holder["loop"]
-        try:
-            mock_loop = MagicMock()
-            mock_loop.is_closed.return_value = False
-            main.loop_holder["loop"] = mock_loop
-
-            async def mock_coro():
-                pass
-
-            with (
-                patch("main.asyncio.run_coroutine_threadsafe", side_effect=RuntimeError("test error")),
-                patch.object(main.system_logger, "error") as mock_error,
-            ):
-                main.schedule_broadcast(mock_coro())
-                mock_error.assert_called_once()
-                assert "Failed to schedule broadcast" in str(mock_error.call_args)
-        finally:
-            main.loop_holder["loop"] = original_loop
-
-
 # =============================================================================
 # Test /api/topology endpoint - direct async function calls
 # =============================================================================
@@ -171,7 +85,9 @@ class TestTopologyEndpointDirect:
             result = await main.get_topology()
 
             assert isinstance(result, JSONResponse)
+            assert isinstance(result, main.FastJSONResponse)
             assert result.status_code == 503
+            assert result.body == b'{"error":"No topology available"}'
         finally:
             main.backend = original_backend
 
@@ -467,6 +383,25 @@ class TestTrainingControlEndpointsDirect:
             main.backend = original_backend
             main.loop_holder["loop"] = original_loop
 
+    @pytest.mark.asyncio
+    async def test_train_control_ack_is_broadcast_directly(self):
+        """Control acks go straight to the WebSocket manager instead of the cross-thread queue."""
+        import main
+
+        original_backend = main.backend
+        try:
+            main.backend = MagicMock()
+            with patch.object(main.websocket_manager, "broadcast", new_callable=AsyncMock) as mock_broadcast, patch.object(main.websocket_manager, "enqueue_broadcast") as mock_enqueue:
+                await main.api_train_pause()
+
+            mock_enqueue.assert_not_called()
+            mock_broadcast.assert_awaited_once()
+            ack = mock_broadcast.await_args.args[0]
+            assert ack["type"] == "control_ack"
+            assert ack["data"]["command"] == "pause"
+        finally:
+            main.backend = original_backend
+
     # ---- /api/train/resume ----
     @pytest.mark.asyncio
     async def test_train_resume_returns_running(self):
@@ -646,7 +581,7 @@ class TestMetricsHistoryEndpointDirect:
         try:
             main.backend = mock_backend
 
-            result = await main.get_metrics_history()
+            result = json.loads((await main.get_metrics_history()).body)
 
             mock_backend.get_metrics_history.assert_called_once_with(100)
             assert "history" in result
@@ -667,7 +602,7 @@ class TestMetricsHistoryEndpointDirect:
         try:
             main.backend = mock_backend
 
-            result = await main.get_metrics_history()
+            result = json.loads((await main.get_metrics_history()).body)
 
             assert result == {"history": []}
         finally:
@@ -686,7 +621,7 @@ class TestMetricsHistoryEndpointDirect:
         try:
             main.backend = mock_backend
 
-            result = await main.get_metrics_history()
+            result = json.loads((await main.get_metrics_history()).body)
 
             assert len(result["history"]) == 1
         finally:
@@ -926,7 +861,7 @@ class TestHealthEndpointDirect:
         try:
             main.backend = mock_backend
 
-            result = await main.health_check()
+            result = json.loads((await main.health_check()).body)
 
             assert result["training_active"] is True
             assert result["demo_mode"] is False
@@ -946,7 +881,7 @@ class TestHealthEndpointDirect:
         try:
             main.backend = mock_backend
 
-            result = await main.health_check()
+            result = json.loads((await main.health_check()).body)
 
             assert result["training_active"] is False
             assert result["demo_mode"] is False
@@ -966,7 +901,7 @@ class TestHealthEndpointDirect:
         try:
             main.backend = mock_backend
 
-            result = await main.health_check()
+            result = json.loads((await main.health_check()).body)
 
             assert result["training_active"] is True
             assert result["demo_mode"] is True
@@ -1033,6 +968,15 @@ class TestStateEndpointDirect:
 class TestTrainStatusEndpoint:
     """Test /api/train/status by calling async function directly."""
 
+    @staticmethod
+    async def _status(main, if_none_match=None):
+        """Call api_train_status with a minimal request; return the response and decoded body."""
+        from starlette.requests import Request
+
+        headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+        response = await main.api_train_status(Request({"type": "http", "headers": headers}))
+        return response, (json.loads(response.body) if response.body else None)
+
     @pytest.mark.asyncio
     async def test_train_status_includes_backend_type(self):
         """Train status should include backend type and status from protocol."""
@@ -1046,7 +990,7 @@ class TestTrainStatusEndpoint:
         try:
             main.backend = mock_backend
 
-            result = await main.api_train_status()
+            _, result = await self._status(main)
 
             assert result["backend"] == "demo"
             assert result["is_training"] is True
@@ -1067,13 +1011,90 @@ class TestTrainStatusEndpoint:
         try:
             main.backend = mock_backend
 
-            result = await main.api_train_status()
+            _, result = await self._status(main)
 
             assert result["backend"] == "service"
             assert result["is_training"] is False
         finally:
             main.backend = original_backend
 
+    @pytest.mark.asyncio
+    async def test_train_status_cached_within_ttl(self):
+        """Repeat polls within STATUS_CACHE_TTL reuse the last payload."""
+        import main
+
+        mock_backend = MagicMock()
+        mock_backend.backend_type = "demo"
+        mock_backend.get_status.return_value = {"current_epoch": 1}
+
+        original_backend = main.backend
+        try:
+            main.backend = mock_backend
+            with patch.object(main, "STATUS_CACHE_TTL", 60.0):
+                first, _ = await self._status(main)
+                mock_backend.get_status.return_value = {"current_epoch": 2}
+                second, result = await self._status(main)
+
+            assert first.body is second.body
+            assert result["current_epoch"] == 1
+            mock_backend.get_status.assert_called_once()
+        finally:
+            main.backend = original_backend
+
+    @pytest.mark.asyncio
+    async def test_train_status_cache_invalidated_by_control(self):
+        """Control endpoints force the next status poll to hit the backend."""
+        import main
+
+        mock_backend = MagicMock()
+        mock_backend.backend_type = "demo"
+        mock_backend.get_status.return_value = {"is_training": False}
+
+        original_backend = main.backend
+        try:
+            main.backend = mock_backend
+            with patch.object(main, "STATUS_CACHE_TTL", 60.0), patch.object(main.websocket_manager, "broadcast", new_callable=AsyncMock):
+                await self._status(main)
+                mock_backend.get_status.return_value = {"is_training": True}
+                await main.api_train_pause()
+                _, result = await self._status(main)
+
+            assert result["is_training"] is True
+            assert mock_backend.get_status.call_count == 2
+        finally:
+            main.backend = original_backend
+
+    @pytest.mark.asyncio
+    async def test_train_status_not_modified_for_matching_etag(self):
+        """A poll carrying the current ETag gets 304 with no body; a changed status gets a new ETag."""
+        import main
+
+        mock_backend = MagicMock()
+        mock_backend.backend_type = "demo"
+        mock_backend.get_status.return_value = {"current_epoch": 1}
+
+        original_backend = main.backend
+        try:
+            main.backend = mock_backend
+            first, _ = await self._status(main)
+            etag = first.headers["etag"]
+            assert etag.startswith('W/"')
+            assert first.headers["cache-control"] == "no-cache"
+
+            main._invalidate_status_cache()
+            unchanged, body = await self._status(main, if_none_match=etag)
+            assert unchanged.status_code == 304
+            assert body is None
+
+            main._invalidate_status_cache()
+            mock_backend.get_status.return_value = {"current_epoch": 2}
+            changed, body = await self._status(main, if_none_match=etag)
+            assert changed.status_code == 200
+            assert changed.headers["etag"] != etag
+            assert body["current_epoch"] == 2
+        finally:
+            main.backend = original_backend
+
 
 # =============================================================================
 # Test /api/set_params endpoint - direct async function calls
@@ -1093,16 +1114,36 @@ class TestSetParamsEndpoint:
         try:
             main.backend = mock_backend
 
-            result = await main.api_set_params({"learning_rate": 0.02})
+            result = await main.api_set_params(main.SetParamsRequest(learning_rate=0.02))
 
             mock_backend.apply_params.assert_called_once_with(learning_rate=0.02)
             assert result["status"] == "success"
         finally:
             main.backend = original_backend
 
+    @pytest.mark.asyncio
+    async def test_set_params_passes_only_provided_fields(self):
+        """Omitted fields are not forwarded; numeric strings are coerced like the old float()/int() calls."""
+        import main
+
+        mock_backend = MagicMock()
+        mock_backend.backend_type = "demo"
+
+        original_backend = main.backend
+        try:
+            main.backend = mock_backend
+
+            params = main.SetParamsRequest.model_validate({"max_hidden_units": "12", "unknown": 1})
+            result = await main.api_set_params(params)
+
+            mock_backend.apply_params.assert_called_once_with(max_hidden_units=12)
+            assert result["status"] == "success"
+        finally:
+            main.backend = original_backend
+
     @pytest.mark.asyncio
     async def test_set_params_no_params_returns_400(self):
-        """Empty params dict should return 400 error."""
+        """Empty params should return 400 error."""
         from fastapi.responses import JSONResponse
 
         import main
@@ -1114,7 +1155,7 @@ class TestSetParamsEndpoint:
         try:
             main.backend = mock_backend
 
-            result = await main.api_set_params({})
+            result = await main.api_set_params(main.SetParamsRequest())
 
             assert isinstance(result, JSONResponse)
             assert result.status_code == 400
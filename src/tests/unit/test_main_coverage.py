@@ -349,11 +349,3 @@ class TestDemoModeIntegration:
         # Demo mode should provide status
 
 
-class TestScheduleBroadcast:
-    """Test schedule_broadcast helper."""
-
-    def test_schedule_broadcast_exists(self):
-        """schedule_broadcast function should exist."""
-        from main import schedule_broadcast
-
-        assert callable(schedule_broadcast)
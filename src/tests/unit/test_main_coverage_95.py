@@ -201,48 +201,6 @@ class TestSnapshotEndpoints:
             assert "activities" in data or isinstance(data, list)
 
 
-class TestScheduleBroadcast:
-    """Test schedule_broadcast function."""
-
-    def test_schedule_broadcast_with_closed_loop(self):
-        """Test schedule_broadcast when loop is closed."""
-        from unittest.mock import MagicMock
-
-        from main import loop_holder, schedule_broadcast
-
-        # Store original and set to closed loop
-        original_loop = loop_holder.get("loop")
-
-        # Create a mock closed loop
-        mock_loop = MagicMock()
-        mock_loop.is_closed.return_value = True
-        loop_holder["loop"] = mock_loop
-
-        # This should not raise, just log warning
-        async def dummy_coro():
-            pass
-
-        schedule_broadcast(dummy_coro())
-
-        # Restore
-        loop_holder["loop"] = original_loop
-
-    def test_schedule_broadcast_with_no_loop(self):
-        """Test schedule_broadcast when no loop set."""
-        from main import loop_holder, schedule_broadcast
-
-        original_loop = loop_holder.get("loop")
-        loop_holder["loop"] = None
-
-        async def dummy_coro():
-            pass
-
-        # Should not raise
-        schedule_broadcast(dummy_coro())
-
-        loop_holder["loop"] = original_loop
-
-
 class TestWebSocketEndpoints:
     """Test WebSocket endpoint handling."""
 
@@ -368,6 +368,19 @@ class TestMainFunction:
                 main()
                 mock_run.assert_called_once()
 
+    @pytest.mark.unit
+    def test_main_uses_fast_loop_and_parser_without_access_log(self):
+        """main() lets uvicorn pick uvloop/httptools and disables access logging outside debug."""
+        import main
+
+        with patch("main.uvicorn.run") as mock_run, patch.object(main.settings.server, "debug", False):
+            main.main()
+
+        kwargs = mock_run.call_args.kwargs
+        assert kwargs["loop"] == "auto"
+        assert kwargs["http"] == "auto"
+        assert kwargs["access_log"] is False
+
     @pytest.mark.unit
     def test_main_config_source_logging(self):
         """Test configuration source is logged correctly."""
@@ -377,33 +390,6 @@ class TestMainFunction:
         assert host_source in ("env", "config", "constant")
 
 
-class TestScheduleBroadcast:
-    """Test schedule_broadcast helper function."""
-
-    @pytest.mark.unit
-    def test_schedule_broadcast_callable(self):
-        """Test schedule_broadcast is callable."""
-        from main import schedule_broadcast
-
-        assert callable(schedule_broadcast)
-
-    @pytest.mark.unit
-    def test_schedule_broadcast_with_coroutine(self):
-        """Test schedule_broadcast handles coroutines."""
-        from main import schedule_broadcast
-
-        async def mock_coro():
-            return "done"
-
-        coro = mock_coro()
-        try:
-            schedule_broadcast(coro)
-        except Exception:
-            pass
-        finally:
-            coro.close()
-
-
 class TestLifespanShutdown:
     """Test lifespan shutdown handlers (line 167)."""
 
@@ -7,7 +7,6 @@ These tests focus on covering code paths reachable in demo mode.
 import os
 import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -29,64 +28,6 @@ def app_client():
         yield client
 
 
-class TestScheduleBroadcastEdgeCases:
-    """Test schedule_broadcast function edge cases."""
-
-    def test_schedule_broadcast_with_closed_loop(self):
-        """Test schedule_broadcast when loop is closed."""
-        from main import loop_holder, schedule_broadcast
-
-        original_loop = loop_holder.get("loop")
-
-        mock_loop = MagicMock()
-        mock_loop.is_closed.return_value = True
-        loop_holder["loop"] = mock_loop
-
-        async def dummy_coro():
-            pass
-
-        # Should not raise
-        schedule_broadcast(dummy_coro())
-
-        loop_holder["loop"] = original_loop
-
-    def test_schedule_broadcast_with_no_loop(self):
-        """Test schedule_broadcast when no loop set."""
-        from main import loop_holder, schedule_broadcast
-
-        original_loop = loop_holder.get("loop")
-        loop_holder["loop"] = None
-
-        async def dummy_coro():
-            pass
-
-        # Should not raise
-        schedule_broadcast(dummy_coro())
-
-        loop_holder["loop"] = original_loop
-
-    def test_schedule_broadcast_exception_handling(self):
-        """Test schedule_broadcast exception handling."""
-        from main import loop_holder, schedule_broadcast
-
-        original_loop = loop_holder.get("loop")
-
-        mock_loop = MagicMock()
-        mock_loop.is_closed.return_value = False
-
-        # Mock run_coroutine_threadsafe to raise
-        with patch("asyncio.run_coroutine_threadsafe", side_effect=RuntimeError("Test error")):
-            loop_holder["loop"] = mock_loop
-
-            async def dummy_coro():
-                pass
-
-            # Should not raise, just log
-            schedule_broadcast(dummy_coro())
-
-        loop_holder["loop"] = original_loop
-
-
 class TestWebSocketEndpointsDemo:
     """Test WebSocket endpoints in demo mode."""
 
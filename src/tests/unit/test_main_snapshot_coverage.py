@@ -527,6 +527,7 @@ class TestSnapshotActivityLogging:
 
             assert response.status_code == 201
 
+            main._flush_snapshot_history()
             history_file = snapshot_dir / "snapshot_history.jsonl"
             assert history_file.exists()
 
@@ -557,6 +558,7 @@ class TestSnapshotActivityLogging:
 
             assert response.status_code == 200
 
+            main._flush_snapshot_history()
             history_file = snapshot_dir / "snapshot_history.jsonl"
             assert history_file.exists()
 
@@ -616,6 +618,89 @@ class TestSnapshotActivityLogging:
         finally:
             main._snapshots_dir = original_snapshots_dir
 
+    @pytest.mark.unit
+    def test_log_snapshot_activity_reuses_buffered_handle(self, snapshot_dir):
+        """Consecutive entries share one open handle and reach disk on flush."""
+        import main
+
+        with patch.object(main, "_snapshots_dir", str(snapshot_dir)):
+            main._log_snapshot_activity("create", "first")
+            fd = main._history_writer["fd"]
+            main._log_snapshot_activity("delete", "first")
+            assert main._history_writer["fd"] == fd
+
+            main._flush_snapshot_history()
+            lines = (snapshot_dir / "snapshot_history.jsonl").read_text().splitlines()
+
+        assert [json.loads(line)["action"] for line in lines] == ["create", "delete"]
+        assert ", " not in lines[0]
+        main._close_snapshot_history()
+
+    @pytest.mark.unit
+    def test_log_snapshot_activity_writes_whole_pages(self, snapshot_dir):
+        """Buffered entries reach the file only in whole pages until flushed."""
+        import main
+
+        history_file = snapshot_dir / "snapshot_history.jsonl"
+        with patch.object(main, "_snapshots_dir", str(snapshot_dir)):
+            main._log_snapshot_activity("create", "small")
+            assert history_file.stat().st_size == 0
+
+            for i in range(40):
+                main._log_snapshot_activity("create", f"bulk_{i}", details={"pad": "x" * 100})
+            written = history_file.stat().st_size
+            assert written > 0
+            assert written % main.SNAPSHOT_HISTORY_PAGE_SIZE == 0
+
+            main._flush_snapshot_history()
+            lines = history_file.read_text().splitlines()
+
+        assert len(lines) == 41
+        assert json.loads(lines[-1])["snapshot_id"] == "bulk_39"
+        main._close_snapshot_history()
+
+    @pytest.mark.unit
+    def test_log_snapshot_activity_switches_file_with_snapshot_dir(self, tmp_path):
+        """Changing the snapshot directory flushes the old file and opens the new one."""
+        import main
+
+        first_dir, second_dir = tmp_path / "a", tmp_path / "b"
+        with patch.object(main, "_snapshots_dir", str(first_dir)):
+            main._log_snapshot_activity("create", "one")
+        with patch.object(main, "_snapshots_dir", str(second_dir)):
+            main._log_snapshot_activity("create", "two")
+        main._close_snapshot_history()
+
+        assert json.loads((first_dir / "snapshot_history.jsonl").read_text())["snapshot_id"] == "one"
+        assert json.loads((second_dir / "snapshot_history.jsonl").read_text())["snapshot_id"] == "two"
+        assert main._history_writer["fd"] is None
+
+    @pytest.mark.unit
+    def test_log_snapshot_activity_round_trips_unicode(self, app_client, snapshot_dir):
+        """Entries are written as UTF-8 JSON and read back unchanged."""
+        import main
+
+        with patch.object(main, "_snapshots_dir", str(snapshot_dir)):
+            main._log_snapshot_activity("create", "jünïper", details={"note": "größe"})
+            entry = app_client.get("/api/v1/snapshots/history").json()["history"][0]
+
+        assert entry["snapshot_id"] == "jünïper"
+        assert entry["details"] == {"note": "größe"}
+        main._close_snapshot_history()
+
+    @pytest.mark.unit
+    def test_history_endpoint_sees_buffered_entries(self, app_client, snapshot_dir):
+        """The history endpoint flushes pending entries before reading."""
+        import main
+
+        with patch.object(main, "_snapshots_dir", str(snapshot_dir)):
+            main._log_snapshot_activity("restore", "pending")
+            response = app_client.get("/api/v1/snapshots/history")
+
+        assert response.status_code == 200
+        assert response.json()["history"][0]["snapshot_id"] == "pending"
+        main._close_snapshot_history()
+
 
 class TestCreateSnapshotWithTrainingState:
     """Tests for snapshot creation with training state serialization."""
@@ -627,20 +712,15 @@ class TestCreateSnapshotWithTrainingState:
             pytest.skip("h5py not available")
 
         import main
+        from backend.training_monitor import TrainingState
 
-        class MockTrainingState:
-            def __init__(self):
-                self.current_epoch = 100
-                self.learning_rate = 0.01
-                self.status = "Training"
-                self.hidden_units = 5
-                self._private = "should_be_ignored"
-                self.complex_data = {"nested": True}
+        state = TrainingState()
+        state.update_state(current_epoch=100, learning_rate=0.01, status="Training", max_hidden_units=5, pool_metrics={"nested": True})
 
         original_training_state = main.training_state
 
         try:
-            main.training_state = MockTrainingState()
+            main.training_state = state
 
             # No _adapter means hasattr(backend, "_adapter") is False → h5py fallback path
             mock_svc = _make_service_backend(adapter=None)
@@ -662,8 +742,464 @@ class TestCreateSnapshotWithTrainingState:
                     assert state_group.attrs["current_epoch"] == 100
                     assert state_group.attrs["learning_rate"] == 0.01
                     assert state_group.attrs["status"] == "Training"
-                    assert state_group.attrs["hidden_units"] == 5
-                    assert "_private" not in state_group.attrs
-                    assert "complex_data" not in state_group.attrs
+                    assert state_group.attrs["max_hidden_units"] == 5
+                    assert set(state_group.attrs) == set(TrainingState._SNAPSHOT_ATTRS)
+                    assert "pool_metrics" not in state_group.attrs
+                    assert "timestamp" not in state_group.attrs
         finally:
             main.training_state = original_training_state
+
+    @pytest.mark.unit
+    def test_create_then_restore_keeps_state_json_serializable(self, app_client, snapshot_dir, h5py_available):
+        """Restored h5py attributes are plain Python values, and the restore stamps a fresh timestamp."""
+        if not h5py_available:
+            pytest.skip("h5py not available")
+
+        import main
+        from backend.training_monitor import TrainingState
+
+        saved = TrainingState()
+        saved.update_state(current_epoch=100, learning_rate=0.01, status="Training", max_hidden_units=5, top_candidate_score=0.75, timestamp=1_000.0)
+        restored = TrainingState()
+
+        original_training_state = main.training_state
+
+        try:
+            # No _adapter means hasattr(backend, "_adapter") is False → h5py fallback path
+            mock_svc = _make_service_backend(adapter=None)
+
+            with (
+                patch.object(main, "backend", mock_svc),
+                patch.object(main, "_snapshots_dir", str(snapshot_dir)),
+            ):
+                main.training_state = saved
+                assert app_client.post("/api/v1/snapshots?name=round_trip").status_code == 201
+
+                main.training_state = restored
+                assert app_client.post("/api/v1/snapshots/round_trip/restore").status_code == 200
+        finally:
+            main.training_state = original_training_state
+
+        state = restored.get_state()
+        assert (state["current_epoch"], type(state["current_epoch"])) == (100, int)
+        assert (state["max_hidden_units"], type(state["max_hidden_units"])) == (5, int)
+        assert (state["learning_rate"], type(state["learning_rate"])) == (0.01, float)
+        assert (state["top_candidate_score"], type(state["top_candidate_score"])) == (0.75, float)
+        assert (state["status"], type(state["status"])) == ("Training", str)
+        assert state["timestamp"] > 1_000.0
+        assert json.loads(restored.to_json())["current_epoch"] == 100
+
+
+class TestListSnapshotFiles:
+    """Tests for _list_snapshot_files directory scanning and caching."""
+
+    @pytest.mark.unit
+    def test_lists_only_snapshot_files_newest_first(self, snapshot_dir):
+        """Only .h5/.hdf5 files are listed, ordered by mtime descending."""
+        import main
+
+        (snapshot_dir / "older.h5").write_bytes(b"a")
+        (snapshot_dir / "newer.HDF5").write_bytes(b"bb")
+        (snapshot_dir / "notes.txt").write_text("ignored")
+        (snapshot_dir / "subdir.h5").mkdir()
+        os.utime(snapshot_dir / "older.h5", (1_000_000, 1_000_000))
+        os.utime(snapshot_dir / "newer.HDF5", (2_000_000, 2_000_000))
+
+        with patch.object(main, "_snapshots_dir", str(snapshot_dir)):
+            snapshots = main._list_snapshot_files()
+
+        assert [s["id"] for s in snapshots] == ["newer", "older"]
+        assert snapshots[0]["name"] == "newer.HDF5"
+        assert snapshots[0]["size_bytes"] == 2
+        assert snapshots[0]["path"] == str((snapshot_dir / "newer.HDF5").absolute())
+        assert snapshots[1]["timestamp"] == "1970-01-12T13:46:40+00:00Z"
+
+    @pytest.mark.unit
+    def test_orders_by_nanosecond_mtime(self, snapshot_dir):
+        """Files whose mtimes differ below float resolution still sort newest first."""
+        import main
+
+        base_ns = 2_000_000_000_000_000_000
+        for offset, name in enumerate(["a.h5", "b.h5", "c.h5"]):
+            (snapshot_dir / name).write_bytes(b"x")
+            os.utime(snapshot_dir / name, ns=(base_ns + offset, base_ns + offset))
+        if len({os.stat(snapshot_dir / n).st_mtime_ns for n in ("a.h5", "b.h5", "c.h5")}) != 3:
+            pytest.skip("filesystem lacks nanosecond timestamps")
+
+        with patch.object(main, "_snapshots_dir", str(snapshot_dir)):
+            assert [s["id"] for s in main._list_snapshot_files()] == ["c", "b", "a"]
+
+    @pytest.mark.unit
+    def test_missing_directory_returns_empty_list(self, tmp_path):
+        """A missing snapshot directory yields no snapshots."""
+        import main
+
+        with patch.object(main, "_snapshots_dir", str(tmp_path / "missing")):
+            assert main._list_snapshot_files() == []
+
+    @pytest.mark.unit
+    def test_unchanged_directory_served_from_cache(self, snapshot_dir):
+        """A second listing of unchanged entries reuses the cached listing instead of rebuilding it."""
+        import main
+
+        (snapshot_dir / "cached.h5").write_bytes(b"x")
+
+        with patch.object(main, "_snapshots_dir", str(snapshot_dir)):
+            first = main._list_snapshot_files()
+            with patch("main.hashlib.blake2b", side_effect=AssertionError("listing rebuilt")):
+                second = main._list_snapshot_files()
+
+        assert second == first
+        assert second is not first
+
+    @pytest.mark.unit
+    def test_file_rewritten_in_place_invalidates_cache(self, snapshot_dir):
+        """Rewriting a snapshot in place leaves the directory mtime alone but still refreshes its entry."""
+        import main
+
+        snapshot = snapshot_dir / "partial.h5"
+        snapshot.write_bytes(b"x")
+        os.utime(snapshot, (1_000_000, 1_000_000))
+        dir_mtime_ns = snapshot_dir.stat().st_mtime_ns
+
+        with patch.object(main, "_snapshots_dir", str(snapshot_dir)):
+            assert main._list_snapshot_files()[0]["size_bytes"] == 1
+            snapshot.write_bytes(b"complete")
+            os.utime(snapshot, (2_000_000, 2_000_000))
+            assert snapshot_dir.stat().st_mtime_ns == dir_mtime_ns
+            refreshed = main._list_snapshot_files()[0]
+
+        assert refreshed["size_bytes"] == 8
+        assert refreshed["timestamp"] == "1970-01-24T03:33:20+00:00Z"
+
+    @pytest.mark.unit
+    def test_new_file_invalidates_cache(self, snapshot_dir):
+        """Adding a snapshot changes the listed entries and forces a rebuild."""
+        import main
+
+        (snapshot_dir / "first.h5").write_bytes(b"x")
+
+        with patch.object(main, "_snapshots_dir", str(snapshot_dir)):
+            assert [s["id"] for s in main._list_snapshot_files()] == ["first"]
+            (snapshot_dir / "second.h5").write_bytes(b"y")
+            os.utime(snapshot_dir / "second.h5", (4_000_000_000, 4_000_000_000))
+            assert [s["id"] for s in main._list_snapshot_files()] == ["second", "first"]
+
+
+class TestSnapshotListETag:
+    """Tests for conditional GET on the real snapshot listing."""
+
+    @pytest.mark.unit
+    def test_matching_if_none_match_returns_304(self, app_client, snapshot_dir):
+        """A poll with the current ETag gets 304 and no body."""
+        import main
+
+        (snapshot_dir / "etag.h5").write_bytes(b"x")
+        mock_svc = _make_service_backend(adapter=FakeIntegration())
+
+        with (
+            patch.object(main, "backend", mock_svc),
+            patch.object(main, "_snapshots_dir", str(snapshot_dir)),
+        ):
+            first = app_client.get("/api/v1/snapshots")
+            etag = first.headers["etag"]
+            second = app_client.get("/api/v1/snapshots", headers={"If-None-Match": etag})
+            other = app_client.get("/api/v1/snapshots", headers={"If-None-Match": 'W/"stale", ' + etag.removeprefix("W/")})
+
+        assert first.status_code == 200
+        assert etag.startswith('W/"')
+        assert [s["id"] for s in first.json()["snapshots"]] == ["etag"]
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+        assert other.status_code == 304
+
+    @pytest.mark.unit
+    def test_etag_changes_when_listing_changes(self, app_client, snapshot_dir):
+        """Adding a snapshot yields a new ETag and a full response."""
+        import main
+
+        (snapshot_dir / "one.h5").write_bytes(b"x")
+        mock_svc = _make_service_backend(adapter=FakeIntegration())
+
+        with (
+            patch.object(main, "backend", mock_svc),
+            patch.object(main, "_snapshots_dir", str(snapshot_dir)),
+        ):
+            etag = app_client.get("/api/v1/snapshots").headers["etag"]
+            (snapshot_dir / "two.h5").write_bytes(b"y")
+            response = app_client.get("/api/v1/snapshots", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert len(response.json()["snapshots"]) == 2
+
+    @pytest.mark.unit
+    def test_etag_matching_rules(self):
+        """Weak comparison, lists and the wildcard are honoured."""
+        import main
+
+        assert main._etag_matches('W/"abc"', 'W/"abc"')
+        assert main._etag_matches('"abc"', 'W/"abc"')
+        assert main._etag_matches('"x", W/"abc"', 'W/"abc"')
+        assert main._etag_matches("*", 'W/"abc"')
+        assert not main._etag_matches(None, 'W/"abc"')
+        assert not main._etag_matches('W/"abd"', 'W/"abc"')
+
+
+class TestSnapshotDetailAttributeCache:
+    """Tests for the stat-keyed HDF5 attribute cache behind get_snapshot_detail."""
+
+    @pytest.mark.unit
+    def test_unchanged_snapshot_not_reopened(self, app_client, snapshot_dir, create_test_hdf5):
+        """Repeated detail requests for an unchanged file reuse the cached attributes."""
+        create_test_hdf5("attr_cache.h5")
+
+        import main
+
+        mock_svc = _make_service_backend(adapter=FakeIntegration())
+        main._read_h5_attrs.cache_clear()
+
+        with (
+            patch.object(main, "backend", mock_svc),
+            patch.object(main, "_snapshots_dir", str(snapshot_dir)),
+        ):
+            first = app_client.get("/api/v1/snapshots/attr_cache").json()
+            second = app_client.get("/api/v1/snapshots/attr_cache").json()
+
+        assert first["attributes"]["description"] == "Test snapshot"
+        assert second["attributes"] == first["attributes"]
+        assert main._read_h5_attrs.cache_info().misses == 1
+        assert main._read_h5_attrs.cache_info().hits == 1
+
+    @pytest.mark.unit
+    def test_attributes_read_off_event_loop_thread(self, app_client, snapshot_dir):
+        """The blocking HDF5 read runs in a worker thread, not on the event loop."""
+        import threading
+
+        import main
+
+        (snapshot_dir / "threaded.h5").write_bytes(b"x")
+        reader_threads = []
+
+        def fake_read(*args):
+            reader_threads.append(threading.current_thread())
+            return (("mode", "manual"),)
+
+        mock_svc = _make_service_backend(adapter=FakeIntegration())
+        with (
+            patch.object(main, "backend", mock_svc),
+            patch.object(main, "_snapshots_dir", str(snapshot_dir)),
+            patch.object(main, "_read_h5_attrs", side_effect=fake_read),
+            patch.object(main.asyncio, "to_thread", wraps=main.asyncio.to_thread) as to_thread,
+        ):
+            detail = app_client.get("/api/v1/snapshots/threaded").json()
+
+        assert detail["attributes"] == {"mode": "manual"}
+        assert to_thread.call_count == 1
+        assert len(reader_threads) == 1
+
+    @pytest.mark.unit
+    def test_modified_snapshot_reread(self, app_client, snapshot_dir, create_test_hdf5):
+        """Rewriting a snapshot changes its stat key and refreshes the attributes."""
+        path = create_test_hdf5("attr_refresh.h5")
+
+        import h5py
+
+        import main
+
+        mock_svc = _make_service_backend(adapter=FakeIntegration())
+
+        with (
+            patch.object(main, "backend", mock_svc),
+            patch.object(main, "_snapshots_dir", str(snapshot_dir)),
+        ):
+            app_client.get("/api/v1/snapshots/attr_refresh")
+            with h5py.File(path, "a") as f:
+                f.attrs["description"] = "Rewritten snapshot with a longer description"
+            detail = app_client.get("/api/v1/snapshots/attr_refresh").json()
+
+        assert detail["attributes"]["description"] == "Rewritten snapshot with a longer description"
+
+
+class TestSnapshotDetailLookup:
+    """Tests for the snapshot file lookup in get_snapshot_detail."""
+
+    @pytest.mark.unit
+    def test_matches_exact_stem_with_any_case_suffix(self, app_client, snapshot_dir):
+        """Only files whose stem equals the id and whose suffix is a snapshot extension match."""
+        import main
+
+        (snapshot_dir / "run.v2.HDF5").write_bytes(b"x")
+        (snapshot_dir / "run.v2x.h5").write_bytes(b"yy")
+        (snapshot_dir / "run.v2.h5.bak").write_bytes(b"zzz")
+        (snapshot_dir / "other.h5").mkdir()
+
+        mock_svc = _make_service_backend(adapter=FakeIntegration())
+        with (
+            patch.object(main, "backend", mock_svc),
+            patch.object(main, "_snapshots_dir", str(snapshot_dir)),
+        ):
+            found = app_client.get("/api/v1/snapshots/run.v2")
+            prefix_only = app_client.get("/api/v1/snapshots/run")
+            directory = app_client.get("/api/v1/snapshots/other")
+
+        assert found.status_code == 200
+        assert found.json()["name"] == "run.v2.HDF5"
+        assert found.json()["size_bytes"] == 1
+        assert prefix_only.status_code == 404
+        assert directory.status_code == 404
+
+    @pytest.mark.unit
+    def test_canonical_name_found_without_scanning(self, snapshot_dir):
+        """A {id}.h5 / {id}.hdf5 file is found by direct probe, without listing the directory."""
+        import main
+
+        (snapshot_dir / "probe.hdf5").write_bytes(b"x")
+
+        with patch("main.os.scandir", side_effect=AssertionError("directory scanned")):
+            path, st = main._find_snapshot_file(snapshot_dir, "probe")
+        assert path == snapshot_dir / "probe.hdf5"
+        assert st.st_size == 1
+
+    @pytest.mark.unit
+    def test_snapshot_dir_that_is_a_file_returns_404(self, app_client, tmp_path):
+        """A snapshots path that is not a directory is reported as a missing directory."""
+        import main
+
+        not_a_dir = tmp_path / "snapshots"
+        not_a_dir.write_text("x")
+
+        mock_svc = _make_service_backend(adapter=FakeIntegration())
+        with (
+            patch.object(main, "backend", mock_svc),
+            patch.object(main, "_snapshots_dir", str(not_a_dir)),
+        ):
+            response = app_client.get("/api/v1/snapshots/anything")
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Snapshot directory not found"
+        assert main._stat_dir(not_a_dir) is None
+        assert main._stat_dir(not_a_dir / "child") is None
+        assert main._stat_dir(tmp_path).st_ino == os.stat(tmp_path).st_ino
+
+    @pytest.mark.unit
+    def test_missing_snapshot_returns_none(self, snapshot_dir):
+        """No matching file yields None."""
+        import main
+
+        (snapshot_dir / "probe.txt").write_bytes(b"x")
+        assert main._find_snapshot_file(snapshot_dir, "probe") is None
+
+
+class TestDemoSnapshotStore:
+    """Tests for the bounded session store of demo-mode snapshots."""
+
+    @pytest.mark.unit
+    def test_newest_first_and_oldest_evicted(self, app_client, snapshot_dir):
+        """Demo snapshots are prepended and the oldest drop out once the cap is reached."""
+        from collections import deque
+
+        import main
+
+        demo_backend = MagicMock()
+        demo_backend.backend_type = "demo"
+        store = deque(maxlen=2)
+
+        with (
+            patch.object(main, "backend", demo_backend),
+            patch.object(main, "_demo_snapshots", store),
+            patch.object(main, "_snapshots_dir", str(snapshot_dir)),
+        ):
+            for name in ("first", "second", "third"):
+                assert app_client.post(f"/api/v1/snapshots?name={name}").status_code == 201
+
+        assert [s["id"] for s in store] == ["third", "second"]
+
+
+class TestGenerateMockSnapshots:
+    """Tests for the template-based demo mock snapshots."""
+
+    @pytest.mark.unit
+    def test_mock_snapshots_fields_and_order(self):
+        """Mock snapshots keep their ids, sizes and newest-first second-resolution timestamps."""
+        import main
+
+        snapshots = main._generate_mock_snapshots()
+
+        assert [s["id"] for s in snapshots] == ["demo_snapshot_1", "demo_snapshot_2", "demo_snapshot_3"]
+        assert [s["size_bytes"] for s in snapshots] == [1048576, 2621440, 4194304]
+        assert all(s["timestamp"].endswith("+00:00Z") and "." not in s["timestamp"] for s in snapshots)
+        assert snapshots[0]["timestamp"] > snapshots[1]["timestamp"] > snapshots[2]["timestamp"]
+
+    @pytest.mark.unit
+    def test_iso_z_truncates_to_seconds(self):
+        """_iso_z matches the previous replace(microsecond=0).isoformat() + 'Z' output."""
+        import main
+
+        ts = datetime(2026, 1, 9, 10, 0, 5, 987654, tzinfo=UTC)
+        assert main._iso_z(ts) == f"{ts.replace(microsecond=0).isoformat()}Z" == "2026-01-09T10:00:05+00:00Z"
+
+    @pytest.mark.unit
+    def test_mock_snapshots_are_fresh_dicts(self):
+        """Callers may mutate the returned dicts without altering the template."""
+        import main
+
+        main._generate_mock_snapshots()[0]["attributes"] = {"mutated": True}
+        assert "attributes" not in main._generate_mock_snapshots()[0]
+
+
+class TestTailJsonl:
+    """Tests for the backward JSONL reader behind the history endpoint."""
+
+    @pytest.fixture
+    def history_file(self, tmp_path):
+        path = tmp_path / "snapshot_history.jsonl"
+        path.write_text("".join(json.dumps({"seq": i, "pad": "x" * i}) + "\n" for i in range(20)))
+        return path
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("block_size", [7, 64, 1 << 16])
+    def test_returns_last_entries_newest_first(self, history_file, block_size):
+        """Entries spanning block boundaries are reassembled in reverse order."""
+        import main
+
+        entries = main._tail_jsonl(history_file, 5, block_size=block_size)
+        assert [e["seq"] for e in entries] == [19, 18, 17, 16, 15]
+
+    @pytest.mark.unit
+    def test_none_returns_all_entries(self, history_file):
+        """Without a limit every entry is returned."""
+        import main
+
+        entries = main._tail_jsonl(history_file, None, block_size=13)
+        assert [e["seq"] for e in entries] == list(range(19, -1, -1))
+
+    @pytest.mark.unit
+    def test_stops_reading_once_limit_reached(self, history_file):
+        """Only the tail of the file is read for a small limit."""
+        import main
+
+        with patch("main.os.pread", wraps=os.pread) as pread:
+            main._tail_jsonl(history_file, 1, block_size=64)
+        assert pread.call_count == 1
+
+    @pytest.mark.unit
+    def test_skips_blank_and_invalid_lines(self, tmp_path):
+        """Malformed lines do not count toward the limit; a missing final newline is handled."""
+        import main
+
+        path = tmp_path / "snapshot_history.jsonl"
+        path.write_text('{"seq": 0}\n\n{"seq": 1}\nnot json\n\n{"seq": 2}')
+
+        entries = main._tail_jsonl(path, 2, block_size=4)
+        assert [e["seq"] for e in entries] == [2, 1]
+
+    @pytest.mark.unit
+    def test_empty_file_returns_empty_list(self, tmp_path):
+        """An empty history file yields no entries."""
+        import main
+
+        path = tmp_path / "snapshot_history.jsonl"
+        path.touch()
+        assert main._tail_jsonl(path, 10) == []
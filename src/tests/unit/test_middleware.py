@@ -1,7 +1,8 @@
 """Tests for SecurityMiddleware."""
 
 import pytest
-from fastapi import FastAPI
+from fastapi import FastAPI, WebSocket
+from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
 
 from middleware import EXEMPT_PATH_PREFIXES, EXEMPT_PATHS, SecurityMiddleware
@@ -43,6 +44,12 @@ def _make_app(api_keys=None, rate_limit_enabled=False, rate_limit_rpm=60):
     def dashboard_test():
         return {"dashboard": True}
 
+    @app.websocket("/ws/echo")
+    async def ws_echo(websocket: WebSocket):
+        await websocket.accept()
+        await websocket.send_text(await websocket.receive_text())
+        await websocket.close()
+
     return app
 
 
@@ -134,3 +141,48 @@ class TestSecurityMiddleware:
     def test_exempt_path_prefixes(self):
         """Verify the exempt path prefixes contain expected entries."""
         assert "/dashboard" in EXEMPT_PATH_PREFIXES
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("path", ["/", "/health", "/v1/health/ready", "/metrics", "/dashboard", "/dashboard/", "/dashboard/_dash-layout"])
+    def test_is_exempt_matches(self, path):
+        assert SecurityMiddleware._is_exempt(None, path)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("path", ["/api/metrics", "/healthz", "/docs/extra", "/dashboardx", "/health\n", "/api/health/../metrics"])
+    def test_is_exempt_rejects(self, path):
+        assert not SecurityMiddleware._is_exempt(None, path)
+
+    @pytest.mark.unit
+    def test_disabled_security_skips_path_check(self, monkeypatch):
+        """With auth and rate limiting both off, requests bypass the exempt-path check entirely."""
+        app = _make_app()
+        calls = []
+        monkeypatch.setattr(SecurityMiddleware, "_is_exempt", lambda self, path: calls.append(path) or False)
+        client = TestClient(app)
+        resp = client.get("/api/metrics")
+        assert resp.status_code == 200
+        assert "X-RateLimit-Limit" not in resp.headers
+        assert calls == []
+
+    @pytest.mark.unit
+    def test_websocket_bypasses_auth(self):
+        app = _make_app(api_keys=["test-key"], rate_limit_enabled=True, rate_limit_rpm=1)
+        client = TestClient(app)
+        with client.websocket_connect("/ws/echo") as ws:
+            ws.send_text("ping")
+            assert ws.receive_text() == "ping"
+
+    @pytest.mark.unit
+    def test_rate_limit_headers_on_streamed_body(self):
+        """Headers are injected into http.response.start without buffering the body."""
+        app = _make_app(rate_limit_enabled=True, rate_limit_rpm=5)
+
+        @app.get("/api/stream")
+        def stream():
+            return StreamingResponse(iter([b"a", b"b"]), media_type="text/plain")
+
+        resp = TestClient(app).get("/api/stream")
+        assert resp.text == "ab"
+        assert resp.headers["X-RateLimit-Limit"] == "5"
+        assert resp.headers["X-RateLimit-Remaining"] == "4"
+        assert resp.headers["X-RateLimit-Reset"].isdigit()
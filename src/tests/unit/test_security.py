@@ -149,6 +149,37 @@ class TestRateLimiter:
         allowed, _, _ = limiter.check("key1")
         assert allowed is True
 
+    def test_expired_windows_are_pruned(self, monkeypatch):
+        limiter = RateLimiter(requests_per_minute=1, window_seconds=10, enabled=True)
+        monkeypatch.setattr(time, "time", lambda: 1000.0)
+        limiter.check("key1")
+        limiter.check("key2")
+        monkeypatch.setattr(time, "time", lambda: 1005.0)
+        limiter.check("key3")
+        monkeypatch.setattr(time, "time", lambda: 1011.0)
+        limiter.check("key4")
+        assert list(limiter._counters) == ["key3", "key4"]
+
+    def test_tracked_keys_are_capped(self, monkeypatch):
+        monkeypatch.setattr(RateLimiter, "MAX_KEYS", 3)
+        limiter = RateLimiter(requests_per_minute=1, enabled=True)
+        for i in range(5):
+            limiter.check(f"key{i}")
+        assert list(limiter._counters) == ["key2", "key3", "key4"]
+        allowed, _, _ = limiter.check("key4")
+        assert allowed is False
+
+    def test_renewed_window_moves_key_to_end(self, monkeypatch):
+        limiter = RateLimiter(requests_per_minute=1, window_seconds=10, enabled=True)
+        monkeypatch.setattr(time, "time", lambda: 1000.0)
+        limiter.check("key1")
+        monkeypatch.setattr(time, "time", lambda: 1005.0)
+        limiter.check("key2")
+        monkeypatch.setattr(time, "time", lambda: 1010.0)
+        allowed, _, _ = limiter.check("key1")
+        assert allowed is True
+        assert list(limiter._counters) == ["key2", "key1"]
+
     @pytest.mark.asyncio
     @pytest.mark.unit
     async def test_call_raises_429_when_exceeded(self):
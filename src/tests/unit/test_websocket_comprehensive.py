@@ -11,6 +11,7 @@ Tests focus on:
 6. Environment variable configuration
 """
 import asyncio
+import json
 import os
 import sys
 import time
@@ -210,8 +211,10 @@ class TestBroadcastEdgeCases:
         ws.close = AsyncMock()
         if fail:
             ws.send_json = AsyncMock(side_effect=Exception("Connection broken"))
+            ws.send_text = AsyncMock(side_effect=Exception("Connection broken"))
         else:
             ws.send_json = AsyncMock()
+            ws.send_text = AsyncMock()
         return ws
 
     @pytest.mark.asyncio
@@ -221,12 +224,12 @@ class TestBroadcastEdgeCases:
 
         for ws in clients:
             await manager.connect(ws)
-            ws.send_json.reset_mock()
 
         await manager.broadcast({"type": "test"})
+        await manager.flush()
 
         for ws in clients:
-            assert ws.send_json.called
+            assert ws.send_text.called
 
     @pytest.mark.asyncio
     async def test_broadcast_updates_all_metadata(self, manager):
@@ -241,6 +244,7 @@ class TestBroadcastEdgeCases:
         initial_count2 = manager.connection_metadata[ws2]["messages_sent"]
 
         await manager.broadcast({"type": "update"})
+        await manager.flush()
 
         assert manager.connection_metadata[ws1]["messages_sent"] == initial_count1 + 1
         assert manager.connection_metadata[ws2]["messages_sent"] == initial_count2 + 1
@@ -253,11 +257,11 @@ class TestBroadcastEdgeCases:
 
         await manager.connect(good_ws, client_id="good")
         await manager.connect(bad_ws, client_id="bad")
-        good_ws.send_json.reset_mock()
 
         await manager.broadcast({"type": "test"})
+        await manager.flush()
 
-        assert good_ws.send_json.called
+        assert good_ws.send_text.called
         assert good_ws in manager.active_connections
         assert bad_ws not in manager.active_connections
 
@@ -280,26 +284,26 @@ class TestBroadcastEdgeCases:
 
         for ws in clients:
             await manager.connect(ws)
-            ws.send_json.reset_mock()
 
         await manager.broadcast({"type": "test"}, exclude={clients[1], clients[3]})
+        await manager.flush()
 
-        assert clients[0].send_json.called
-        assert not clients[1].send_json.called
-        assert clients[2].send_json.called
-        assert not clients[3].send_json.called
+        assert clients[0].send_text.called
+        assert not clients[1].send_text.called
+        assert clients[2].send_text.called
+        assert not clients[3].send_text.called
 
     @pytest.mark.asyncio
     async def test_broadcast_preserves_existing_timestamp(self, manager):
         """Test broadcast preserves existing timestamp in message."""
         ws = self._create_mock_websocket()
         await manager.connect(ws)
-        ws.send_json.reset_mock()
 
         original_ts = "2025-01-01T00:00:00"
         await manager.broadcast({"type": "test", "timestamp": original_ts})
+        await manager.flush()
 
-        call_args = ws.send_json.call_args[0][0]
+        call_args = json.loads(ws.send_text.call_args[0][0])
         assert call_args["timestamp"] == original_ts
 
 
@@ -385,8 +389,10 @@ class TestHeartbeatFunctionality:
         ws.close = AsyncMock()
         if fail:
             ws.send_json = AsyncMock(side_effect=Exception("Failed"))
+            ws.send_text = AsyncMock(side_effect=Exception("Failed"))
         else:
             ws.send_json = AsyncMock()
+            ws.send_text = AsyncMock()
         return ws
 
     @pytest.mark.asyncio
@@ -396,13 +402,13 @@ class TestHeartbeatFunctionality:
 
         for ws in clients:
             await manager.connect(ws)
-            ws.send_json.reset_mock()
 
         await manager.broadcast_ping()
+        await manager.flush()
 
         for ws in clients:
-            assert ws.send_json.called
-            call_args = ws.send_json.call_args[0][0]
+            assert ws.send_text.called
+            call_args = json.loads(ws.send_text.call_args[0][0])
             assert call_args["type"] == "ping"
 
     @pytest.mark.asyncio
@@ -487,9 +493,11 @@ class TestErrorHandling:
         loop.is_running.return_value = True
         manager.event_loop = loop
 
-        with patch("asyncio.run_coroutine_threadsafe", side_effect=Exception("Loop error")):
+        with patch.object(manager, "enqueue_broadcast", side_effect=Exception("Loop error")), patch.object(manager.logger, "error") as mock_error:
             manager.broadcast_sync({"type": "test"})
 
+        mock_error.assert_called_once()
+
     def test_broadcast_from_thread_closed_loop(self, manager):
         """Test broadcast_from_thread with closed event loop."""
         loop = MagicMock()
@@ -507,9 +515,11 @@ class TestErrorHandling:
 
         manager.active_connections.add(MagicMock())
 
-        with patch("asyncio.run_coroutine_threadsafe", side_effect=RuntimeError("Thread error")):
+        with patch.object(manager, "enqueue_broadcast", side_effect=RuntimeError("Thread error")), patch.object(manager.logger, "warning") as mock_warning:
             manager.broadcast_from_thread({"type": "test"})
 
+        mock_warning.assert_called_once()
+
 
 class TestBroadcastStateChange:
     """Tests for broadcast_state_change method."""
@@ -527,27 +537,13 @@ class TestBroadcastStateChange:
         ws = MagicMock()
         manager.active_connections.add(ws)
 
-        captured_message = None
-
-        def capture_broadcast(coro, loop):
-            nonlocal captured_message
-            import asyncio
-
-            async def extract():
-                await coro
-
-            future = MagicMock()
-            return future
-
-        with patch("asyncio.run_coroutine_threadsafe") as mock_rct:
-
-            def capture_coro(coro, loop):
-                return MagicMock()
-
-            mock_rct.side_effect = capture_coro
+        with patch.object(manager, "enqueue_broadcast", return_value=True) as mock_enqueue:
             manager.broadcast_state_change({"status": "Started", "phase": "Output"})
 
-            assert mock_rct.called
+        message = mock_enqueue.call_args[0][0]
+        assert message["type"] == "state"
+        assert isinstance(message["timestamp"], float)
+        assert message["data"] == {"status": "Started", "phase": "Output"}
 
     def test_broadcast_state_change_no_connections(self, manager):
         """Test broadcast_state_change with no connections."""
@@ -712,6 +708,7 @@ class TestBroadcastDisconnectsFailedClients:
         good_ws = MagicMock()
         good_ws.accept = AsyncMock()
         good_ws.send_json = AsyncMock()
+        good_ws.send_text = AsyncMock()
         good_ws.close = AsyncMock()
 
         bad_ws = MagicMock()
@@ -727,10 +724,11 @@ class TestBroadcastDisconnectsFailedClients:
         assert manager.get_connection_count() == 2
 
         # Now make bad_ws fail during broadcast
-        bad_ws.send_json = AsyncMock(side_effect=Exception("Connection lost"))
+        bad_ws.send_text = AsyncMock(side_effect=Exception("Connection lost"))
 
         # Broadcast should handle the failing client
         await manager.broadcast({"type": "test"})
+        await manager.flush()
 
         # Good client should still be connected, bad client disconnected
         assert good_ws in manager.active_connections
@@ -743,6 +741,7 @@ class TestBroadcastDisconnectsFailedClients:
         good_ws = MagicMock()
         good_ws.accept = AsyncMock()
         good_ws.send_json = AsyncMock()
+        good_ws.send_text = AsyncMock()
         good_ws.close = AsyncMock()
 
         bad_ws1 = MagicMock()
@@ -762,10 +761,11 @@ class TestBroadcastDisconnectsFailedClients:
         assert manager.get_connection_count() == 3
 
         # Now make bad clients fail during broadcast
-        bad_ws1.send_json = AsyncMock(side_effect=RuntimeError("Broken pipe"))
-        bad_ws2.send_json = AsyncMock(side_effect=ConnectionError("Reset"))
+        bad_ws1.send_text = AsyncMock(side_effect=RuntimeError("Broken pipe"))
+        bad_ws2.send_text = AsyncMock(side_effect=ConnectionError("Reset"))
 
         await manager.broadcast({"type": "test"})
+        await manager.flush()
 
         # Only good client remains
         assert good_ws in manager.active_connections
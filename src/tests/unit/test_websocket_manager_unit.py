@@ -14,11 +14,13 @@ Tests all WebSocketManager methods:
 - ping functionality
 """
 import asyncio
+import json
 import sys
 import threading
 import time
+from collections import deque
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -30,6 +32,11 @@ if str(src_path) not in sys.path:
 from communication.websocket_manager import WebSocketManager  # noqa: E402
 
 
+async def _start_drain(manager):
+    """Start the manager's broadcast drain on the running loop."""
+    manager.start_broadcast_drain()
+
+
 class TestWebSocketManagerUnit:
     """Unit tests for WebSocketManager."""
 
@@ -209,33 +216,64 @@ class TestWebSocketManagerUnit:
         ws1 = MagicMock()
         ws1.accept = AsyncMock()
         ws1.send_json = AsyncMock()
+        ws1.send_text = AsyncMock()
         ws1.close = AsyncMock()
         ws2 = MagicMock()
         ws2.accept = AsyncMock()
         ws2.send_json = AsyncMock()
+        ws2.send_text = AsyncMock()
         ws2.close = AsyncMock()
 
         await manager.connect(ws1)
         await manager.connect(ws2)
-        ws1.send_json.reset_mock()
-        ws2.send_json.reset_mock()
-
         message = {"type": "broadcast", "data": "test"}
         await manager.broadcast(message)
+        await manager.flush()
 
-        assert ws1.send_json.called
-        assert ws2.send_json.called
+        ws1.send_text.assert_awaited_once()
+        assert ws1.send_text.call_args == ws2.send_text.call_args
+        assert json.loads(ws1.send_text.call_args[0][0])["data"] == "test"
+
+    @pytest.mark.asyncio
+    async def test_broadcast_serializes_once(self, manager, monkeypatch):
+        """The message is encoded once and the same text frame is queued for every client."""
+        import communication.websocket_manager as ws_module
+
+        encode = MagicMock(side_effect=ws_module.json_dumps)
+        monkeypatch.setattr(ws_module, "json_dumps", encode)
+        clients = [MagicMock(accept=AsyncMock(), send_json=AsyncMock(), send_text=AsyncMock()) for _ in range(3)]
+        for ws in clients:
+            await manager.connect(ws)
+
+        await manager.broadcast({"type": "test"})
+        await manager.flush()
+
+        encode.assert_called_once()
+        frames = [ws.send_text.call_args[0][0] for ws in clients]
+        assert all(frame is frames[0] for frame in frames)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_unserializable_message_is_dropped(self, manager, mock_websocket):
+        """A message that cannot be encoded is logged and not queued."""
+        await manager.connect(mock_websocket)
+
+        await manager.broadcast({"type": "test", "data": object()})
+        await manager.flush()
+
+        assert manager.message_count == 0
+        assert not mock_websocket.send_text.called
+        assert mock_websocket in manager.active_connections
 
     @pytest.mark.asyncio
     async def test_broadcast_adds_timestamp(self, manager, mock_websocket):
         """Test broadcast adds timestamp to message."""
         await manager.connect(mock_websocket)
-        mock_websocket.send_json.reset_mock()
 
         message = {"type": "test"}
         await manager.broadcast(message)
+        await manager.flush()
 
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = json.loads(mock_websocket.send_text.call_args[0][0])
         assert "timestamp" in call_args
 
     @pytest.mark.asyncio
@@ -254,22 +292,22 @@ class TestWebSocketManagerUnit:
         ws1 = MagicMock()
         ws1.accept = AsyncMock()
         ws1.send_json = AsyncMock()
+        ws1.send_text = AsyncMock()
         ws1.close = AsyncMock()
         ws2 = MagicMock()
         ws2.accept = AsyncMock()
         ws2.send_json = AsyncMock()
+        ws2.send_text = AsyncMock()
         ws2.close = AsyncMock()
 
         await manager.connect(ws1)
         await manager.connect(ws2)
-        ws1.send_json.reset_mock()
-        ws2.send_json.reset_mock()
-
         # Broadcast excluding ws2
         await manager.broadcast({"type": "test"}, exclude={ws2})
+        await manager.flush()
 
-        assert ws1.send_json.called
-        assert not ws2.send_json.called
+        assert ws1.send_text.called
+        assert not ws2.send_text.called
 
     @pytest.mark.asyncio
     async def test_broadcast_handles_disconnected_clients(self, manager):
@@ -277,22 +315,108 @@ class TestWebSocketManagerUnit:
         ws1 = MagicMock()
         ws1.accept = AsyncMock()
         ws1.send_json = AsyncMock()
+        ws1.send_text = AsyncMock()
         ws1.close = AsyncMock()
         ws2 = MagicMock()
         ws2.accept = AsyncMock()
-        ws2.send_json = AsyncMock(side_effect=Exception("Connection broken"))
+        ws2.send_json = AsyncMock()
+        ws2.send_text = AsyncMock(side_effect=Exception("Connection broken"))
         ws2.close = AsyncMock()
 
         await manager.connect(ws1)
         await manager.connect(ws2)
-        ws1.send_json.reset_mock()
 
         await manager.broadcast({"type": "test"})
+        await manager.flush()
 
         # ws1 should receive, ws2 should be disconnected
-        assert ws1.send_json.called
+        assert ws1.send_text.called
         assert ws2 not in manager.active_connections
 
+    @pytest.mark.asyncio
+    async def test_broadcast_sends_concurrently(self, manager):
+        """A slow client does not delay delivery to the others; broadcast() does not wait for either."""
+        release = asyncio.Event()
+        delivered = []
+
+        async def slow_send(message):
+            await release.wait()
+            delivered.append("slow")
+
+        slow = MagicMock(accept=AsyncMock(), send_json=AsyncMock(), send_text=AsyncMock())
+        fast = MagicMock(accept=AsyncMock(), send_json=AsyncMock(), send_text=AsyncMock())
+        await manager.connect(slow)
+        await manager.connect(fast)
+        slow.send_text = AsyncMock(side_effect=slow_send)
+        fast.send_text = AsyncMock(side_effect=lambda message: delivered.append("fast"))
+
+        await manager.broadcast({"type": "test"})
+        await asyncio.sleep(0.01)
+        assert delivered == ["fast"]
+        release.set()
+        await manager.flush()
+        assert delivered == ["fast", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_broadcast_drops_stalled_client_after_timeout(self, manager, monkeypatch):
+        """A send exceeding SEND_TIMEOUT disconnects that client only."""
+        monkeypatch.setattr(WebSocketManager, "SEND_TIMEOUT", 0.01)
+        stalled = MagicMock(accept=AsyncMock(), send_json=AsyncMock(), send_text=AsyncMock())
+        healthy = MagicMock(accept=AsyncMock(), send_json=AsyncMock(), send_text=AsyncMock())
+        await manager.connect(stalled)
+        await manager.connect(healthy)
+
+        async def never_completes(message):
+            await asyncio.sleep(1)
+
+        stalled.send_text = AsyncMock(side_effect=never_completes)
+
+        await manager.broadcast({"type": "test"})
+        await manager.flush()
+
+        assert stalled not in manager.active_connections
+        assert healthy in manager.active_connections
+        assert manager.connection_metadata[healthy]["messages_sent"] == 2
+
+    @pytest.mark.asyncio
+    async def test_broadcast_drops_client_with_full_queue(self, manager, monkeypatch):
+        """A client that falls SEND_QUEUE_SIZE messages behind is disconnected."""
+        monkeypatch.setattr(WebSocketManager, "SEND_QUEUE_SIZE", 2)
+        release = asyncio.Event()
+        slow = MagicMock(accept=AsyncMock(), send_json=AsyncMock(), send_text=AsyncMock())
+        healthy = MagicMock(accept=AsyncMock(), send_json=AsyncMock(), send_text=AsyncMock())
+        await manager.connect(slow)
+        await manager.connect(healthy)
+
+        async def blocked_send(message):
+            await release.wait()
+
+        slow.send_text = AsyncMock(side_effect=blocked_send)
+
+        for i in range(4):
+            await manager.broadcast({"type": "test", "seq": i})
+            await asyncio.sleep(0.01)
+        await manager.flush()
+
+        assert slow not in manager.active_connections
+        assert slow not in manager.outbound_queues
+        assert healthy in manager.active_connections
+        assert healthy.send_text.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_connect_starts_single_writer(self, manager, mock_websocket):
+        """Each connection gets one writer task, stopped again on disconnect."""
+        await manager.connect(mock_websocket, client_id="first")
+        task = manager.writer_tasks[mock_websocket]
+        await manager.connect(mock_websocket, client_id="second")
+        assert manager.writer_tasks[mock_websocket] is task
+
+        manager.disconnect(mock_websocket)
+        await asyncio.sleep(0)
+
+        assert task.cancelled()
+        assert mock_websocket not in manager.writer_tasks
+
     @pytest.mark.asyncio
     async def test_broadcast_no_connections(self, manager):
         """Test broadcast with no active connections."""
@@ -317,8 +441,9 @@ class TestWebSocketManagerUnit:
         time.sleep(0.1)  # Let loop start
 
         try:
-            # Add connection in the loop
+            # Add connection and start the broadcast drain in the loop
             asyncio.run_coroutine_threadsafe(manager.connect(mock_websocket), loop).result(timeout=1)
+            asyncio.run_coroutine_threadsafe(_start_drain(manager), loop).result(timeout=1)
             mock_websocket.send_json.reset_mock()
 
             # Call broadcast_sync from main thread
@@ -331,6 +456,7 @@ class TestWebSocketManagerUnit:
             assert mock_websocket.send_json.called or manager.message_count > 0
 
         finally:
+            asyncio.run_coroutine_threadsafe(manager.stop_broadcast_drain(), loop).result(timeout=1)
             loop.call_soon_threadsafe(loop.stop)
             thread.join(timeout=1)
             loop.close()
@@ -361,8 +487,9 @@ class TestWebSocketManagerUnit:
         time.sleep(0.1)
 
         try:
-            # Add connection
+            # Add connection and start the broadcast drain
             asyncio.run_coroutine_threadsafe(manager.connect(mock_websocket), loop).result(timeout=1)
+            asyncio.run_coroutine_threadsafe(_start_drain(manager), loop).result(timeout=1)
             mock_websocket.send_json.reset_mock()
 
             # Call from different thread
@@ -380,6 +507,7 @@ class TestWebSocketManagerUnit:
             assert mock_websocket.send_json.called or manager.message_count > 0
 
         finally:
+            asyncio.run_coroutine_threadsafe(manager.stop_broadcast_drain(), loop).result(timeout=1)
             loop.call_soon_threadsafe(loop.stop)
             thread.join(timeout=1)
             loop.close()
@@ -400,6 +528,87 @@ class TestWebSocketManagerUnit:
         manager.broadcast_from_thread({"type": "test"})
         # No error should be raised
 
+    # ========== Broadcast Queue Tests ==========
+
+    def test_enqueue_broadcast_without_drain_returns_false(self, manager):
+        """Messages are not queued before start_broadcast_drain()."""
+        assert manager.enqueue_broadcast({"type": "test"}) is False
+        assert not manager.broadcast_queue
+
+    async def test_enqueue_broadcast_queues_and_wakes_idle_drain(self, manager):
+        """Messages are queued; the drain is only woken while its wake event is unset."""
+        manager.set_event_loop(asyncio.get_running_loop())
+        manager.start_broadcast_drain()
+        real_loop, manager.event_loop = manager.event_loop, MagicMock()
+        try:
+            wake = manager._broadcast_wake
+            assert manager.enqueue_broadcast({"n": 1}) is True
+            manager.event_loop.call_soon_threadsafe.assert_called_once_with(wake.set)
+
+            wake.set()
+            assert manager.enqueue_broadcast({"n": 2}) is True
+            manager.event_loop.call_soon_threadsafe.assert_called_once()
+
+            assert list(manager.broadcast_queue) == [{"n": 1}, {"n": 2}]
+        finally:
+            manager.event_loop = real_loop
+            with patch.object(manager, "broadcast", new_callable=AsyncMock):
+                await manager.stop_broadcast_drain()
+
+    async def test_drain_broadcasts_in_order(self, manager):
+        """The drain task broadcasts every queued message in FIFO order."""
+        sent = []
+        manager.set_event_loop(asyncio.get_running_loop())
+        with patch.object(manager, "broadcast", new_callable=AsyncMock, side_effect=sent.append):
+            manager.start_broadcast_drain()
+            try:
+                for n in range(3):
+                    manager.enqueue_broadcast({"n": n})
+                for _ in range(10):
+                    await asyncio.sleep(0)
+            finally:
+                await manager.stop_broadcast_drain()
+
+        assert sent == [{"n": 0}, {"n": 1}, {"n": 2}]
+        assert not manager.broadcast_queue
+
+    async def test_drain_logs_dropped_messages(self, manager):
+        """Messages evicted by a full queue are counted and logged by the drain task."""
+        manager.set_event_loop(asyncio.get_running_loop())
+        with patch.object(manager, "broadcast", new_callable=AsyncMock), patch.object(manager, "BROADCAST_QUEUE_MAXLEN", 2):
+            manager.broadcast_queue = deque(maxlen=2)
+            manager.start_broadcast_drain()
+            try:
+                with patch.object(manager.logger, "warning") as mock_warning:
+                    for n in range(5):
+                        manager.enqueue_broadcast({"n": n})
+                    for _ in range(10):
+                        await asyncio.sleep(0)
+
+                mock_warning.assert_called_once()
+                assert "dropped 3" in mock_warning.call_args[0][0]
+            finally:
+                await manager.stop_broadcast_drain()
+
+        assert manager.broadcasts_dropped == 3
+        assert manager.get_statistics()["broadcasts_dropped"] == 3
+
+    async def test_broadcast_from_thread_uses_queue(self, manager, mock_websocket):
+        """broadcast_from_thread queues the message instead of scheduling a coroutine per call."""
+        manager.set_event_loop(asyncio.get_running_loop())
+        manager.active_connections.add(mock_websocket)
+        manager.start_broadcast_drain()
+        try:
+            with patch("asyncio.run_coroutine_threadsafe") as mock_schedule, patch.object(manager, "broadcast", new_callable=AsyncMock):
+                manager.broadcast_from_thread({"type": "test"})
+                manager.broadcast_sync({"type": "sync"})
+
+            mock_schedule.assert_not_called()
+            assert list(manager.broadcast_queue) == [{"type": "test"}, {"type": "sync"}]
+        finally:
+            manager.active_connections.discard(mock_websocket)
+            await manager.stop_broadcast_drain()
+
     # ========== Statistics Tests ==========
 
     def test_get_connection_count(self, manager, mock_websocket):
@@ -479,12 +688,11 @@ class TestWebSocketManagerUnit:
     async def test_broadcast_ping(self, manager, mock_websocket):
         """Test broadcast_ping sends ping to all."""
         await manager.connect(mock_websocket)
-        mock_websocket.send_json.reset_mock()
 
         await manager.broadcast_ping()
+        await manager.flush()
 
-        assert mock_websocket.send_json.called
-        call_args = mock_websocket.send_json.call_args[0][0]
+        call_args = json.loads(mock_websocket.send_text.call_args[0][0])
         assert call_args["type"] == "ping"
 
     # ========== Shutdown Tests ==========
@@ -495,10 +703,12 @@ class TestWebSocketManagerUnit:
         ws1 = MagicMock()
         ws1.accept = AsyncMock()
         ws1.send_json = AsyncMock()
+        ws1.send_text = AsyncMock()
         ws1.close = AsyncMock()
         ws2 = MagicMock()
         ws2.accept = AsyncMock()
         ws2.send_json = AsyncMock()
+        ws2.send_text = AsyncMock()
         ws2.close = AsyncMock()
 
         await manager.connect(ws1)
@@ -514,15 +724,14 @@ class TestWebSocketManagerUnit:
     async def test_shutdown_sends_notice(self, manager, mock_websocket):
         """Test shutdown sends shutdown notice."""
         await manager.connect(mock_websocket)
-        mock_websocket.send_json.reset_mock()
 
         await manager.shutdown()
 
         # Should have sent shutdown notice
-        assert mock_websocket.send_json.called
+        assert mock_websocket.send_text.called
         # Find the shutdown message
-        for call in mock_websocket.send_json.call_args_list:
-            msg = call[0][0]
+        for call in mock_websocket.send_text.call_args_list:
+            msg = json.loads(call[0][0])
             if msg.get("type") == "server_shutdown":
                 assert "message" in msg
                 break
@@ -548,7 +757,6 @@ class TestWebSocketManagerUnit:
     async def test_concurrent_broadcasts(self, manager, mock_websocket):
         """Test concurrent broadcast calls."""
         await manager.connect(mock_websocket)
-        mock_websocket.send_json.reset_mock()
 
         # Run multiple broadcasts concurrently
         await asyncio.gather(
@@ -556,6 +764,7 @@ class TestWebSocketManagerUnit:
             manager.broadcast({"type": "msg2"}),
             manager.broadcast({"type": "msg3"}),
         )
+        await manager.flush()
 
         # All broadcasts should succeed
-        assert mock_websocket.send_json.call_count >= 3
+        assert mock_websocket.send_text.call_count == 3
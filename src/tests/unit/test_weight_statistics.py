@@ -27,8 +27,7 @@ class TestWeightStatisticsBasics:
 
     def test_normal_weights(self):
         """Test statistics computation with normal distribution of weights."""
-        np.random.seed(42)
-        weights = np.random.randn(100)
+        weights = np.random.default_rng(42).standard_normal(100)
 
         stats = compute_weight_statistics(weights)
 
@@ -147,8 +146,7 @@ class TestAdvancedStatistics:
 
     def test_skewness_computation(self):
         """Test skewness computation."""
-        np.random.seed(42)
-        weights = np.random.randn(100)
+        weights = np.random.default_rng(42).standard_normal(100)
 
         stats = compute_weight_statistics(weights)
 
@@ -157,8 +155,7 @@ class TestAdvancedStatistics:
 
     def test_kurtosis_computation(self):
         """Test kurtosis computation."""
-        np.random.seed(42)
-        weights = np.random.randn(100)
+        weights = np.random.default_rng(42).standard_normal(100)
 
         stats = compute_weight_statistics(weights)
 
@@ -186,8 +183,7 @@ class TestAdvancedStatistics:
 
     def test_z_score_distribution(self):
         """Test z-score distribution computation."""
-        np.random.seed(42)
-        weights = np.random.randn(1000)
+        weights = np.random.default_rng(42).standard_normal(1000)
 
         stats = compute_weight_statistics(weights)
 